@@ -29,30 +29,32 @@ class WebSocketTester:
         self.received_symbols = set()
         self.test_duration = 30  # seconds
         
-    async def trade_callback(self, trade_data):
-        """Callback for trade updates."""
-        self.trade_count += 1
-        self.received_symbols.add(trade_data['symbol'])
-        
-        if self.trade_count <= 5:  # Log first 5 trades
-            logger.info(
-                f"  Trade #{self.trade_count}: {trade_data['symbol']} @ "
-                f"${trade_data['price']:.2f} x {trade_data['size']} "
-                f"at {trade_data['timestamp']}"
-            )
+    async def trade_callback(self, trades):
+        """Callback for batches of trade updates."""
+        for trade_data in trades:
+            self.trade_count += 1
+            self.received_symbols.add(trade_data.symbol)
+            
+            if self.trade_count <= 5:  # Log first 5 trades
+                logger.info(
+                    f"  Trade #{self.trade_count}: {trade_data.symbol} @ "
+                    f"${trade_data.price:.2f} x {trade_data.size} "
+                    f"at {trade_data.timestamp}"
+                )
     
-    async def quote_callback(self, quote_data):
-        """Callback for quote updates."""
-        self.quote_count += 1
-        self.received_symbols.add(quote_data['symbol'])
-        
-        if self.quote_count <= 5:  # Log first 5 quotes
-            logger.info(
-                f"  Quote #{self.quote_count}: {quote_data['symbol']} "
-                f"bid=${quote_data['bid_price']:.2f} x {quote_data['bid_size']} "
-                f"ask=${quote_data['ask_price']:.2f} x {quote_data['ask_size']} "
-                f"at {quote_data['timestamp']}"
-            )
+    async def quote_callback(self, quotes):
+        """Callback for batches of quote updates."""
+        for quote_data in quotes:
+            self.quote_count += 1
+            self.received_symbols.add(quote_data.symbol)
+            
+            if self.quote_count <= 5:  # Log first 5 quotes
+                logger.info(
+                    f"  Quote #{self.quote_count}: {quote_data.symbol} "
+                    f"bid=${quote_data.bid_price:.2f} x {quote_data.bid_size} "
+                    f"ask=${quote_data.ask_price:.2f} x {quote_data.ask_size} "
+                    f"at {quote_data.timestamp}"
+                )
 
 
 async def test_websocket_connection():
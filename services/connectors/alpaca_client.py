@@ -2,12 +2,17 @@
 from __future__ import annotations
 
 import os
+import socket
 import time
 import asyncio
 from datetime import datetime
 from typing import Dict, List, Optional, Callable, Any
 from loguru import logger
+import numpy as np
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
 
 from alpaca.trading.client import TradingClient
 from alpaca.data.historical import StockHistoricalDataClient, CryptoHistoricalDataClient
@@ -94,9 +99,24 @@ class RetryStrategy:
             raise last_exception
 
 
+class KeepAliveHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that enables TCP keepalive on pooled connections."""
+
+    SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    ]
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        """Initialize the pool manager with keepalive socket options."""
+        kwargs.setdefault("socket_options", self.SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
+
 class AlpacaClient:
     """Alpaca API client wrapper for PulseTrader integration."""
 
+    DEFAULT_HTTP_POOL_SIZE = 64
+
     def __init__(self, config: Dict) -> None:
         """
         Initialize AlpacaClient with authentication and API clients.
@@ -127,6 +147,9 @@ class AlpacaClient:
         # Initialize retry strategy
         self.retry_strategy = RetryStrategy(max_attempts=3, base_delay=1.0)
         
+        # One pooled keep-alive session shared by the trading and data clients
+        self.http_session = self._build_http_session()
+        
         # Initialize TradingClient
         try:
             self.trading_client = TradingClient(
@@ -138,13 +161,20 @@ class AlpacaClient:
         except Exception as e:
             logger.error(f"Failed to initialize TradingClient: {e}")
             raise
-        
+
+        # Keep REST connections alive across bursts of order/position calls
+        self._attach_http_session(self.trading_client)
+
+        # Pay request-model validation setup cost now rather than on the first order
+        self.warmup()
+
         # Initialize StockHistoricalDataClient
         try:
             self.stock_data_client = StockHistoricalDataClient(
                 api_key=self.api_key,
                 secret_key=self.api_secret
             )
+            self._attach_http_session(self.stock_data_client)
             logger.info("StockHistoricalDataClient initialized")
         except Exception as e:
             logger.error(f"Failed to initialize StockHistoricalDataClient: {e}")
@@ -156,11 +186,88 @@ class AlpacaClient:
                 api_key=self.api_key,
                 secret_key=self.api_secret
             )
+            self._attach_http_session(self.crypto_data_client)
             logger.info("CryptoHistoricalDataClient initialized")
         except Exception as e:
             logger.error(f"Failed to initialize CryptoHistoricalDataClient: {e}")
             raise
 
+    def _build_http_session(self) -> requests.Session:
+        """
+        Build the keep-alive HTTP session shared by all Alpaca REST clients.
+
+        The alpaca-py REST clients each create their own requests.Session
+        whose default adapter only pools 10 connections, so bursts of
+        concurrent calls tear down and re-handshake TLS connections. One
+        session with a larger pool (urllib3 pools are LIFO, so the most
+        recently used warm connection is reused first) serves every host.
+        The adapter does no retries of its own; retrying stays with the SDK
+        and RetryStrategy so requests are not retried at two layers.
+
+        Returns:
+            Configured requests.Session
+        """
+        pool_size = self.config.get("execution", {}).get("http_pool_size", self.DEFAULT_HTTP_POOL_SIZE)
+        adapter = KeepAliveHTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        logger.debug(f"HTTP session built: pool_size={pool_size}, keepalive enabled")
+        return session
+
+    def _attach_http_session(self, sdk_client: Any) -> None:
+        """
+        Point an SDK client at the shared HTTP session.
+
+        Args:
+            sdk_client: alpaca-py REST client exposing a ``_session`` attribute
+        """
+        previous = getattr(sdk_client, "_session", None)
+        if previous is None:
+            logger.debug("SDK client exposes no HTTP session; skipping session sharing")
+            return
+        sdk_client._session = self.http_session
+        if previous is not self.http_session and hasattr(previous, "close"):
+            previous.close()
+
+    @classmethod
+    def warmup(cls) -> None:
+        """
+        Construct one throwaway instance of each order request model.
+
+        Pydantic finishes building per-model validators lazily on first
+        instantiation, so doing it here keeps that cost off the first
+        submit_order call. Failures are logged and ignored since warmup is
+        purely an optimization.
+        """
+        try:
+            MarketOrderRequest(
+                symbol="WARMUP",
+                qty=1,
+                side=OrderSide.BUY,
+                time_in_force=TimeInForce.DAY
+            )
+            LimitOrderRequest(
+                symbol="WARMUP",
+                qty=1,
+                side=OrderSide.BUY,
+                time_in_force=TimeInForce.DAY,
+                limit_price=1.0
+            )
+            StopOrderRequest(
+                symbol="WARMUP",
+                qty=1,
+                side=OrderSide.SELL,
+                time_in_force=TimeInForce.DAY,
+                stop_price=1.0
+            )
+            GetOrdersRequest(status=QueryOrderStatus.OPEN, limit=1)
+            logger.debug("Order request models warmed up")
+        except Exception as e:
+            logger.warning(f"Order request model warmup failed: {e}")
+
     def get_account(self) -> Dict:
         """
         Retrieve account information including equity, cash, and buying power.
@@ -169,6 +276,7 @@ class AlpacaClient:
             Dictionary containing account data with keys:
                 - account_id: Account identifier
                 - equity: Total account equity
+                - last_equity: Equity at the previous market close
                 - cash: Available cash
                 - buying_power: Available buying power
                 - portfolio_value: Total portfolio value
@@ -187,6 +295,7 @@ class AlpacaClient:
             account_data = {
                 "account_id": str(account.id),
                 "equity": float(account.equity),
+                "last_equity": float(account.last_equity),
                 "cash": float(account.cash),
                 "buying_power": float(account.buying_power),
                 "portfolio_value": float(account.portfolio_value),
@@ -436,32 +545,7 @@ class AlpacaClient:
             APIError: If API request fails
         """
         try:
-            # Parse timeframe
-            tf = self._parse_timeframe(timeframe)
-            
-            # Determine if crypto or stock based on symbol format
-            is_crypto = "/" in symbol
-            
-            if is_crypto:
-                # Use crypto data client
-                request = CryptoBarsRequest(
-                    symbol_or_symbols=symbol,
-                    timeframe=tf,
-                    limit=limit,
-                    start=start,
-                    end=end
-                )
-                bars = self.crypto_data_client.get_crypto_bars(request)
-            else:
-                # Use stock data client
-                request = StockBarsRequest(
-                    symbol_or_symbols=symbol,
-                    timeframe=tf,
-                    limit=limit,
-                    start=start,
-                    end=end
-                )
-                bars = self.stock_data_client.get_stock_bars(request)
+            bars = self._fetch_bars(symbol, timeframe, limit, start, end)
             
             # Convert to DataFrame
             if bars and symbol in bars:
@@ -488,6 +572,94 @@ class AlpacaClient:
             logger.error(f"Unexpected error retrieving bars for {symbol}: {e}")
             raise
 
+    def _fetch_bars(
+        self,
+        symbol: str,
+        timeframe: str,
+        limit: int,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> Any:
+        """
+        Issue the bars request for a stock or crypto symbol.
+        
+        Args:
+            symbol: Symbol to retrieve bars for (e.g., "AAPL" or "BTC/USD")
+            timeframe: Timeframe string (e.g., "1Min", "1Day")
+            limit: Maximum number of bars to retrieve
+            start: Start datetime for bars (optional)
+            end: End datetime for bars (optional)
+            
+        Returns:
+            Raw BarSet from the Alpaca SDK
+        """
+        # Parse timeframe
+        tf = self._parse_timeframe(timeframe)
+        
+        # Determine if crypto or stock based on symbol format
+        if "/" in symbol:
+            request = CryptoBarsRequest(
+                symbol_or_symbols=symbol,
+                timeframe=tf,
+                limit=limit,
+                start=start,
+                end=end
+            )
+            return self.crypto_data_client.get_crypto_bars(request)
+        
+        request = StockBarsRequest(
+            symbol_or_symbols=symbol,
+            timeframe=tf,
+            limit=limit,
+            start=start,
+            end=end
+        )
+        return self.stock_data_client.get_stock_bars(request)
+
+    def get_close_array(self, symbol: str, timeframe: str, limit: int = 50) -> np.ndarray:
+        """
+        Retrieve only the close prices of recent bars as a numpy array.
+        
+        Fills the array straight from the SDK bar objects, skipping the
+        DataFrame construction done by get_bars.
+        
+        Args:
+            symbol: Symbol to retrieve bars for (e.g., "AAPL" or "BTC/USD")
+            timeframe: Timeframe string (e.g., "1Min", "5Min", "15Min", "1Hour", "1Day")
+            limit: Maximum number of bars to retrieve (default: 50)
+            
+        Returns:
+            float64 array of close prices, oldest first (empty if no data)
+            
+        Raises:
+            ValueError: If timeframe is invalid
+            APIError: If API request fails
+        """
+        try:
+            bars = self._fetch_bars(symbol, timeframe, limit)
+            
+            if not bars or symbol not in bars:
+                logger.warning(f"No bar data available for {symbol}")
+                return np.empty(0, dtype=np.float64)
+            
+            symbol_bars = bars[symbol]
+            return np.fromiter(
+                (bar.close for bar in symbol_bars),
+                dtype=np.float64,
+                count=len(symbol_bars)
+            )
+                
+        except ValueError as e:
+            logger.error(f"Invalid timeframe for get_close_array({symbol}): {e}")
+            raise
+        except APIError as e:
+            logger.error(f"API error retrieving closes for {symbol}: {e}")
+            self._handle_api_error(e, f"get_close_array({symbol})")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error retrieving closes for {symbol}: {e}")
+            raise
+
     def get_latest_trade(self, symbol: str) -> Optional[Dict]:
         """
         Retrieve the latest trade for a symbol.
@@ -550,6 +722,58 @@ class AlpacaClient:
             logger.error(f"Unexpected error retrieving latest trade for {symbol}: {e}")
             raise
 
+    def get_latest_trades(self, symbols: List[str]) -> Dict[str, Dict]:
+        """
+        Retrieve the latest trades for several symbols in one request per asset class.
+
+        Args:
+            symbols: Symbols to retrieve trades for (stocks and crypto may be mixed)
+
+        Returns:
+            Dictionary mapping symbol to trade data (same format as get_latest_trade).
+            Symbols without trade data are omitted.
+
+        Raises:
+            APIError: If API request fails
+        """
+        crypto_symbols = [s for s in symbols if "/" in s]
+        stock_symbols = [s for s in symbols if "/" not in s]
+        trades_data: Dict[str, Dict] = {}
+
+        try:
+            if crypto_symbols:
+                request = CryptoLatestTradeRequest(symbol_or_symbols=crypto_symbols)
+                trades = self.crypto_data_client.get_crypto_latest_trade(request)
+                for symbol, trade in trades.items():
+                    trades_data[symbol] = {
+                        "symbol": symbol,
+                        "price": float(trade.price),
+                        "size": float(trade.size),
+                        "timestamp": trade.timestamp
+                    }
+
+            if stock_symbols:
+                request = StockLatestTradeRequest(symbol_or_symbols=stock_symbols)
+                trades = self.stock_data_client.get_stock_latest_trade(request)
+                for symbol, trade in trades.items():
+                    trades_data[symbol] = {
+                        "symbol": symbol,
+                        "price": float(trade.price),
+                        "size": int(trade.size),
+                        "timestamp": trade.timestamp
+                    }
+
+            logger.debug(f"Latest trades retrieved for {len(trades_data)}/{len(symbols)} symbols")
+            return trades_data
+
+        except APIError as e:
+            logger.error(f"API error retrieving latest trades for {symbols}: {e}")
+            self._handle_api_error(e, f"get_latest_trades({len(symbols)} symbols)")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error retrieving latest trades for {symbols}: {e}")
+            raise
+
     def get_latest_quote(self, symbol: str) -> Optional[Dict]:
         """
         Retrieve the latest quote for a symbol.
@@ -638,17 +862,17 @@ class AlpacaClient:
             APIError: If API request fails
         """
         try:
-            # Get 2 days of daily bars to ensure we have previous close
-            bars_df = self.get_bars(symbol, "1Day", limit=2)
+            # Get 2 days of daily closes to ensure we have previous close
+            closes = self.get_close_array(symbol, "1Day", limit=2)
             
-            if bars_df is not None and len(bars_df) >= 2:
+            if len(closes) >= 2:
                 # Get the second-to-last bar's close price (previous day)
-                previous_close = float(bars_df.iloc[-2]["close"])
+                previous_close = float(closes[-2])
                 logger.debug(f"Previous close for {symbol}: ${previous_close:.2f}")
                 return previous_close
-            elif bars_df is not None and len(bars_df) == 1:
+            elif len(closes) == 1:
                 # Only one bar available, use it as previous close
-                previous_close = float(bars_df.iloc[0]["close"])
+                previous_close = float(closes[0])
                 logger.debug(f"Previous close for {symbol} (single bar): ${previous_close:.2f}")
                 return previous_close
             else:
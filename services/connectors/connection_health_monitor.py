@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from datetime import datetime
 from typing import Optional, Callable
 from loguru import logger
@@ -57,6 +58,9 @@ class ConnectionHealthMonitor:
         self.running = False
         self._task: Optional[asyncio.Task] = None
         
+        # time.monotonic() deadline of the next check when driven via poll()
+        self.next_check_at: float = 0.0
+        
         logger.info(
             f"ConnectionHealthMonitor initialized: "
             f"check_interval={check_interval}s, error_threshold={error_threshold}, "
@@ -100,6 +104,28 @@ class ConnectionHealthMonitor:
         
         logger.info("ConnectionHealthMonitor stopped")
     
+    async def poll(self, now: Optional[float] = None) -> bool:
+        """
+        Perform a health check if one is due.
+        
+        Lets a caller drive the monitor from its own heartbeat instead of
+        start(), so no separate timer task wakes the event loop.
+        
+        Args:
+            now: Current time.monotonic() value (default: read the clock)
+            
+        Returns:
+            True if a health check was performed, False if not yet due
+        """
+        if now is None:
+            now = time.monotonic()
+        if now < self.next_check_at:
+            return False
+        
+        self.next_check_at = now + self.check_interval
+        await self._perform_health_check()
+        return True
+    
     async def _monitor_loop(self) -> None:
         """Main monitoring loop that performs periodic health checks."""
         logger.info("Health monitoring loop started")
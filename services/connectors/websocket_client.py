@@ -1,15 +1,43 @@
 """WebSocket client for real-time market data streaming from Alpaca."""
 from __future__ import annotations
 
+import asyncio
 import os
-from typing import Dict, List, Callable, Any
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Callable, Any, Optional
 from loguru import logger
 
 from alpaca.data.live import StockDataStream, CryptoDataStream
 
 
+@dataclass(slots=True)
+class TradeTick:
+    """Parsed trade update (slotted to keep per-tick allocation small)."""
+
+    symbol: str
+    price: float
+    size: int
+    timestamp: Any
+
+
+@dataclass(slots=True)
+class QuoteTick:
+    """Parsed quote update (slotted to keep per-tick allocation small)."""
+
+    symbol: str
+    bid_price: float
+    ask_price: float
+    bid_size: int
+    ask_size: int
+    timestamp: Any
+
+
 class WebSocketClient:
     """WebSocket client for real-time market data streaming."""
+    
+    DEFAULT_BUFFER_SIZE = 5000
+    DROP_WARNING_INTERVAL_S = 5.0
 
     def __init__(self, config: Dict) -> None:
         """
@@ -31,11 +59,29 @@ class WebSocketClient:
         self.stock_stream = StockDataStream(self.api_key, self.api_secret)
         self.crypto_stream = CryptoDataStream(self.api_key, self.api_secret)
         
-        # Setup callback registries
-        self.callbacks: Dict[str, List[Callable]] = {
-            "trade": [],
-            "quote": [],
-            "bar": []
+        # Setup callback registries (plain attributes, no per-tick dict lookup)
+        self._trade_cbs: List[Callable] = []
+        self._quote_cbs: List[Callable] = []
+        
+        # Streams that have at least one subscription, and the tasks run() drives
+        # them with; an unsubscribed stream would spin in alpaca's idle loop
+        self._subscribed_streams: List[Any] = []
+        self._stream_tasks: List[asyncio.Task] = []
+        
+        # Stream handlers only enqueue parsed ticks; a dispatcher task per event
+        # type drains whatever has accumulated and delivers it as one batch.
+        # Queues are bounded so a slow consumer sheds ticks instead of
+        # growing memory or blocking the socket reader.
+        buffer_size = config.get("data", {}).get("streaming", {}).get("buffer_size", self.DEFAULT_BUFFER_SIZE)
+        self._queues: Dict[str, asyncio.Queue] = {
+            "trade": asyncio.Queue(maxsize=buffer_size),
+            "quote": asyncio.Queue(maxsize=buffer_size)
+        }
+        self.dropped: Dict[str, int] = {"trade": 0, "quote": 0}
+        self._last_drop_warning: Dict[str, float] = {"trade": 0.0, "quote": 0.0}
+        self._dispatchers: Dict[str, Optional[asyncio.Task]] = {
+            "trade": None,
+            "quote": None
         }
         
         logger.info("WebSocketClient initialized")
@@ -57,14 +103,29 @@ class WebSocketClient:
         """
         Close WebSocket connections gracefully.
         
-        Closes both stock and crypto data streams.
+        Stops the batch dispatchers, signals both data streams to stop (so
+        they do not reconnect) and closes them, which lets run() return.
         """
+        # Stop batch dispatchers
+        for kind, task in self._dispatchers.items():
+            if task is not None and not task.done():
+                task.cancel()
+            self._dispatchers[kind] = None
+        
         try:
-            await self.stock_stream.close()
-            await self.crypto_stream.close()
+            for stream in (self.stock_stream, self.crypto_stream):
+                await stream.stop_ws()
+                await stream.close()
             logger.info("WebSocket connections closed")
         except Exception as e:
             logger.error(f"Error closing WebSocket connections: {e}")
+        
+        # A stream still waiting out a reconnect backoff would only exit after
+        # it; its socket is already closed, so end it now
+        for task in self._stream_tasks:
+            if not task.done():
+                task.cancel()
+        self._stream_tasks = []
 
     def subscribe_trades(self, symbols: List[str], callback: Callable) -> None:
         """
@@ -72,23 +133,10 @@ class WebSocketClient:
         
         Args:
             symbols: List of symbols to subscribe to (e.g., ["AAPL", "BTC/USD"])
-            callback: Async callback function to invoke on trade updates
+            callback: Async callback invoked with a list of TradeTick objects
         """
-        self.callbacks["trade"].append(callback)
-        
-        # Separate crypto and stock symbols
-        crypto_symbols = [s for s in symbols if "/" in s]
-        stock_symbols = [s for s in symbols if "/" not in s]
-        
-        # Subscribe to crypto trades
-        if crypto_symbols:
-            self.crypto_stream.subscribe_trades(self._trade_handler, *crypto_symbols)
-            logger.info(f"Subscribed to crypto trades: {crypto_symbols}")
-        
-        # Subscribe to stock trades
-        if stock_symbols:
-            self.stock_stream.subscribe_trades(self._trade_handler, *stock_symbols)
-            logger.info(f"Subscribed to stock trades: {stock_symbols}")
+        self._trade_cbs.append(callback)
+        self._subscribe("trade", symbols, self._trade_handler)
 
     def subscribe_quotes(self, symbols: List[str], callback: Callable) -> None:
         """
@@ -96,96 +144,193 @@ class WebSocketClient:
         
         Args:
             symbols: List of symbols to subscribe to (e.g., ["AAPL", "BTC/USD"])
-            callback: Async callback function to invoke on quote updates
+            callback: Async callback invoked with a list of QuoteTick objects
         """
-        self.callbacks["quote"].append(callback)
+        self._quote_cbs.append(callback)
+        self._subscribe("quote", symbols, self._quote_handler)
+
+    def _subscribe(self, kind: str, symbols: List[str], handler: Callable) -> None:
+        """
+        Subscribe symbols on the matching streams.
+        
+        Symbols are partitioned into crypto and stock in a single pass and
+        dispatched to the stream's ``subscribe_trades``/``subscribe_quotes``.
         
+        Args:
+            kind: Event type ("trade" or "quote")
+            symbols: List of symbols to subscribe to
+            handler: Stream handler to register (_trade_handler or _quote_handler)
+        """
         # Separate crypto and stock symbols
-        crypto_symbols = [s for s in symbols if "/" in s]
-        stock_symbols = [s for s in symbols if "/" not in s]
+        crypto_symbols: List[str] = []
+        stock_symbols: List[str] = []
+        append_crypto, append_stock = crypto_symbols.append, stock_symbols.append
+        for symbol in symbols:
+            # Crypto pairs are quoted as BASE/QUOTE (e.g., "BTC/USD")
+            (append_crypto if "/" in symbol else append_stock)(symbol)
         
-        # Subscribe to crypto quotes
-        if crypto_symbols:
-            self.crypto_stream.subscribe_quotes(self._quote_handler, *crypto_symbols)
-            logger.info(f"Subscribed to crypto quotes: {crypto_symbols}")
+        method = f"subscribe_{kind}s"
         
-        # Subscribe to stock quotes
-        if stock_symbols:
-            self.stock_stream.subscribe_quotes(self._quote_handler, *stock_symbols)
-            logger.info(f"Subscribed to stock quotes: {stock_symbols}")
+        for stream, stream_symbols, label in (
+            (self.crypto_stream, crypto_symbols, "crypto"),
+            (self.stock_stream, stock_symbols, "stock"),
+        ):
+            if not stream_symbols:
+                continue
+            getattr(stream, method)(handler, *stream_symbols)
+            if stream not in self._subscribed_streams:
+                self._subscribed_streams.append(stream)
+            logger.info("Subscribed to {} {}s: {}", label, kind, stream_symbols)
 
     async def _trade_handler(self, trade: Any) -> None:
         """
         Handle incoming trade updates from Alpaca streams.
         
-        Parses trade data and forwards to registered callbacks.
+        Parses trade data and enqueues it for batched delivery to callbacks.
         
         Args:
             trade: Trade object from Alpaca stream
         """
         try:
             # Parse trade data
-            trade_data = {
-                "symbol": trade.symbol,
-                "price": float(trade.price),
-                "size": int(trade.size),
-                "timestamp": trade.timestamp
-            }
+            trade_data = TradeTick(
+                trade.symbol,
+                float(trade.price),
+                int(trade.size),
+                trade.timestamp
+            )
             
-            # Invoke all registered trade callbacks
-            for callback in self.callbacks["trade"]:
-                try:
-                    await callback(trade_data)
-                except Exception as e:
-                    logger.error(f"Error in trade callback for {trade.symbol}: {e}")
+            self._enqueue("trade", trade_data)
                     
-        except Exception as e:
-            logger.error(f"Error handling trade update: {e}")
+        except Exception:
+            logger.opt(exception=True).error("Error handling trade update for {}", getattr(trade, "symbol", None))
 
     async def _quote_handler(self, quote: Any) -> None:
         """
         Handle incoming quote updates from Alpaca streams.
         
-        Parses quote data and forwards to registered callbacks.
+        Parses quote data and enqueues it for batched delivery to callbacks.
         
         Args:
             quote: Quote object from Alpaca stream
         """
         try:
             # Parse quote data
-            quote_data = {
-                "symbol": quote.symbol,
-                "bid_price": float(quote.bid_price),
-                "ask_price": float(quote.ask_price),
-                "bid_size": int(quote.bid_size),
-                "ask_size": int(quote.ask_size),
-                "timestamp": quote.timestamp
-            }
+            quote_data = QuoteTick(
+                quote.symbol,
+                float(quote.bid_price),
+                float(quote.ask_price),
+                int(quote.bid_size),
+                int(quote.ask_size),
+                quote.timestamp
+            )
             
-            # Invoke all registered quote callbacks
-            for callback in self.callbacks["quote"]:
-                try:
-                    await callback(quote_data)
-                except Exception as e:
-                    logger.error(f"Error in quote callback for {quote.symbol}: {e}")
+            self._enqueue("quote", quote_data)
                     
-        except Exception as e:
-            logger.error(f"Error handling quote update: {e}")
+        except Exception:
+            logger.opt(exception=True).error("Error handling quote update for {}", getattr(quote, "symbol", None))
+
+    def _enqueue(self, kind: str, tick: Any) -> None:
+        """
+        Queue a parsed tick for dispatch without blocking the stream reader.
+        
+        When the buffer is full the tick is dropped and counted; a warning is
+        logged at most once per DROP_WARNING_INTERVAL_S per event type.
+        
+        Args:
+            kind: Event type ("trade" or "quote")
+            tick: Parsed TradeTick or QuoteTick
+        """
+        try:
+            self._queues[kind].put_nowait(tick)
+        except asyncio.QueueFull:
+            self.dropped[kind] += 1
+            now = time.monotonic()
+            if now - self._last_drop_warning[kind] >= self.DROP_WARNING_INTERVAL_S:
+                self._last_drop_warning[kind] = now
+                logger.warning(
+                    "{} buffer full, dropping ticks ({} dropped so far)",
+                    kind.capitalize(), self.dropped[kind]
+                )
+        self._ensure_dispatcher(kind)
+
+    def _ensure_dispatcher(self, kind: str) -> None:
+        """
+        Start the batch dispatcher task for an event type if it is not running.
+        
+        Args:
+            kind: Event type ("trade" or "quote")
+        """
+        task = self._dispatchers[kind]
+        if task is None or task.done():
+            self._dispatchers[kind] = asyncio.create_task(self._dispatch_loop(kind))
+
+    async def _dispatch_loop(self, kind: str) -> None:
+        """
+        Continuously deliver batches of queued events to callbacks.
+        
+        Args:
+            kind: Event type ("trade" or "quote")
+        """
+        queue = self._queues[kind]
+        callbacks = self._trade_cbs if kind == "trade" else self._quote_cbs
+        while True:
+            await self._dispatch_batch(kind, queue, callbacks)
+
+    async def _dispatch_batch(
+        self,
+        kind: str,
+        queue: asyncio.Queue,
+        callbacks: List[Callable]
+    ) -> None:
+        """
+        Wait for one event, drain everything else already queued, and deliver
+        the batch to all registered callbacks concurrently.
+        
+        A failing callback is logged and does not affect the others.
+        
+        Args:
+            kind: Event type ("trade" or "quote"), used for logging
+            queue: Queue of parsed ticks for this event type
+            callbacks: Callbacks registered for this event type
+        """
+        batch = [await queue.get()]
+        while True:
+            try:
+                batch.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        
+        if not callbacks:
+            return
+        
+        results = await asyncio.gather(
+            *(callback(batch) for callback in callbacks),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Error in {} callback for batch of {}: {}", kind, len(batch), result)
 
-    def run(self) -> None:
+    async def run(self) -> None:
         """
-        Start the WebSocket streams.
+        Run the subscribed stock and crypto WebSocket streams concurrently.
         
-        This method starts both stock and crypto streams. It should be called
-        after subscriptions are set up. The streams will run until disconnect()
-        is called or an error occurs.
+        Only streams with at least one subscription are started. They run
+        inside one task group, so a failure of either one tears down the
+        other. It should be awaited after subscriptions are set up and returns
+        once disconnect() stops the streams.
         """
+        if not self._subscribed_streams:
+            logger.warning("No WebSocket subscriptions; not starting streams")
+            return
+        
         try:
             logger.info("Starting WebSocket streams...")
-            # Note: In practice, these would be run in separate tasks/threads
-            # The actual implementation depends on how the orchestrator manages async tasks
-            self.stock_stream.run()
-            self.crypto_stream.run()
+            async with asyncio.TaskGroup() as tg:
+                self._stream_tasks = [
+                    tg.create_task(stream._run_forever()) for stream in self._subscribed_streams
+                ]
         except Exception as e:
             logger.error(f"Error running WebSocket streams: {e}")
             raise
@@ -1,12 +1,23 @@
 """Market data aggregation service."""
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Optional, Dict, Tuple
+import asyncio
+import time
+from typing import Optional, Dict, List, Tuple
 
 import pandas as pd
 from loguru import logger
 
+# Default bars TTL per timeframe (seconds): a fraction of the bar period, so the
+# still-forming last bar is refreshed without refetching on every strategy tick
+DEFAULT_BARS_CACHE_TTL = {
+    "1Min": 10,
+    "5Min": 30,
+    "15Min": 60,
+    "1Hour": 300,
+    "1Day": 900,
+}
+
 
 class MarketDataFeed:
     """Aggregates historical and real-time market data."""
@@ -22,9 +33,18 @@ class MarketDataFeed:
         self.config = config
         self.alpaca_client = alpaca_client
         
-        # Price cache with TTL (time-to-live)
-        self.price_cache: Dict[str, Tuple[float, datetime]] = {}
+        # Price cache with TTL (time-to-live), stamped with time.monotonic_ns()
+        self.price_cache: Dict[str, Tuple[float, int]] = {}
         self.cache_ttl = 5  # seconds
+        self.cache_ttl_ns = self.cache_ttl * 1_000_000_000
+        
+        # Bars cache keyed by (symbol, timeframe, limit) with a per-timeframe TTL
+        # (data.bars_cache_ttl in config overrides the defaults), plus in-flight
+        # fetches so concurrent callers share one request
+        bars_ttl = {**DEFAULT_BARS_CACHE_TTL, **config.get("data", {}).get("bars_cache_ttl", {})}
+        self.bars_cache_ttl_ns = {timeframe: int(ttl * 1_000_000_000) for timeframe, ttl in bars_ttl.items()}
+        self.bars_cache: Dict[Tuple[str, str, int], Tuple[pd.DataFrame, int]] = {}
+        self._bars_inflight: Dict[Tuple[str, str, int], asyncio.Task] = {}
 
     async def connect(self) -> None:
         """Initialize market data feed."""
@@ -43,6 +63,11 @@ class MarketDataFeed:
         """
         Retrieve historical bars from Alpaca.
         
+        Results are cached for the timeframe's TTL (the price TTL for unknown
+        timeframes), and concurrent requests for the same bars are coalesced
+        into a single API call. Callers get a shallow copy, so adding or
+        dropping columns does not alter the cached frame.
+        
         Args:
             symbol: Symbol to retrieve bars for (e.g., "AAPL" or "BTC/USD")
             timeframe: Timeframe string (e.g., "1Min", "5Min", "15Min", "1Hour", "1Day")
@@ -51,10 +76,25 @@ class MarketDataFeed:
         Returns:
             pandas DataFrame with OHLCV data, or None if no data available
         """
+        key = (symbol, timeframe, limit)
+        cached = self.bars_cache.get(key)
+        ttl_ns = self.bars_cache_ttl_ns.get(timeframe, self.cache_ttl_ns)
+        if cached is not None and (time.monotonic_ns() - cached[1]) < ttl_ns:
+            return cached[0].copy(deep=False)
+        
         try:
-            bars = self.alpaca_client.get_bars(symbol, timeframe, limit)
+            task = self._bars_inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(
+                    asyncio.to_thread(self.alpaca_client.get_bars, symbol, timeframe, limit)
+                )
+                self._bars_inflight[key] = task
+                task.add_done_callback(lambda _: self._bars_inflight.pop(key, None))
+            
+            bars = await asyncio.shield(task)
             if bars is not None and not bars.empty:
-                return bars
+                self.bars_cache[key] = (bars, time.monotonic_ns())
+                return bars.copy(deep=False)
             logger.warning(f"No bar data for {symbol}")
             return None
         except Exception as e:
@@ -72,24 +112,23 @@ class MarketDataFeed:
             Current price as float, or None if no price data available
         """
         # Check cache first
-        if symbol in self.price_cache:
-            price, timestamp = self.price_cache[symbol]
-            if (datetime.now() - timestamp).seconds < self.cache_ttl:
-                return price
+        cached = self.price_cache.get(symbol)
+        if cached is not None and (time.monotonic_ns() - cached[1]) < self.cache_ttl_ns:
+            return cached[0]
         
         try:
             # Try latest trade first
             trade = self.alpaca_client.get_latest_trade(symbol)
             if trade:
                 price = float(trade["price"])
-                self.price_cache[symbol] = (price, datetime.now())
+                self.price_cache[symbol] = (price, time.monotonic_ns())
                 return price
             
             # Fall back to quote midpoint
             quote = self.alpaca_client.get_latest_quote(symbol)
             if quote:
                 price = (float(quote["ask_price"]) + float(quote["bid_price"])) / 2
-                self.price_cache[symbol] = (price, datetime.now())
+                self.price_cache[symbol] = (price, time.monotonic_ns())
                 return price
             
             logger.warning(f"No price data for {symbol}")
@@ -98,6 +137,54 @@ class MarketDataFeed:
             logger.error(f"Failed to get price for {symbol}: {e}")
             return None
 
+    async def get_current_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """
+        Get current prices for several symbols with a single batched request.
+
+        Cached prices are reused; the remaining symbols are fetched together via
+        latest trades. Symbols with no trade fall back to get_current_price.
+
+        Args:
+            symbols: Symbols to get prices for (stocks and crypto may be mixed)
+
+        Returns:
+            Dictionary mapping symbol to current price. Symbols with no price
+            data available are omitted.
+        """
+        prices: Dict[str, float] = {}
+        missing: List[str] = []
+        now_ns = time.monotonic_ns()
+
+        for symbol in symbols:
+            cached = self.price_cache.get(symbol)
+            if cached is not None and (now_ns - cached[1]) < self.cache_ttl_ns:
+                prices[symbol] = cached[0]
+            else:
+                missing.append(symbol)
+
+        if not missing:
+            return prices
+
+        try:
+            trades = self.alpaca_client.get_latest_trades(missing)
+        except Exception as e:
+            logger.error(f"Failed to get batched prices for {missing}: {e}")
+            trades = {}
+
+        stamp = time.monotonic_ns()
+        for symbol in missing:
+            trade = trades.get(symbol)
+            if trade:
+                price = float(trade["price"])
+                self.price_cache[symbol] = (price, stamp)
+                prices[symbol] = price
+            else:
+                price = await self.get_current_price(symbol)
+                if price is not None:
+                    prices[symbol] = price
+
+        return prices
+
     async def get_previous_close(self, symbol: str) -> Optional[float]:
         """
         Get previous day's closing price.
@@ -109,10 +196,10 @@ class MarketDataFeed:
             Previous day's closing price as float, or None if not available
         """
         try:
-            # Get 2 days of daily bars
-            bars = self.alpaca_client.get_bars(symbol, "1Day", limit=2)
-            if bars is not None and len(bars) >= 2:
-                return float(bars.iloc[-2]["close"])
+            # Get 2 days of daily closes (numpy array, no DataFrame)
+            closes = self.alpaca_client.get_close_array(symbol, "1Day", 2)
+            if closes is not None and len(closes) >= 2:
+                return float(closes[-2])
             logger.warning(f"No previous close for {symbol}")
             return None
         except Exception as e:
@@ -1,12 +1,22 @@
 """RSS and SEC filing parser placeholder."""
 from __future__ import annotations
 
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 import feedparser
 
+# Per-URL conditional-GET state: (etag, modified, entries)
+_feed_state: Dict[str, Tuple[Optional[str], Optional[str], List[dict]]] = {}
+
 
 def fetch_feed_entries(url: str) -> List[dict]:
-    """Fetch entries from RSS feed."""
-    feed = feedparser.parse(url)
-    return [entry for entry in feed.entries]
+    """Fetch entries from RSS feed, reusing cached entries when unchanged (HTTP 304)."""
+    prev_etag, prev_modified, cached_entries = _feed_state.get(url, (None, None, []))
+    feed = feedparser.parse(url, etag=prev_etag, modified=prev_modified)
+
+    if feed.get("status") == 304:
+        return cached_entries
+
+    entries = feed.entries
+    _feed_state[url] = (feed.get("etag"), feed.get("modified"), entries)
+    return entries
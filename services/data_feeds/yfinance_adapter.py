@@ -1,12 +1,117 @@
 """yfinance integration placeholder."""
 from __future__ import annotations
 
-from typing import Optional
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional
 
+import pandas as pd
 import yfinance as yf
+from loguru import logger
 
+# Daily on-disk cache of downloaded history (one parquet file per symbol/period/interval/day)
+CACHE_DIR = Path("data/yfinance_cache")
 
-def fetch_history(symbol: str, period: str = "1mo", interval: str = "1d") -> Optional[object]:
-    """Fetch historical data via yfinance."""
-    ticker = yf.Ticker(symbol)
-    return ticker.history(period=period, interval=interval)
+# Last day the cache was pruned in this process
+_pruned_day: Optional[str] = None
+
+
+def _cache_path(symbol: str, period: str, interval: str, day: str) -> Path:
+    return CACHE_DIR / f"{symbol.replace('/', '-')}_{period}_{interval}_{day}.parquet"
+
+
+def _read_cached(path: Path) -> Optional[pd.DataFrame]:
+    if not path.exists():
+        return None
+    try:
+        return pd.read_parquet(path)
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable yfinance cache {path}: {e}")
+        return None
+
+
+def _prune_cache(day: str) -> None:
+    """Delete cache files from days other than ``day`` (at most once per day)."""
+    global _pruned_day
+    if _pruned_day == day:
+        return
+    _pruned_day = day
+    if not CACHE_DIR.exists():
+        return
+    for path in CACHE_DIR.glob("*.parquet"):
+        if not path.stem.endswith(f"_{day}"):
+            try:
+                path.unlink()
+            except OSError as e:
+                logger.debug(f"Could not remove stale yfinance cache {path}: {e}")
+
+
+def _write_cached(path: Path, frame: pd.DataFrame) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        frame.to_parquet(path)
+    except Exception as e:
+        # Caching is best effort; the download result is still returned
+        logger.warning(f"Failed to write yfinance cache {path}: {e}")
+
+
+def fetch_history(
+    symbols: List[str],
+    period: str = "1mo",
+    interval: str = "1d"
+) -> Dict[str, pd.DataFrame]:
+    """
+    Fetch historical data for several symbols via one yfinance batch download.
+
+    Symbols already cached on disk for today are served from the cache; the
+    rest are downloaded together and written back to the cache. Cache files
+    from earlier days are deleted before the first download of the day.
+
+    Args:
+        symbols: Ticker symbols to fetch
+        period: yfinance period string (e.g., "1mo")
+        interval: yfinance interval string (e.g., "1d")
+
+    Returns:
+        Dictionary mapping symbol to its history DataFrame. Symbols without
+        data are omitted.
+    """
+    today = date.today().isoformat()
+    history: Dict[str, pd.DataFrame] = {}
+    missing: List[str] = []
+
+    for symbol in symbols:
+        cached = _read_cached(_cache_path(symbol, period, interval, today))
+        if cached is not None:
+            history[symbol] = cached
+        else:
+            missing.append(symbol)
+
+    if not missing:
+        return history
+
+    _prune_cache(today)
+    data = yf.download(
+        " ".join(missing),
+        period=period,
+        interval=interval,
+        group_by="ticker",
+        threads=True,
+        progress=False,
+    )
+    if data is None or data.empty:
+        return history
+
+    for symbol in missing:
+        if isinstance(data.columns, pd.MultiIndex):
+            if symbol not in data.columns.get_level_values(0):
+                continue
+            frame = data[symbol].dropna(how="all")
+        else:
+            frame = data
+        if frame.empty:
+            continue
+        history[symbol] = frame
+        _write_cached(_cache_path(symbol, period, interval, today), frame)
+
+    return history
@@ -4,10 +4,14 @@ Executes weekly dividend stock purchases every Monday.
 """
 from __future__ import annotations
 
+import asyncio
+import bisect
+import sys
 from datetime import datetime
-from decimal import Decimal
+from pathlib import Path
 from typing import Dict, List
 
+import orjson
 from loguru import logger
 
 
@@ -24,6 +28,16 @@ class MondayAllocationJob:
         self.dividend_config = config.get("accounts", {}).get("default", {}).get("dividend", {})
         self.monday_config = self.dividend_config.get("monday_allocation", {})
 
+        # Interned universe: ordered for selection, frozenset for O(1) membership
+        self._universe_order = tuple(sys.intern(symbol) for symbol in self.dividend_config.get("universe", []))
+        self._universe = frozenset(self._universe_order)
+
+        # Allocation tiers sorted by lower bound for bisect lookup
+        tiers = sorted(self.dividend_config.get("allocation_tiers", []), key=lambda tier: tier["equity_min"])
+        self._tier_mins = [tier["equity_min"] for tier in tiers]
+        self._tier_maxes = [tier["equity_max"] for tier in tiers]
+        self._tier_pcts = [tier["weekly_percentage"] for tier in tiers]
+
         logger.info("Monday Allocation Job initialized")
 
     async def schedule(self) -> None:
@@ -41,14 +55,14 @@ class MondayAllocationJob:
         logger.info("=" * 60)
 
         try:
-            account = self.account_manager.get_primary_account()
-            equity = await account.get_equity()
+            equity = await self.account_manager.get_equity()
 
             suspend_until = self.dividend_config.get("suspend_until_equity", 5000)
             if equity < suspend_until:
                 logger.info(
-                    f"Dividend allocation suspended until equity >= ${suspend_until:,.0f} "
-                    f"(current: ${equity:,.2f})"
+                    "Dividend allocation suspended until equity >= ${:,.0f} (current: ${:,.2f})",
+                    suspend_until,
+                    equity,
                 )
                 return
 
@@ -58,78 +72,90 @@ class MondayAllocationJob:
                 logger.info("No allocation scheduled for this equity level")
                 return
 
-            cash = await account.get_cash()
-            allocation_amount = Decimal(str(cash)) * (
-                Decimal(str(allocation_pct)) / Decimal("100")
-            )
-
-            logger.info(f"Allocation: {allocation_pct}% of ${cash:,.2f} = ${allocation_amount:,.2f}")
+            cash = await self.account_manager.get_cash()
+            # Plain float math: whole-share sizing tolerates the rounding error
+            allocation_amount = float(cash) * allocation_pct / 100.0
 
-            universe = self.dividend_config.get("universe", [])
+            logger.info("Allocation: {}% of ${:,.2f} = ${:,.2f}", allocation_pct, cash, allocation_amount)
 
-            holdings = await account.get_positions()
-            dividend_holdings = {holding["symbol"]: holding["qty"] for holding in holdings if holding["symbol"] in universe}
+            holdings = await self.account_manager.get_positions()
+            dividend_holdings = {
+                holding["symbol"]: holding["qty"] for holding in holdings if holding["symbol"] in self._universe
+            }
 
             min_diversification = self.dividend_config.get("min_diversification", 3)
             num_holdings = max(min_diversification, len(dividend_holdings) + 1)
 
-            amount_per_holding = allocation_amount / Decimal(str(num_holdings))
+            amount_per_holding = allocation_amount / num_holdings
 
-            selected_holdings = self._select_holdings(universe, dividend_holdings, num_holdings)
+            selected_holdings = self._select_holdings(dividend_holdings, num_holdings)
 
             market_sentiment = await self._assess_market_sentiment()
             order_type = self._get_order_type(market_sentiment)
 
-            logger.info(f"Market sentiment: {market_sentiment} → Order type: {order_type}")
+            logger.info("Market sentiment: {} → Order type: {}", market_sentiment, order_type)
 
-            orders = []
+            prices = await self.order_manager.get_current_prices(selected_holdings)
+
+            candidates = []
             for symbol in selected_holdings:
-                price = await self.order_manager.get_current_price(symbol)
+                price = prices.get(symbol)
                 if price is None:
                     continue
-                qty = int(amount_per_holding / Decimal(str(price)))
-
+                qty = int(amount_per_holding / price)
                 if qty > 0:
-                    order = await self.order_manager.submit_dividend_order(
-                        symbol=symbol,
-                        qty=qty,
-                        order_type=order_type,
-                        force_fill_time=self.monday_config.get("force_fill_time", "10:30:00"),
-                    )
+                    candidates.append((symbol, qty, price))
+
+            # One batch: pre-trade data is fetched once and accepted orders go out concurrently
+            results = await self.order_manager.submit_orders(
+                [
+                    {
+                        "symbol": symbol,
+                        "side": "buy",
+                        "order_type": order_type,
+                        "qty": qty,
+                        "strategy": "dividend_allocation",
+                    }
+                    for symbol, qty, _ in candidates
+                ]
+            )
 
-                    if order:
-                        orders.append(order)
-                        logger.info(f"Order submitted: {symbol} x{qty} @ ~${price:.2f} ({order_type})")
+            orders = []
+            for (symbol, qty, price), order in zip(candidates, results):
+                if order:
+                    orders.append(order)
+                    logger.info("Order submitted: {} x{} @ ~${:.2f} ({})", symbol, qty, price, order_type)
 
-            logger.info(f"Monday allocation complete: {len(orders)} orders submitted")
+            logger.info("Monday allocation complete: {} orders submitted", len(orders))
 
             await self._generate_report(equity, allocation_amount, orders)
 
         except Exception as exc:
-            logger.exception(f"Error in Monday allocation: {exc}")
+            logger.exception("Error in Monday allocation: {}", exc)
 
     def _get_allocation_percentage(self, equity: float) -> float:
-        allocation_tiers = self.dividend_config.get("allocation_tiers", [])
-
-        for tier in allocation_tiers:
-            if tier["equity_min"] <= equity < tier["equity_max"]:
-                return tier["weekly_percentage"]
+        i = bisect.bisect_right(self._tier_mins, equity) - 1
+        if i >= 0 and equity < self._tier_maxes[i]:
+            return self._tier_pcts[i]
 
         return 0.0
 
-    def _select_holdings(self, universe: List[str], current_holdings: Dict, target_count: int) -> List[str]:
-        if len(current_holdings) < target_count:
-            available = [symbol for symbol in universe if symbol not in current_holdings]
-            need = target_count - len(current_holdings)
-            selected = list(current_holdings.keys()) + available[:need]
-        else:
-            selected = list(current_holdings.keys())[:target_count]
+    def _select_holdings(self, current_holdings: Dict, target_count: int) -> List[str]:
+        current: List[str] = []
+        available: List[str] = []
+        for symbol in self._universe_order:
+            (current if symbol in current_holdings else available).append(symbol)
 
-        return selected
+        if len(current) < target_count:
+            return current + available[: target_count - len(current)]
+
+        return current[:target_count]
 
     async def _assess_market_sentiment(self) -> str:
-        spy_price = await self.order_manager.get_current_price("SPY")
-        spy_prev_close = await self.order_manager.get_previous_close("SPY")
+        spy_price, spy_prev_close = await asyncio.gather(
+            self.order_manager.get_current_price("SPY"),
+            self.order_manager.get_previous_close("SPY"),
+        )
 
         if spy_price and spy_prev_close:
             change_pct = ((spy_price - spy_prev_close) / spy_prev_close) * 100
@@ -145,11 +171,12 @@ class MondayAllocationJob:
         order_types = self.monday_config.get("order_types", {})
         return order_types.get(sentiment, "market")
 
-    async def _generate_report(self, equity: float, allocation_amount: Decimal, orders: List) -> None:
+    async def _generate_report(self, equity: float, allocation_amount: float, orders: List) -> None:
+        now = datetime.now()
         report = {
-            "date": datetime.now().isoformat(),
-            "equity": float(equity),
-            "allocation_amount": float(allocation_amount),
+            "date": now,
+            "equity": equity,
+            "allocation_amount": allocation_amount,
             "orders": [
                 {
                     "symbol": order["symbol"],
@@ -161,6 +188,11 @@ class MondayAllocationJob:
             ],
         }
 
-        report_path = f"reports/monday/allocation_{datetime.now().strftime('%Y%m%d')}.json"
-        logger.info(f"Monday report saved: {report_path}")
-        _ = report
+        report_path = Path(f"reports/monday/allocation_{now.strftime('%Y%m%d')}.json")
+        try:
+            payload = orjson.dumps(report, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2)
+            report_path.parent.mkdir(parents=True, exist_ok=True)
+            await asyncio.to_thread(report_path.write_bytes, payload)
+            logger.info("Monday report saved: {}", report_path)
+        except Exception as exc:
+            logger.error("Failed to write Monday report {}: {}", report_path, exc)
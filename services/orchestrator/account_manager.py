@@ -1,21 +1,28 @@
 """Account management for PulseTrader.01."""
 from __future__ import annotations
 
+import asyncio
+import time
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 from loguru import logger
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Account:
-    """Account representation with real Alpaca data."""
+    """
+    Account representation with real Alpaca data.
+    
+    Instances are immutable snapshots; AccountManager swaps in a new one on
+    each refresh instead of updating fields in place.
+    """
 
     account_id: str
     name: str
     account_type: str
     equity: float = 0.0
+    last_equity: float = 0.0
     cash: float = 0.0
     buying_power: float = 0.0
     portfolio_value: float = 0.0
@@ -28,47 +35,59 @@ class Account:
 class AccountManager:
     """Multi-account management with real Alpaca integration."""
 
-    def __init__(self, config: Dict, alpaca_client) -> None:
+    def __init__(
+        self,
+        config: Dict,
+        alpaca_client,
+        time_source: Callable[[], int] = time.monotonic_ns,
+    ) -> None:
         """
         Initialize AccountManager with AlpacaClient.
         
         Args:
             config: Configuration dictionary
             alpaca_client: AlpacaClient instance for API calls
+            time_source: Monotonic clock in nanoseconds used for the cache TTL
         """
         self.config = config
         self.alpaca_client = alpaca_client
+        self._now_ns = time_source
         self.accounts: Dict[str, Account] = {}
         
         # Cache management
         self.account_cache: Optional[Dict] = None
         self.positions_cache: List[Dict] = []
-        self.last_update: Optional[datetime] = None
+        self._positions_by_symbol: Dict[str, Dict] = {}
+        self._last_update_ns: Optional[int] = None
         self.update_interval = 30  # seconds - cache TTL
+        self._refresh_lock = asyncio.Lock()
+        self._equity_listeners: List[Callable[[float], None]] = []
+
+    @property
+    def update_interval(self) -> float:
+        """Cache TTL in seconds."""
+        return self._update_interval_ns / 1_000_000_000
+
+    @update_interval.setter
+    def update_interval(self, seconds: float) -> None:
+        self._update_interval_ns = int(seconds * 1_000_000_000)
 
     async def initialize(self) -> None:
-        """Initialize account state from Alpaca."""
+        """
+        Initialize account state from Alpaca.
+        
+        Idempotent: once an account snapshot exists, repeated calls (e.g. from
+        restart or reconnect flows) return without refetching.
+        """
+        if self.accounts:
+            return
+        
         try:
-            # Update account state from Alpaca
+            # Update account state from Alpaca (builds the Account snapshot)
             await self.update_state()
             
-            # Create Account object with real data
-            if self.account_cache:
-                default_config = self.config.get("accounts", {}).get("default", {})
-                account = Account(
-                    account_id=self.account_cache.get("account_id", ""),
-                    name=default_config.get("name", "Default"),
-                    account_type=default_config.get("type", "main"),
-                    equity=self.account_cache.get("equity", 0.0),
-                    cash=self.account_cache.get("cash", 0.0),
-                    buying_power=self.account_cache.get("buying_power", 0.0),
-                    portfolio_value=self.account_cache.get("portfolio_value", 0.0),
-                    pattern_day_trader=self.account_cache.get("pattern_day_trader", False),
-                    trading_blocked=self.account_cache.get("trading_blocked", False),
-                    account_blocked=self.account_cache.get("account_blocked", False),
-                    currency=self.account_cache.get("currency", "USD")
-                )
-                self.accounts["default"] = account
+            account = self.accounts.get("default")
+            if account is not None:
                 logger.info(
                     f"Account manager initialized: "
                     f"Equity=${account.equity:.2f}, Cash=${account.cash:.2f}"
@@ -80,10 +99,45 @@ class AccountManager:
             logger.error(f"Failed to initialize account manager: {e}")
             raise
 
+    def add_equity_listener(self, listener: Callable[[float], None]) -> None:
+        """
+        Register a callback invoked with the new equity after each refresh.
+        
+        Args:
+            listener: Synchronous callable taking the refreshed equity
+        """
+        self._equity_listeners.append(listener)
+
     def get_primary_account(self) -> Account:
         """Return the primary account."""
         return self.accounts.get("default")
 
+    def _build_account(self, account_data: Dict) -> Account:
+        """
+        Build an Account snapshot from Alpaca account data.
+        
+        Args:
+            account_data: Account dictionary from AlpacaClient.get_account()
+            
+        Returns:
+            New Account instance
+        """
+        default_config = self.config.get("accounts", {}).get("default", {})
+        return Account(
+            account_id=account_data.get("account_id", ""),
+            name=default_config.get("name", "Default"),
+            account_type=default_config.get("type", "main"),
+            equity=float(account_data.get("equity", 0.0)),
+            last_equity=float(account_data.get("last_equity", account_data.get("equity", 0.0))),
+            cash=float(account_data.get("cash", 0.0)),
+            buying_power=float(account_data.get("buying_power", 0.0)),
+            portfolio_value=float(account_data.get("portfolio_value", 0.0)),
+            pattern_day_trader=account_data.get("pattern_day_trader", False),
+            trading_blocked=account_data.get("trading_blocked", False),
+            account_blocked=account_data.get("account_blocked", False),
+            currency=account_data.get("currency", "USD")
+        )
+
     async def update_state(self) -> None:
         """Refresh account and position data from Alpaca."""
         try:
@@ -92,20 +146,17 @@ class AccountManager:
             
             # Retrieve positions from Alpaca
             self.positions_cache = self.alpaca_client.get_positions()
+            self._positions_by_symbol = {p["symbol"]: p for p in self.positions_cache}
             
             # Update timestamp
-            self.last_update = datetime.now()
+            self._last_update_ns = self._now_ns()
             
-            # Update Account object if it exists
-            if "default" in self.accounts and self.account_cache:
-                account = self.accounts["default"]
-                account.equity = self.account_cache.get("equity", 0.0)
-                account.cash = self.account_cache.get("cash", 0.0)
-                account.buying_power = self.account_cache.get("buying_power", 0.0)
-                account.portfolio_value = self.account_cache.get("portfolio_value", 0.0)
-                account.pattern_day_trader = self.account_cache.get("pattern_day_trader", False)
-                account.trading_blocked = self.account_cache.get("trading_blocked", False)
-                account.account_blocked = self.account_cache.get("account_blocked", False)
+            # Swap in a fresh snapshot; readers see either the old or new one
+            if self.account_cache:
+                account = self._build_account(self.account_cache)
+                self.accounts["default"] = account
+                for listener in self._equity_listeners:
+                    listener(account.equity)
             
             logger.debug(
                 f"Account state updated: Equity=${self.account_cache.get('equity', 0):.2f}, "
@@ -116,14 +167,41 @@ class AccountManager:
             logger.error(f"Failed to update account state: {e}")
             # Don't raise - allow system to continue with stale data
     
+    @property
+    def equity(self) -> float:
+        """Cached equity from the last refresh (no staleness check)."""
+        account = self.accounts.get("default")
+        return account.equity if account is not None else 0.0
+
+    @property
+    def cash(self) -> float:
+        """Cached cash from the last refresh (no staleness check)."""
+        account = self.accounts.get("default")
+        return account.cash if account is not None else 0.0
+
+    @property
+    def daily_pnl(self) -> float:
+        """Cached daily P&L from the last refresh (no staleness check)."""
+        account = self.accounts.get("default")
+        return account.equity - account.last_equity if account is not None else 0.0
+
+    def _is_stale(self) -> bool:
+        """Return True if no data has been fetched yet or the cache TTL expired."""
+        stamp = self._last_update_ns
+        return stamp is None or (self._now_ns() - stamp) > self._update_interval_ns
+
     async def _ensure_fresh_data(self) -> None:
-        """Update data if cache is stale."""
-        if self.last_update is None:
-            # No data yet, fetch it
-            await self.update_state()
-        elif (datetime.now() - self.last_update).total_seconds() > self.update_interval:
-            # Cache is stale, refresh it
-            await self.update_state()
+        """
+        Update data if cache is stale.
+        
+        Concurrent callers share a single refresh: the first one through the
+        lock fetches, the rest re-check freshness and return.
+        """
+        if not self._is_stale():
+            return
+        async with self._refresh_lock:
+            if self._is_stale():
+                await self.update_state()
     
     async def get_equity(self) -> float:
         """
@@ -133,9 +211,8 @@ class AccountManager:
             Current equity as float
         """
         await self._ensure_fresh_data()
-        if self.account_cache:
-            return float(self.account_cache.get("equity", 0.0))
-        return 0.0
+        account = self.accounts.get("default")
+        return account.equity if account is not None else 0.0
     
     async def get_cash(self) -> float:
         """
@@ -145,9 +222,8 @@ class AccountManager:
             Available cash as float
         """
         await self._ensure_fresh_data()
-        if self.account_cache:
-            return float(self.account_cache.get("cash", 0.0))
-        return 0.0
+        account = self.accounts.get("default")
+        return account.cash if account is not None else 0.0
     
     async def get_buying_power(self) -> float:
         """
@@ -157,9 +233,19 @@ class AccountManager:
             Buying power as float
         """
         await self._ensure_fresh_data()
-        if self.account_cache:
-            return float(self.account_cache.get("buying_power", 0.0))
-        return 0.0
+        account = self.accounts.get("default")
+        return account.buying_power if account is not None else 0.0
+    
+    async def get_daily_pnl(self) -> float:
+        """
+        Get today's profit and loss (equity change since the previous close).
+        
+        Returns:
+            Daily P&L as float
+        """
+        await self._ensure_fresh_data()
+        account = self.accounts.get("default")
+        return account.equity - account.last_equity if account is not None else 0.0
     
     async def get_positions(self) -> List[Dict]:
         """
@@ -182,7 +268,4 @@ class AccountManager:
             Position dictionary or None if not found
         """
         await self._ensure_fresh_data()
-        for position in self.positions_cache:
-            if position["symbol"] == symbol:
-                return position
-        return None
+        return self._positions_by_symbol.get(symbol)
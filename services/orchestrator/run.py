@@ -5,28 +5,32 @@ Entry point for the autonomous trading system.
 from __future__ import annotations
 
 import asyncio
+import functools
+import hashlib
+import os
+import pickle
 import signal
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
 from dotenv import load_dotenv
 from loguru import logger
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional (unavailable on Windows)
+    uvloop = None
+
 from services.orchestrator.account_manager import AccountManager
 from services.orchestrator.state_manager import StateManager
 from services.risk_engine.risk_manager import RiskManager
-from services.strategies.crypto_momentum import CryptoMomentumStrategy
-from services.strategies.leveraged_etf import LeveragedETFStrategy
-from services.strategies.stock_swing import StockSwingStrategy
 from services.order_router.order_manager import OrderManager
 from services.data_feeds.market_data import MarketDataFeed
 from services.learning.performance_analyzer import PerformanceAnalyzer
-from services.jobs.daily_report import DailyReportJob
-from services.jobs.monday_allocation import MondayAllocationJob
-from services.jobs.eod_analysis import EODAnalysisJob
 from services.connectors.alpaca_client import AlpacaClient
 from services.connectors.connection_health_monitor import ConnectionHealthMonitor
 from services.connectors.websocket_client import WebSocketClient
@@ -35,6 +39,21 @@ from services.utils.config_validator import validate_config, ConfigValidationErr
 
 load_dotenv()
 
+CONFIG_CACHE_DIR = Path("runtime")
+
+# libyaml-backed loader; the pure-Python SafeLoader is several times slower
+if yaml.__with_libyaml__:
+    _YAML_LOADER = yaml.CSafeLoader
+else:
+    _YAML_LOADER = yaml.SafeLoader
+    logger.warning("libyaml not available - falling back to pure-Python YAML loader")
+
+
+@functools.lru_cache(maxsize=None)
+def _config_path(dotted: str) -> Tuple[str, ...]:
+    """Split a dotted config key once; repeated lookups reuse the tuple."""
+    return tuple(dotted.split("."))
+
 
 class PulseTraderOrchestrator:
     """
@@ -47,6 +66,15 @@ class PulseTraderOrchestrator:
         self.running = False
         self.shutdown_event = asyncio.Event()
 
+        # Preservation check runs only when equity moves by more than epsilon
+        self.equity_changed = asyncio.Event()
+        self._last_checked_equity: Optional[float] = None
+        self._equity_epsilon = self._cfg("emergency.preservation_mode.epsilon_bps", 5) / 10_000
+        self._tick_max_s = self._cfg("monitoring.tick_max_s", 1.0)
+
+        # Preservation mode is one-way; once entered the per-tick check is skipped
+        self._preservation_active = False
+
         self._setup_logging()
 
         # Validate configuration before initialization
@@ -65,9 +93,9 @@ class PulseTraderOrchestrator:
         # Initialize ConnectionHealthMonitor
         self.health_monitor = ConnectionHealthMonitor(
             alpaca_client=self.alpaca_client,
-            check_interval=self.config.get("monitoring", {}).get("health_check_interval", 60),
-            error_threshold=self.config.get("monitoring", {}).get("error_threshold", 5),
-            slow_response_threshold=self.config.get("monitoring", {}).get("slow_response_threshold", 5.0)
+            check_interval=self._cfg("monitoring.health_check_interval", 60),
+            error_threshold=self._cfg("monitoring.error_threshold", 5),
+            slow_response_threshold=self._cfg("monitoring.slow_response_threshold", 5.0)
         )
         # Set preservation mode callback
         self.health_monitor.set_preservation_mode_callback(self._enter_preservation_mode)
@@ -79,6 +107,7 @@ class PulseTraderOrchestrator:
 
         self.state_manager = StateManager()
         self.account_manager = AccountManager(self.config, self.alpaca_client)
+        self.account_manager.add_equity_listener(self._on_equity_update)
         self.risk_manager = RiskManager(self.config)
         self.market_data = MarketDataFeed(self.config, self.alpaca_client)
         self.order_manager = OrderManager(
@@ -91,19 +120,66 @@ class PulseTraderOrchestrator:
         self.performance_analyzer = PerformanceAnalyzer(self.config)
 
         self.strategies = self._initialize_strategies()
+        # Strategy set is fixed after initialization
+        self._active_strategies = tuple(self.strategies.items())
         self.jobs = self._initialize_jobs()
 
         logger.info("PulseTrader.01 Orchestrator initialized")
 
+    def _cfg(self, dotted: str, default: Any = None) -> Any:
+        """
+        Look up a nested config value by dotted key.
+        
+        Args:
+            dotted: Dotted key path (e.g., "monitoring.tick_max_s")
+            default: Value returned when any part of the path is missing
+            
+        Returns:
+            Config value at the path, or default
+        """
+        node: Any = self.config
+        for part in _config_path(dotted):
+            node = node.get(part) if isinstance(node, dict) else None
+            if node is None:
+                return default
+        return node
+
     def _load_config(self) -> Dict:
         if not self.config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
 
+        # Parsed config is cached as a pickle keyed by (path, mtime, size)
+        stat = self.config_path.stat()
+        path_key = hashlib.sha1(str(self.config_path.resolve()).encode("utf-8")).hexdigest()[:16]
+        cache_path = CONFIG_CACHE_DIR / f".cfg-{path_key}-{stat.st_mtime_ns}-{stat.st_size}.pkl"
+
+        if cache_path.exists():
+            try:
+                with cache_path.open("rb") as cache_handle:
+                    return pickle.load(cache_handle)
+            except Exception as exc:
+                logger.warning(f"Ignoring unreadable config cache {cache_path}: {exc}")
+
         with self.config_path.open("r", encoding="utf-8") as file_handle:
-            config = yaml.safe_load(file_handle)
+            config = yaml.load(file_handle, Loader=_YAML_LOADER)
 
+        self._write_config_cache(cache_path, path_key, config)
         return config
 
+    @staticmethod
+    def _write_config_cache(cache_path: Path, path_key: str, config: Dict) -> None:
+        try:
+            CONFIG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Drop caches for earlier versions of the same file
+            for stale in CONFIG_CACHE_DIR.glob(f".cfg-{path_key}-*.pkl"):
+                stale.unlink(missing_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            with tmp_path.open("wb") as cache_handle:
+                pickle.dump(config, cache_handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError as exc:
+            logger.debug(f"Config cache not written: {exc}")
+
     def _setup_logging(self) -> None:
         """
         Configure logging with support for LOG_LEVEL environment variable.
@@ -115,11 +191,9 @@ class PulseTraderOrchestrator:
         
         Valid log levels: TRACE, DEBUG, INFO, SUCCESS, WARNING, ERROR, CRITICAL
         """
-        import os
-        
         # Get log level from environment variable or config
         env_log_level = os.getenv("LOG_LEVEL")
-        config_log_level = self.config.get("logging", {}).get("level", "INFO")
+        config_log_level = self._cfg("logging.level", "INFO")
         
         # Environment variable takes precedence
         if env_log_level:
@@ -137,8 +211,7 @@ class PulseTraderOrchestrator:
             )
             log_level = "INFO"
         
-        log_config = self.config.get("logging", {})
-        log_dir = Path(log_config.get("file", {}).get("location", "logs"))
+        log_dir = Path(self._cfg("logging.file.location", "logs"))
 
         log_dir.mkdir(parents=True, exist_ok=True)
         (log_dir / "trades").mkdir(exist_ok=True)
@@ -157,6 +230,9 @@ class PulseTraderOrchestrator:
             level=log_level,
         )
 
+        # File sinks write from a background thread (enqueue) to keep I/O off the event loop.
+        # colorize=False with a static template lets loguru strip markup once at setup
+        # instead of per record.
         # Add system log file with configured level
         logger.add(
             log_dir / "system" / "pulsetrader_{time:YYYY-MM-DD}.log",
@@ -164,6 +240,10 @@ class PulseTraderOrchestrator:
             retention="90 days",
             level=log_level,
             format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function} - {message}",
+            colorize=False,
+            enqueue=True,
+            backtrace=False,
+            diagnose=False,
         )
 
         # Add trade log file (always DEBUG level for detailed trade tracking)
@@ -174,15 +254,22 @@ class PulseTraderOrchestrator:
             level="DEBUG",
             filter=lambda record: "trade" in record["extra"],
             format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {extra[trade_id]} | {message}",
+            colorize=False,
+            enqueue=True,
+            backtrace=False,
+            diagnose=False,
         )
         
         logger.info(f"Logging configured with level: {log_level}")
 
     def _initialize_strategies(self) -> Dict[str, object]:
         strategies: Dict[str, object] = {}
-        strategy_config = self.config.get("strategies", {})
+        strategy_config = self._cfg("strategies", {})
+
+        # Strategy and job modules are imported only when enabled
+        if self._cfg("strategies.crypto_momentum.enabled", False):
+            from services.strategies.crypto_momentum import CryptoMomentumStrategy
 
-        if strategy_config.get("crypto_momentum", {}).get("enabled", False):
             strategies["crypto_momentum"] = CryptoMomentumStrategy(
                 config=strategy_config["crypto_momentum"],
                 risk_manager=self.risk_manager,
@@ -191,7 +278,9 @@ class PulseTraderOrchestrator:
             )
             logger.info("Crypto Momentum Strategy initialized")
 
-        if strategy_config.get("leveraged_etf_trend", {}).get("enabled", False):
+        if self._cfg("strategies.leveraged_etf_trend.enabled", False):
+            from services.strategies.leveraged_etf import LeveragedETFStrategy
+
             strategies["leveraged_etf"] = LeveragedETFStrategy(
                 config=strategy_config["leveraged_etf_trend"],
                 risk_manager=self.risk_manager,
@@ -200,7 +289,9 @@ class PulseTraderOrchestrator:
             )
             logger.info("Leveraged ETF Strategy initialized")
 
-        if strategy_config.get("stock_swing", {}).get("enabled", False):
+        if self._cfg("strategies.stock_swing.enabled", False):
+            from services.strategies.stock_swing import StockSwingStrategy
+
             strategies["stock_swing"] = StockSwingStrategy(
                 config=strategy_config["stock_swing"],
                 risk_manager=self.risk_manager,
@@ -214,27 +305,27 @@ class PulseTraderOrchestrator:
     def _initialize_jobs(self) -> Dict[str, object]:
         jobs: Dict[str, object] = {}
 
-        if self.config.get("reporting", {}).get("daily", {}).get("enabled", False):
+        if self._cfg("reporting.daily.enabled", False):
+            from services.jobs.daily_report import DailyReportJob
+
             jobs["daily_report"] = DailyReportJob(
                 config=self.config,
                 account_manager=self.account_manager,
                 performance_analyzer=self.performance_analyzer,
             )
 
-        if (
-            self.config.get("accounts", {})
-            .get("default", {})
-            .get("dividend", {})
-            .get("monday_allocation", {})
-            .get("enabled", False)
-        ):
+        if self._cfg("accounts.default.dividend.monday_allocation.enabled", False):
+            from services.jobs.monday_allocation import MondayAllocationJob
+
             jobs["monday_allocation"] = MondayAllocationJob(
                 config=self.config,
                 account_manager=self.account_manager,
                 order_manager=self.order_manager,
             )
 
-        if self.config.get("learning", {}).get("eod_analysis", {}).get("enabled", False):
+        if self._cfg("learning.eod_analysis.enabled", False):
+            from services.jobs.eod_analysis import EODAnalysisJob
+
             jobs["eod_analysis"] = EODAnalysisJob(
                 config=self.config,
                 performance_analyzer=self.performance_analyzer,
@@ -248,11 +339,13 @@ class PulseTraderOrchestrator:
             logger.warning("System is already running")
             return
 
+        self._install_signal_handlers()
+
         logger.info("=" * 60)
         logger.info("PulseTrader.01 Starting...")
         logger.info("=" * 60)
 
-        if self.config.get("emergency", {}).get("kill_switch", {}).get("enabled", False):
+        if self._cfg("emergency.kill_switch.enabled", False):
             logger.critical("KILL SWITCH IS ENABLED - Trading is DISABLED")
             logger.critical("Set emergency.kill_switch.enabled to false in config to trade")
             return
@@ -261,32 +354,29 @@ class PulseTraderOrchestrator:
             await self.state_manager.load_state()
             await self.account_manager.initialize()
 
-            account = self.account_manager.get_primary_account()
-            equity = await account.get_equity()
-            logger.info(f"Current Equity: ${equity:,.2f}")
+            equity = await self.account_manager.get_equity()
+            logger.info("Current Equity: ${:,.2f}", equity)
 
             current_tier = self.risk_manager.get_current_tier(equity)
             logger.info(
-                "Current Tier: {name} (${min_equity:,.0f} - ${max_equity:,.0f})".format(
-                    name=current_tier["name"],
-                    min_equity=current_tier["range"][0],
-                    max_equity=current_tier["range"][1],
-                )
+                "Current Tier: {} (${:,.0f} - ${:,.0f})",
+                current_tier["name"],
+                current_tier["range"][0],
+                current_tier["range"][1],
             )
             logger.info(
-                "Risk Parameters: {min_pct:.1f}% - {max_pct:.1f}% per trade".format(
-                    min_pct=current_tier["per_trade_min"],
-                    max_pct=current_tier["per_trade_max"],
-                )
+                "Risk Parameters: {:.1f}% - {:.1f}% per trade",
+                current_tier["per_trade_min"],
+                current_tier["per_trade_max"],
             )
-            logger.info(f"Reserve: 20% (${equity * 0.20:,.2f}) - ALWAYS PROTECTED")
+            logger.opt(lazy=True).info("Reserve: 20% (${:,.2f}) - ALWAYS PROTECTED", lambda: equity * 0.20)
 
             pdt_unlocked = equity >= 25000
             if pdt_unlocked:
                 logger.info("✓ PDT UNLOCKED - Full trading capabilities enabled")
             else:
                 remaining = 25000 - equity
-                logger.info(f"⚠ PDT LOCKED - ${remaining:,.2f} remaining to unlock")
+                logger.info("⚠ PDT LOCKED - ${:,.2f} remaining to unlock", remaining)
                 logger.info("  Trading: Crypto + Leveraged ETFs only")
 
             milestone_floors = self.risk_manager.get_milestone_floors(equity)
@@ -300,9 +390,8 @@ class PulseTraderOrchestrator:
             await self.websocket_client.connect()
             logger.info("WebSocket client connected")
 
-            # Start connection health monitoring
-            await self.health_monitor.start()
-            logger.info("Connection health monitoring started")
+            # Connection health checks run on the main loop heartbeat (see _run_loop)
+            logger.info("Connection health monitoring scheduled on main loop")
 
             for name, strategy in self.strategies.items():
                 if hasattr(strategy, "min_equity_required"):
@@ -338,54 +427,88 @@ class PulseTraderOrchestrator:
                 if self.shutdown_event.is_set():
                     break
 
-                await self.account_manager.update_state()
+                await self.health_monitor.poll()
 
-                for name, strategy in self.strategies.items():
-                    if strategy.is_running:
-                        try:
-                            await strategy.evaluate()
-                        except Exception as exc:
-                            logger.error(f"Error in strategy '{name}': {exc}")
+                # Refresh once per tick, then read the snapshot synchronously
+                account_manager = self.account_manager
+                await account_manager.update_state()
+                equity = account_manager.equity
+                positions = account_manager.positions_cache
+                daily_pnl = account_manager.daily_pnl
 
-                if await self.risk_manager.should_enter_preservation_mode(
-                    current_equity=await self.account_manager.get_primary_account().get_equity()
-                ):
-                    logger.warning("Entering Capital Preservation Mode")
-                    await self._enter_preservation_mode()
+                # Evaluate running strategies concurrently; one failure doesn't block the rest
+                running = [(name, strategy) for name, strategy in self._active_strategies if strategy.is_running]
+                results = await asyncio.gather(
+                    *(strategy.evaluate() for _, strategy in running),
+                    return_exceptions=True,
+                )
+                for (name, _), result in zip(running, results):
+                    if isinstance(result, Exception):
+                        logger.error("Error in strategy '{}': {}", name, result)
+
+                if self.equity_changed.is_set():
+                    self.equity_changed.clear()
+                    self._last_checked_equity = equity
+                    if not self._preservation_active and await self.risk_manager.should_enter_preservation_mode(
+                        current_equity=equity
+                    ):
+                        logger.warning("Entering Capital Preservation Mode")
+                        await self._enter_preservation_mode()
 
                 await self.state_manager.save_state(
                     {
                         "timestamp": datetime.now().isoformat(),
-                        "equity": await self.account_manager.get_primary_account().get_equity(),
-                        "positions": await self.account_manager.get_primary_account().get_positions(),
-                        "daily_pnl": await self.account_manager.get_primary_account().get_daily_pnl(),
+                        "equity": equity,
+                        "positions": positions,
+                        "daily_pnl": daily_pnl,
                     }
                 )
 
-                await asyncio.sleep(1)
+                # Sleep until shutdown, an equity move, or the max tick interval
+                await self._wait_for_next_tick()
 
         except asyncio.CancelledError:
             logger.info("Event loop cancelled")
         except Exception as exc:
-            logger.exception(f"Error in main loop: {exc}")
+            logger.exception("Error in main loop: {}", exc)
             raise
 
-    async def _enter_preservation_mode(self) -> None:
-        preservation_config = self.config.get("emergency", {}).get("preservation_mode", {})
+    def _on_equity_update(self, equity: float) -> None:
+        if self._preservation_active:
+            return
+        last = self._last_checked_equity
+        if last is None or abs(equity - last) > abs(last) * self._equity_epsilon:
+            self.equity_changed.set()
+
+    async def _wait_for_next_tick(self) -> None:
+        # One wakeup serves both the tick cadence and the next health check
+        timeout = min(self._tick_max_s, max(0.0, self.health_monitor.next_check_at - time.monotonic()))
+        waiters = {
+            asyncio.ensure_future(self.shutdown_event.wait()),
+            asyncio.ensure_future(self.equity_changed.wait()),
+        }
+        try:
+            await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
 
-        if preservation_config.get("behavior", {}).get("disable_new_entries", False):
+    async def _enter_preservation_mode(self) -> None:
+        if self._cfg("emergency.preservation_mode.behavior.disable_new_entries", False):
             for strategy in self.strategies.values():
                 strategy.disable_new_entries()
             logger.warning("New entries DISABLED")
 
-        if preservation_config.get("behavior", {}).get("close_losing_positions", False):
+        if self._cfg("emergency.preservation_mode.behavior.close_losing_positions", False):
             await self.order_manager.close_losing_positions()
             logger.warning("Closing losing positions")
 
-        if preservation_config.get("behavior", {}).get("tighten_stops", False):
+        if self._cfg("emergency.preservation_mode.behavior.tighten_stops", False):
             await self.order_manager.tighten_all_stops()
             logger.warning("Tightening all stop losses")
 
+        self._preservation_active = True
+
     async def stop(self) -> None:
         if not self.running:
             logger.warning("System is not running")
@@ -398,51 +521,70 @@ class PulseTraderOrchestrator:
         self.running = False
         self.shutdown_event.set()
 
+        deadline = self._cfg("emergency.shutdown_deadline_s", 30)
         try:
-            for name, strategy in self.strategies.items():
-                await strategy.stop()
-                logger.info(f"Strategy '{name}' stopped")
-
-            # Stop connection health monitoring
-            await self.health_monitor.stop()
-            logger.info("Connection health monitoring stopped")
-
-            # Disconnect WebSocket client
-            await self.websocket_client.disconnect()
-            logger.info("WebSocket client disconnected")
-
-            if self.config.get("emergency", {}).get("close_positions_on_shutdown", False):
-                await self.order_manager.close_all_positions()
-                logger.info("All positions closed")
-
-            await self.market_data.disconnect()
-            logger.info("Market data disconnected")
-
-            await self.state_manager.save_state(
-                {
-                    "timestamp": datetime.now().isoformat(),
-                    "shutdown_reason": "manual",
-                    "final_equity": await self.account_manager.get_primary_account().get_equity(),
-                }
-            )
-
+            await asyncio.wait_for(self._shutdown_components(), timeout=deadline)
             logger.info("PulseTrader.01 stopped successfully")
-
+        except asyncio.TimeoutError:
+            logger.error(f"Shutdown did not finish within {deadline}s; exiting anyway")
         except Exception as exc:
             logger.exception(f"Error during shutdown: {exc}")
             raise
-
-    def handle_signal(self, signum, frame) -> None:
-        logger.info(f"Received signal {signum}, initiating shutdown...")
-        asyncio.create_task(self.stop())
+        finally:
+            # Drain queued file-sink writes before exit
+            await logger.complete()
+
+    async def _shutdown_components(self) -> None:
+        # Wave A: independent components stop concurrently
+        names = [f"Strategy '{name}'" for name in self.strategies]
+        names.append("WebSocket client")
+        results = await asyncio.gather(
+            *(strategy.stop() for strategy in self.strategies.values()),
+            self.websocket_client.disconnect(),
+            return_exceptions=True,
+        )
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                logger.error(f"{name} failed to stop: {result}")
+            else:
+                logger.info(f"{name} stopped")
+
+        # Wave B: order matters (close positions while market data is still up)
+        if self._cfg("emergency.close_positions_on_shutdown", False):
+            await self.order_manager.close_all_positions()
+            logger.info("All positions closed")
+
+        await self.market_data.disconnect()
+        logger.info("Market data disconnected")
+
+        await self.state_manager.save_state(
+            {
+                "timestamp": datetime.now().isoformat(),
+                "shutdown_reason": "manual",
+                "final_equity": await self.account_manager.get_equity(),
+            }
+        )
+        await self.state_manager.flush()
+
+    def _install_signal_handlers(self) -> None:
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signum, self._on_signal, signum)
+            except NotImplementedError:
+                # Event-loop signal handlers are unavailable on Windows
+                logger.warning(f"Cannot install handler for {signum.name} on this platform")
+
+    def _on_signal(self, signum: signal.Signals) -> None:
+        # Only wake the main loop; main() runs stop() once start() returns, so the
+        # full shutdown is awaited rather than cancelled with the event loop
+        logger.info(f"Received signal {signum.name}, initiating shutdown...")
+        self.shutdown_event.set()
 
 
 async def main() -> None:
     orchestrator = PulseTraderOrchestrator()
 
-    signal.signal(signal.SIGINT, orchestrator.handle_signal)
-    signal.signal(signal.SIGTERM, orchestrator.handle_signal)
-
     try:
         await orchestrator.start()
     except KeyboardInterrupt:
@@ -452,4 +594,6 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main())
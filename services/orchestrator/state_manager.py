@@ -1,18 +1,29 @@
 """State persistence for PulseTrader.01."""
 from __future__ import annotations
 
-import json
+import asyncio
+import os
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
+import orjson
 from loguru import logger
 
 
 class StateManager:
     """Handle runtime state persistence."""
 
-    def __init__(self, state_path: str = "runtime/state.json") -> None:
+    def __init__(self, state_path: str = "runtime/state.json", min_interval: float = 1.0) -> None:
         self.state_path = Path(state_path)
+        self.min_interval = min_interval
+
+        # Latest unsaved snapshot; older snapshots are overwritten (coalesced)
+        self._pending: Optional[Dict[str, Any]] = None
+        self._dirty = asyncio.Event()
+        self._writer_task: Optional[asyncio.Task] = None
+        # A write already handed to a thread finishes even if the writer task is
+        # cancelled; flush() waits on it so two writes never share the temp file
+        self._inflight: Optional[asyncio.Future] = None
 
     async def load_state(self) -> Dict[str, Any]:
         """Load persisted state if available."""
@@ -21,15 +32,62 @@ class StateManager:
             return {}
 
         try:
-            data = json.loads(self.state_path.read_text())
+            data = orjson.loads(self.state_path.read_bytes())
             logger.info("Runtime state loaded")
             return data
-        except json.JSONDecodeError as exc:
+        except orjson.JSONDecodeError as exc:
             logger.warning(f"Failed to parse state file: {exc}")
             return {}
 
     async def save_state(self, state: Dict[str, Any]) -> None:
-        """Persist runtime state to disk."""
+        """
+        Schedule runtime state to be persisted.
+
+        The write happens on a background task at most once per min_interval;
+        if several snapshots arrive in between, only the latest is written.
+        """
+        self._pending = state
+        self._dirty.set()
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._writer_loop())
+
+    async def flush(self) -> None:
+        """Stop the background writer and persist any pending snapshot."""
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
+        if self._inflight is not None:
+            try:
+                await self._inflight
+            except Exception as exc:
+                logger.error(f"Failed to save runtime state: {exc}")
+            self._inflight = None
+
+        state, self._pending = self._pending, None
+        self._dirty.clear()
+        if state is not None:
+            await asyncio.to_thread(self._write, state)
+
+    async def _writer_loop(self) -> None:
+        while True:
+            await self._dirty.wait()
+            self._dirty.clear()
+            state, self._pending = self._pending, None
+            if state is not None:
+                self._inflight = asyncio.ensure_future(asyncio.to_thread(self._write, state))
+                try:
+                    await asyncio.shield(self._inflight)
+                except Exception as exc:
+                    logger.error(f"Failed to save runtime state: {exc}")
+            await asyncio.sleep(self.min_interval)
+
+    def _write(self, state: Dict[str, Any]) -> None:
         self.state_path.parent.mkdir(parents=True, exist_ok=True)
-        self.state_path.write_text(json.dumps(state, indent=2))
+        tmp_path = self.state_path.with_suffix(".tmp")
+        tmp_path.write_bytes(orjson.dumps(state, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        os.replace(tmp_path, self.state_path)
         logger.debug("Runtime state saved")
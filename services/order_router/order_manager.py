@@ -1,15 +1,37 @@
 """Order lifecycle management."""
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Dict, Optional
+import asyncio
+import itertools
+import time
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional
 
 from loguru import logger
 
+# Known leveraged ETFs
+LEVERAGED_ETFS = frozenset({
+    "TQQQ", "SQQQ", "SPXL", "SPXS", "SOXL", "SOXS",
+    "UDOW", "SDOW", "TNA", "TZA", "UPRO", "SPXU"
+})
+
 
 class OrderManager:
     """Order manager with real Alpaca execution."""
 
+    __slots__ = (
+        "config",
+        "alpaca_client",
+        "account_manager",
+        "market_data",
+        "risk_manager",
+        "order_cache",
+        "_cache_max",
+        "_client_id_prefix",
+        "_client_id_seq",
+    )
+
     def __init__(
         self,
         config: Dict,
@@ -34,8 +56,14 @@ class OrderManager:
         self.market_data = market_data
         self.risk_manager = risk_manager
         
-        # Order cache for quick lookup
-        self.order_cache: Dict[str, Dict] = {}
+        # Order cache for quick lookup, bounded with least-recently-updated eviction
+        self.order_cache: OrderedDict[str, Dict] = OrderedDict()
+        self._cache_max = config.get("execution", {}).get("order_cache_size", 4096)
+        
+        # Client order ID prefix, resolved once per session
+        self._client_id_prefix = config.get("execution", {}).get("client_order_id", {}).get("prefix", "pt01")
+        # Per-instance sequence keeps IDs unique within the same millisecond
+        self._client_id_seq = itertools.count()
 
     async def get_account_equity(self) -> float:
         """
@@ -58,6 +86,18 @@ class OrderManager:
         """
         return await self.market_data.get_current_price(symbol)
 
+    async def get_current_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """
+        Get current prices for several symbols in one batched request.
+        
+        Args:
+            symbols: Symbols to get prices for
+            
+        Returns:
+            Dictionary mapping symbol to price (symbols without data omitted)
+        """
+        return await self.market_data.get_current_prices(symbols)
+
     async def get_previous_close(self, symbol: str) -> Optional[float]:
         """
         Get previous close for a symbol.
@@ -93,11 +133,12 @@ class OrderManager:
         Returns:
             Order dictionary if successful, None if rejected or failed
         """
-        # Get current equity for risk validation
-        equity = await self.get_account_equity()
-        
-        # Get current price for trade value calculation
-        current_price = await self.get_current_price(symbol)
+        # Fetch equity, price and positions concurrently; they are independent
+        equity, current_price, positions = await asyncio.gather(
+            self.get_account_equity(),
+            self.get_current_price(symbol),
+            self.account_manager.get_positions()
+        )
         
         if current_price is None:
             logger.error(f"Cannot submit order for {symbol}: no price data available")
@@ -106,43 +147,167 @@ class OrderManager:
         # Calculate trade value
         trade_value = qty * current_price
         
-        # Determine asset type
-        asset_type = self._get_asset_type(symbol)
-        
         # Get current position counts by type
-        positions = await self.account_manager.get_positions()
         position_counts = self._count_positions_by_type(positions)
         
-        # Validate trade with risk manager
+        if not self._passes_risk_check(
+            symbol, side, order_type, qty, strategy, equity, trade_value, position_counts
+        ):
+            return None
+        
+        return await self._send_order(
+            symbol, side, order_type, qty, strategy, limit_price, trade_value, current_price
+        )
+
+    async def submit_orders(self, orders: List[Dict]) -> List[Optional[Dict]]:
+        """
+        Submit several orders with one round of pre-trade data fetching.
+        
+        Equity, positions and prices are fetched once for the whole batch,
+        every order is risk-validated first, and the accepted orders are then
+        sent to Alpaca concurrently.
+        
+        Args:
+            orders: Order requests, each a dictionary of submit_order keyword
+                arguments (symbol, side, order_type, qty, strategy and
+                optionally limit_price)
+            
+        Returns:
+            List aligned with orders: the order dictionary where submitted,
+            None where rejected or failed
+        """
+        results: List[Optional[Dict]] = [None] * len(orders)
+        if not orders:
+            return results
+        
+        equity, prices, positions = await asyncio.gather(
+            self.get_account_equity(),
+            self.get_current_prices(list(dict.fromkeys(o["symbol"] for o in orders))),
+            self.account_manager.get_positions()
+        )
+        position_counts = self._count_positions_by_type(positions)
+        
+        accepted = []
+        for index, request in enumerate(orders):
+            symbol = request["symbol"]
+            current_price = prices.get(symbol)
+            if current_price is None:
+                logger.error(f"Cannot submit order for {symbol}: no price data available")
+                continue
+            
+            trade_value = request["qty"] * current_price
+            if self._passes_risk_check(
+                symbol, request["side"], request["order_type"], request["qty"], request["strategy"],
+                equity, trade_value, position_counts
+            ):
+                accepted.append((index, request, trade_value, current_price))
+                # Later orders in the batch are validated against the positions
+                # the accepted buys will open
+                if request["side"] == "buy":
+                    position_counts[self._get_asset_type(symbol)] += 1
+        
+        sent = await asyncio.gather(
+            *(
+                self._send_order(
+                    request["symbol"], request["side"], request["order_type"], request["qty"],
+                    request["strategy"], request.get("limit_price"), trade_value, current_price
+                )
+                for _, request, trade_value, current_price in accepted
+            )
+        )
+        for (index, _, _, _), order in zip(accepted, sent):
+            results[index] = order
+        
+        return results
+
+    def _passes_risk_check(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        qty: int,
+        strategy: str,
+        equity: float,
+        trade_value: float,
+        position_counts: Dict[str, int]
+    ) -> bool:
+        """
+        Validate a proposed order with the risk manager, logging rejections.
+        
+        Args:
+            symbol: Symbol to trade
+            side: Order side ("buy" or "sell")
+            order_type: Order type ("market", "limit", or "stop")
+            qty: Order quantity
+            strategy: Strategy name for tracking
+            equity: Current account equity
+            trade_value: Quantity times current price
+            position_counts: Open position counts by asset type
+            
+        Returns:
+            True if the order may be submitted
+        """
         is_valid, reasons = self.risk_manager.validate_trade(
             equity=equity,
             proposed_trade_value=trade_value,
-            asset_type=asset_type,
+            asset_type=self._get_asset_type(symbol),
             current_positions=position_counts
         )
         
         if not is_valid:
             # Log order rejection with detailed reasons
             logger.warning(
-                f"Order REJECTED for {symbol}: {side.upper()} {qty} shares @ {order_type.upper()} "
-                f"(Strategy: {strategy}, Reasons: {', '.join(reasons)})"
+                "Order REJECTED for {}: {} {} shares @ {} (Strategy: {}, Reasons: {})",
+                symbol, side.upper(), qty, order_type.upper(), strategy, ", ".join(reasons)
             )
-            return None
         
+        return is_valid
+
+    async def _send_order(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        qty: int,
+        strategy: str,
+        limit_price: Optional[float],
+        trade_value: float,
+        current_price: float
+    ) -> Optional[Dict]:
+        """
+        Send a validated order to Alpaca and cache the result.
+        
+        The blocking Alpaca call runs in a worker thread so several orders
+        can be in flight at once.
+        
+        Args:
+            symbol: Symbol to trade
+            side: Order side ("buy" or "sell")
+            order_type: Order type ("market", "limit", or "stop")
+            qty: Order quantity
+            strategy: Strategy name for tracking
+            limit_price: Limit price for limit orders (optional)
+            trade_value: Quantity times current price, for logging
+            current_price: Current price, for logging
+            
+        Returns:
+            Order dictionary if successful, None if failed
+        """
         # Generate client order ID for idempotency
         client_order_id = self._generate_client_order_id(symbol, strategy)
         
         # Log order submission attempt with full details
+        # Positional args: loguru formats the message only if a sink accepts it
         logger.info(
-            f"Submitting order: {side.upper()} {qty} {symbol} @ {order_type.upper()} "
-            f"(Strategy: {strategy}, Trade Value: ${trade_value:.2f}, "
-            f"Current Price: ${current_price:.2f}"
-            f"{f', Limit Price: ${limit_price:.2f}' if limit_price else ''})"
+            "Submitting order: {} {} {} @ {} (Strategy: {}, Trade Value: ${:.2f}, Current Price: ${:.2f}{})",
+            side.upper(), qty, symbol, order_type.upper(), strategy, trade_value, current_price,
+            f", Limit Price: ${limit_price:.2f}" if limit_price else ""
         )
         
         # Submit order via AlpacaClient
         try:
-            order = self.alpaca_client.submit_order(
+            order = await asyncio.to_thread(
+                self.alpaca_client.submit_order,
                 symbol=symbol,
                 side=side,
                 order_type=order_type,
@@ -153,13 +318,14 @@ class OrderManager:
             
             if order:
                 # Cache the order
-                self.order_cache[order["id"]] = order
+                self._cache_order(order["id"], order)
                 
                 # Log successful submission with order details
                 logger.info(
-                    f"Order SUBMITTED successfully: {side.upper()} {qty} {symbol} @ {order_type.upper()} "
-                    f"(Order ID: {order['id']}, Client ID: {client_order_id}, "
-                    f"Status: {order['status']}, Strategy: {strategy})"
+                    "Order SUBMITTED successfully: {} {} {} @ {} "
+                    "(Order ID: {}, Client ID: {}, Status: {}, Strategy: {})",
+                    side.upper(), qty, symbol, order_type.upper(),
+                    order["id"], client_order_id, order["status"], strategy
                 )
                 
                 # Check if order is already filled and log fill details
@@ -257,13 +423,20 @@ class OrderManager:
                 logger.info(f"Found {len(losing_positions)} losing positions to close")
                 
                 for position in losing_positions:
-                    symbol = position["symbol"]
                     unrealized_pl = float(position.get("unrealized_pl", 0))
                     logger.info(
-                        f"Closing losing position: {symbol} "
+                        f"Closing losing position: {position['symbol']} "
                         f"(Unrealized P/L: ${unrealized_pl:.2f})"
                     )
-                    await self.close_position(symbol)
+                
+                # Close concurrently; one failure doesn't stop the others
+                results = await asyncio.gather(
+                    *(self.close_position(position["symbol"]) for position in losing_positions),
+                    return_exceptions=True
+                )
+                for position, result in zip(losing_positions, results):
+                    if isinstance(result, Exception):
+                        logger.error(f"Error closing losing position {position['symbol']}: {result}")
             else:
                 logger.info("No losing positions found to close")
                     
@@ -278,7 +451,8 @@ class OrderManager:
         """Close all open positions."""
         try:
             logger.info("Closing all open positions...")
-            results = self.alpaca_client.close_all_positions()
+            # Blocking REST call runs off the event loop
+            results = await asyncio.to_thread(self.alpaca_client.close_all_positions)
             
             # Log details about each close order
             for order in results:
@@ -295,9 +469,11 @@ class OrderManager:
         except Exception as e:
             logger.error(f"Error closing all positions: {e}")
 
-    def _get_asset_type(self, symbol: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _get_asset_type(symbol: str) -> str:
         """
-        Determine asset type from symbol.
+        Determine asset type from symbol (memoized per symbol).
         
         Args:
             symbol: Symbol to classify
@@ -309,13 +485,7 @@ class OrderManager:
         if "/" in symbol:
             return "crypto"
         
-        # Known leveraged ETFs
-        leveraged_etfs = [
-            "TQQQ", "SQQQ", "SPXL", "SPXS", "SOXL", "SOXS",
-            "UDOW", "SDOW", "TNA", "TZA", "UPRO", "SPXU"
-        ]
-        
-        if symbol in leveraged_etfs:
+        if symbol in LEVERAGED_ETFS:
             return "etf"
         
         # Default to stock
@@ -331,13 +501,8 @@ class OrderManager:
         Returns:
             Dictionary with counts by asset type
         """
-        counts = {"crypto": 0, "etf": 0, "stock": 0}
-        
-        for position in positions:
-            asset_type = self._get_asset_type(position["symbol"])
-            counts[asset_type] += 1
-        
-        return counts
+        counts = Counter(map(self._get_asset_type, [position["symbol"] for position in positions]))
+        return {"crypto": counts["crypto"], "etf": counts["etf"], "stock": counts["stock"]}
 
     def _generate_client_order_id(self, symbol: str, strategy: str) -> str:
         """
@@ -350,14 +515,26 @@ class OrderManager:
         Returns:
             Unique client order ID
         """
-        # Get prefix from config or use default
-        prefix = self.config.get("execution", {}).get("client_order_id", {}).get("prefix", "pt01")
-        
-        # Generate timestamp in milliseconds
-        timestamp = int(datetime.now().timestamp() * 1000)
+        # Format: prefix_strategy_symbol_timestamp-sequence (milliseconds since epoch)
+        return (
+            f"{self._client_id_prefix}_{strategy}_{symbol}_"
+            f"{time.time_ns() // 1_000_000}-{next(self._client_id_seq)}"
+        )
+
+    def _cache_order(self, order_id: str, order: Dict) -> None:
+        """
+        Store an order in the cache, evicting the least recently updated
+        entries beyond the configured size.
         
-        # Format: prefix_strategy_symbol_timestamp
-        return f"{prefix}_{strategy}_{symbol}_{timestamp}"
+        Args:
+            order_id: Alpaca order ID
+            order: Order dictionary
+        """
+        cache = self.order_cache
+        cache[order_id] = order
+        cache.move_to_end(order_id)
+        while len(cache) > self._cache_max:
+            cache.popitem(last=False)
 
     def _log_order_fill(self, order: Dict) -> None:
         """
@@ -400,11 +577,11 @@ class OrderManager:
             Order dictionary with current status, or None if not found
         """
         try:
-            order = self.alpaca_client.get_order(order_id)
+            order = await asyncio.to_thread(self.alpaca_client.get_order, order_id)
             
             if order:
                 # Update cache
-                self.order_cache[order_id] = order
+                self._cache_order(order_id, order)
                 
                 # Log fill information if order is filled or partially filled
                 if order['status'] in ['filled', 'partially_filled']:
@@ -1,13 +1,9 @@
 """Drawdown monitoring helper."""
 from __future__ import annotations
 
-from decimal import Decimal
 
-
-def calculate_drawdown(start_equity: float, current_equity: float) -> Decimal:
+def calculate_drawdown(start_equity: float, current_equity: float) -> float:
     """Calculate drawdown percentage."""
-    start = Decimal(str(start_equity))
-    current = Decimal(str(current_equity))
-    if start == 0:
-        return Decimal("0")
-    return ((start - current) / start) * Decimal("100")
+    if start_equity == 0:
+        return 0.0
+    return (start_equity - current_equity) / start_equity * 100.0
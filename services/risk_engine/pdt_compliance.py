@@ -4,34 +4,74 @@ Enforces PDT rules and manages pre/post PDT behavior.
 """
 from __future__ import annotations
 
+import bisect
+from collections import deque
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import Dict, List, Tuple
+from typing import Deque, Dict, List, Tuple
 
 from loguru import logger
 
 
+@dataclass(slots=True, frozen=True)
+class DayTrade:
+    """A recorded same-day round trip."""
+
+    symbol: str
+    date: str
+    date_ord: int
+    entry_time: str
+    exit_time: str
+
+
 class PDTComplianceManager:
     """
     Manages Pattern Day Trading compliance.
     """
 
+    __slots__ = (
+        "config",
+        "pdt_config",
+        "enabled",
+        "_disable_stock_trading",
+        "_focus_assets_pre",
+        "_pre_pdt_min_hold",
+        "_post_pdt_remove_hold",
+        "day_trades",
+        "stock_entry_times",
+    )
+
     PDT_THRESHOLD = Decimal("25000.00")
+    # Float copy for hot-path comparisons; equity from Alpaca is already a float
+    _PDT_THRESHOLD_F: float = float(PDT_THRESHOLD)
     MAX_DAY_TRADES = 3
     ROLLING_WINDOW_DAYS = 5
 
     def __init__(self, config: Dict) -> None:
         self.config = config
-        self.pdt_config = config.get("pdt", {})
-        self.enabled = self.pdt_config.get("enabled", True)
+        self.invalidate_config()
 
-        self.day_trades: List[Dict] = []
+        # Kept in entry-date order so aged trades are evicted from the head
+        self.day_trades: Deque[DayTrade] = deque()
         self.stock_entry_times: Dict[str, datetime] = {}
 
         logger.info("PDT Compliance Manager initialized")
 
+    def invalidate_config(self) -> None:
+        """Re-resolve the PDT settings used by the gate checks from self.config."""
+        self.pdt_config = self.config.get("pdt", {})
+        self.enabled = self.pdt_config.get("enabled", True)
+
+        pre = self.pdt_config.get("pre_pdt", {})
+        post = self.pdt_config.get("post_pdt", {})
+        self._disable_stock_trading = pre.get("disable_stock_trading", True)
+        self._focus_assets_pre = tuple(pre.get("focus_assets", ("crypto", "leveraged_etf")))
+        self._pre_pdt_min_hold = timedelta(days=pre.get("min_stock_hold_days", 1))
+        self._post_pdt_remove_hold = post.get("remove_hold_restrictions", False)
+
     def is_pdt_unlocked(self, equity: float) -> bool:
-        return Decimal(str(equity)) >= self.PDT_THRESHOLD
+        return equity >= self._PDT_THRESHOLD_F
 
     def get_remaining_day_trades(self, equity: float) -> int:
         if self.is_pdt_unlocked(equity):
@@ -43,24 +83,30 @@ class PDTComplianceManager:
         return remaining
 
     def _clean_old_day_trades(self) -> None:
-        cutoff_date = date.today() - timedelta(days=self.ROLLING_WINDOW_DAYS)
+        # Integer day ordinals avoid re-parsing the ISO dates on every call
+        cutoff = (date.today() - timedelta(days=self.ROLLING_WINDOW_DAYS)).toordinal()
 
-        self.day_trades = [
-            day_trade
-            for day_trade in self.day_trades
-            if datetime.fromisoformat(day_trade["date"]).date() > cutoff_date
-        ]
+        day_trades = self.day_trades
+        while day_trades and day_trades[0].date_ord <= cutoff:
+            day_trades.popleft()
 
     def record_day_trade(self, symbol: str, entry_time: datetime, exit_time: datetime) -> None:
         if entry_time.date() == exit_time.date():
-            day_trade = {
-                "symbol": symbol,
-                "date": entry_time.date().isoformat(),
-                "entry_time": entry_time.isoformat(),
-                "exit_time": exit_time.isoformat(),
-            }
-
-            self.day_trades.append(day_trade)
+            entry_date = entry_time.date()
+            day_trade = DayTrade(
+                symbol,
+                entry_date.isoformat(),
+                entry_date.toordinal(),
+                entry_time.isoformat(),
+                exit_time.isoformat(),
+            )
+
+            if self.day_trades and day_trade.date_ord < self.day_trades[-1].date_ord:
+                # Backfilled trade: insert in date order to keep head eviction valid
+                ordinals = [trade.date_ord for trade in self.day_trades]
+                self.day_trades.insert(bisect.bisect_right(ordinals, day_trade.date_ord), day_trade)
+            else:
+                self.day_trades.append(day_trade)
             logger.warning(
                 f"Day trade recorded: {symbol} on {entry_time.date()} "
                 f"({len(self.day_trades)}/{self.MAX_DAY_TRADES})"
@@ -103,38 +149,40 @@ class PDTComplianceManager:
         return True, "Not a day trade"
 
     def is_stock_trading_allowed(self, equity: float) -> Tuple[bool, str]:
-        pre_pdt_config = self.pdt_config.get("pre_pdt", {})
+        if not self.enabled:
+            return True, "PDT compliance disabled"
 
         if self.is_pdt_unlocked(equity):
             return True, "PDT unlocked - stock trading enabled"
 
-        if pre_pdt_config.get("disable_stock_trading", True):
+        if self._disable_stock_trading:
             reason = "Stock trading disabled until equity >= $25k (PDT optimization)"
             return False, reason
 
         return True, "Stock trading allowed with restrictions"
 
     def record_stock_entry(self, symbol: str) -> None:
-        self.stock_entry_times[symbol] = datetime.now()
-        logger.debug(f"Stock entry recorded: {symbol} at {datetime.now()}")
+        now = datetime.now()
+        self.stock_entry_times[symbol] = now
+        logger.debug("Stock entry recorded: {} at {}", symbol, now)
 
     def remove_stock_entry(self, symbol: str) -> None:
         if symbol in self.stock_entry_times:
             del self.stock_entry_times[symbol]
-            logger.debug(f"Stock entry removed: {symbol}")
+            logger.debug("Stock entry removed: {}", symbol)
 
     def get_minimum_hold_time(self, equity: float) -> timedelta:
         if self.is_pdt_unlocked(equity):
-            post_pdt_config = self.pdt_config.get("post_pdt", {})
-            if post_pdt_config.get("remove_hold_restrictions", False):
+            if self._post_pdt_remove_hold:
                 return timedelta(seconds=0)
             return timedelta(days=1)
 
-        pre_pdt_config = self.pdt_config.get("pre_pdt", {})
-        min_hold_days = pre_pdt_config.get("min_stock_hold_days", 1)
-        return timedelta(days=min_hold_days)
+        return self._pre_pdt_min_hold
 
     def can_exit_stock_position(self, equity: float, symbol: str) -> Tuple[bool, str]:
+        if not self.enabled:
+            return True, "PDT compliance disabled"
+
         if symbol not in self.stock_entry_times:
             return True, "No entry time on record"
 
@@ -152,20 +200,19 @@ class PDTComplianceManager:
         return self.can_close_position_today(equity, symbol, entry_time)
 
     def get_focus_assets(self, equity: float) -> List[str]:
-        if self.is_pdt_unlocked(equity):
+        if not self.enabled or self.is_pdt_unlocked(equity):
             return ["crypto", "etf", "stock"]
 
-        pre_pdt_config = self.pdt_config.get("pre_pdt", {})
-        return pre_pdt_config.get("focus_assets", ["crypto", "leveraged_etf"])
+        return list(self._focus_assets_pre)
 
     def get_status_report(self, equity: float) -> Dict:
         is_unlocked = self.is_pdt_unlocked(equity)
-        remaining_to_unlock = max(0, float(self.PDT_THRESHOLD - Decimal(str(equity))))
+        remaining_to_unlock = max(0.0, self._PDT_THRESHOLD_F - equity)
 
         report = {
             "pdt_unlocked": is_unlocked,
             "equity": equity,
-            "pdt_threshold": float(self.PDT_THRESHOLD),
+            "pdt_threshold": self._PDT_THRESHOLD_F,
             "remaining_to_unlock": remaining_to_unlock,
             "focus_assets": self.get_focus_assets(equity),
             "stock_trading_allowed": self.is_stock_trading_allowed(equity)[0],
@@ -174,6 +221,15 @@ class PDTComplianceManager:
         if not is_unlocked:
             report["day_trades_remaining"] = self.get_remaining_day_trades(equity)
             report["day_trades_used"] = len(self.day_trades)
-            report["day_trades_history"] = self.day_trades
+            # date_ord is an internal eviction key and stays out of the report
+            report["day_trades_history"] = [
+                {
+                    "symbol": day_trade.symbol,
+                    "date": day_trade.date,
+                    "entry_time": day_trade.entry_time,
+                    "exit_time": day_trade.exit_time,
+                }
+                for day_trade in self.day_trades
+            ]
 
         return report
@@ -4,8 +4,9 @@ Enforces the MANDATORY 20% reserve and tier-based risk parameters.
 """
 from __future__ import annotations
 
-from datetime import date, datetime
-from decimal import Decimal
+import time
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, time as dt_time, timedelta
 from typing import Dict, List, Optional, Tuple
 
 from loguru import logger
@@ -16,53 +17,76 @@ class RiskManager:
     Core risk management system for PulseTrader.01.
     """
 
-    RESERVE_PERCENTAGE = Decimal("20.0")
+    # Risk sizing works in plain floats; equity from Alpaca is already a float
+    RESERVE_PERCENTAGE = 20.0
+    # Share of equity left after the reserve (0.80)
+    RESERVE_MULTIPLIER = 1.0 - RESERVE_PERCENTAGE / 100.0
+    # Width of the equity buckets used to memoize tier lookups
+    TIER_BUCKET_SIZE = 1000.0
 
     def __init__(self, config: Dict) -> None:
         self.config = config
         self.risk_config = config.get("accounts", {}).get("default", {}).get("risk", {})
+        self._tier_cache: Dict[int, Dict] = {}
         self.tiers = self._load_tiers()
+        # Kept sorted by floor, with parallel float lists for binary search
         self.milestone_floors: List[Dict] = []
-        self.daily_start_equity: Optional[Decimal] = None
-        self.daily_drawdown = Decimal("0.0")
+        self._floor_values: List[float] = []
+        self._floor_alerts: List[float] = []
+        self.daily_start_equity: Optional[float] = None
+        self.daily_drawdown = 0.0
+        # Epoch seconds of the next local midnight; crossing it starts a new day
+        self._day_rollover_at = 0.0
+
+        preservation_config = config.get("emergency", {}).get("preservation_mode", {})
+        self._preservation_auto = bool(preservation_config.get("auto_trigger", False))
+        self._preservation_triggers = frozenset(preservation_config.get("trigger_conditions", []))
 
         logger.info("Risk Manager initialized")
 
     def _load_tiers(self) -> Dict:
+        self._tier_cache.clear()
         tier_config = self.risk_config.get("tiers", {})
         tiers = {}
 
         for tier_name, tier_data in tier_config.items():
             tiers[tier_name] = {
                 "name": tier_name,
-                "range": tuple(tier_data["range"]),
-                "per_trade_min": Decimal(str(tier_data["per_trade_min"])),
-                "per_trade_max": Decimal(str(tier_data["per_trade_max"])),
-                "daily_max_drawdown": Decimal(str(tier_data["daily_max_drawdown"])),
+                # Bounds are static config; convert once instead of per lookup
+                "range": (float(tier_data["range"][0]), float(tier_data["range"][1])),
+                "per_trade_min": float(tier_data["per_trade_min"]),
+                "per_trade_max": float(tier_data["per_trade_max"]),
+                "daily_max_drawdown": float(tier_data["daily_max_drawdown"]),
                 "aggression": tier_data["aggression"],
             }
 
         return tiers
 
     def get_current_tier(self, equity: float) -> Dict:
-        equity_decimal = Decimal(str(equity))
+        bucket = int(equity // self.TIER_BUCKET_SIZE)
+        cached = self._tier_cache.get(bucket)
+        if cached is not None:
+            return cached
+
+        bucket_start = bucket * self.TIER_BUCKET_SIZE
+        bucket_end = bucket_start + self.TIER_BUCKET_SIZE
 
         for tier_data in self.tiers.values():
             min_equity, max_equity = tier_data["range"]
-            if Decimal(str(min_equity)) <= equity_decimal < Decimal(str(max_equity)):
+            if min_equity <= equity < max_equity:
+                # Only memoize buckets that cannot straddle a tier boundary
+                if min_equity <= bucket_start and bucket_end <= max_equity:
+                    self._tier_cache[bucket] = tier_data
                 return tier_data
 
         return self.tiers["tier_1m_plus"]
 
-    def calculate_available_capital(self, equity: float) -> Decimal:
-        equity_decimal = Decimal(str(equity))
-        reserve_amount = equity_decimal * (self.RESERVE_PERCENTAGE / Decimal("100"))
-        available = equity_decimal - reserve_amount
+    def calculate_available_capital(self, equity: float) -> float:
+        available = equity * self.RESERVE_MULTIPLIER
 
         logger.debug(
-            "Equity: ${equity:.2f} | Reserve (20%): ${reserve:.2f} | Available: ${available:.2f}".format(
-                equity=equity_decimal, reserve=reserve_amount, available=available
-            )
+            "Equity: ${:.2f} | Reserve (20%): ${:.2f} | Available: ${:.2f}",
+            equity, equity - available, available,
         )
 
         return available
@@ -78,40 +102,44 @@ class RiskManager:
         available_capital = self.calculate_available_capital(equity)
 
         if risk_percentage is None:
-            risk_pct = (tier["per_trade_min"] + tier["per_trade_max"]) / Decimal("2")
+            risk_pct = (tier["per_trade_min"] + tier["per_trade_max"]) / 2.0
         else:
-            risk_pct = Decimal(str(risk_percentage))
-            risk_pct = max(tier["per_trade_min"], min(tier["per_trade_max"], risk_pct))
+            risk_pct = max(tier["per_trade_min"], min(tier["per_trade_max"], float(risk_percentage)))
 
-        position_value = available_capital * (risk_pct / Decimal("100"))
+        position_value = available_capital * risk_pct / 100.0
 
         shares = None
         if price is not None:
-            shares = int(position_value / Decimal(str(price)))
-            position_value = Decimal(str(shares)) * Decimal(str(price))
+            shares = int(position_value / price)
+            position_value = shares * price
 
         risk_amount = None
         if stop_loss_pct is not None and price is not None and shares is not None:
-            stop_loss_distance = abs(Decimal(str(stop_loss_pct))) / Decimal("100")
-            risk_amount = Decimal(str(shares)) * Decimal(str(price)) * stop_loss_distance
+            risk_amount = shares * price * abs(stop_loss_pct) / 100.0
 
         result = {
             "position_value": float(position_value),
             "shares": shares,
-            "risk_percentage": float(risk_pct),
-            "risk_amount": float(risk_amount) if risk_amount else None,
+            "risk_percentage": risk_pct,
+            "risk_amount": risk_amount if risk_amount else None,
             "tier": tier["name"],
-            "available_capital": float(available_capital),
+            "available_capital": available_capital,
         }
 
-        logger.debug(f"Position sizing: {result}")
+        logger.debug("Position sizing: {}", result)
 
         return result
 
-    def check_reserve_violation(self, equity: float, proposed_trade_value: float) -> Tuple[bool, str]:
-        available_capital = self.calculate_available_capital(equity)
+    def check_reserve_violation(
+        self,
+        equity: float,
+        proposed_trade_value: float,
+        available_capital: Optional[float] = None,
+    ) -> Tuple[bool, str]:
+        if available_capital is None:
+            available_capital = self.calculate_available_capital(equity)
 
-        if Decimal(str(proposed_trade_value)) > available_capital:
+        if proposed_trade_value > available_capital:
             reason = (
                 f"Trade value ${proposed_trade_value:.2f} exceeds available capital "
                 f"${available_capital:.2f} (reserve violation)"
@@ -133,24 +161,30 @@ class RiskManager:
 
         return True, "OK"
 
-    def update_daily_drawdown(self, current_equity: float) -> Decimal:
-        today = date.today()
-        if self.daily_start_equity is None or datetime.now().date() != today:
-            self.daily_start_equity = Decimal(str(current_equity))
-            self.daily_drawdown = Decimal("0.0")
+    def update_daily_drawdown(self, current_equity: float) -> float:
+        now = time.time()
+        if self.daily_start_equity is None or now >= self._day_rollover_at:
+            next_midnight = datetime.combine(date.today() + timedelta(days=1), dt_time.min)
+            self._day_rollover_at = next_midnight.timestamp()
+            self.daily_start_equity = float(current_equity)
+            self.daily_drawdown = 0.0
             logger.info(f"Daily start equity set: ${self.daily_start_equity:.2f}")
 
-        current_equity_decimal = Decimal(str(current_equity))
-        drawdown = (
-            (self.daily_start_equity - current_equity_decimal) / self.daily_start_equity
-        ) * Decimal("100")
+        drawdown = (self.daily_start_equity - current_equity) / self.daily_start_equity * 100.0
         self.daily_drawdown = max(self.daily_drawdown, drawdown)
 
         return self.daily_drawdown
 
-    def check_daily_drawdown_limit(self, current_equity: float) -> Tuple[bool, str]:
-        drawdown = self.update_daily_drawdown(current_equity)
-        tier = self.get_current_tier(current_equity)
+    def check_daily_drawdown_limit(
+        self,
+        current_equity: float,
+        tier: Optional[Dict] = None,
+        drawdown: Optional[float] = None,
+    ) -> Tuple[bool, str]:
+        if drawdown is None:
+            drawdown = self.update_daily_drawdown(current_equity)
+        if tier is None:
+            tier = self.get_current_tier(current_equity)
         max_drawdown = tier["daily_max_drawdown"]
 
         if drawdown >= max_drawdown:
@@ -158,7 +192,7 @@ class RiskManager:
             logger.error(f"DRAWDOWN LIMIT EXCEEDED: {reason}")
             return False, reason
 
-        if drawdown >= max_drawdown * Decimal("0.8"):
+        if drawdown >= max_drawdown * 0.8:
             logger.warning(
                 f"Daily drawdown approaching limit: {drawdown:.2f}% / {max_drawdown:.2f}%"
             )
@@ -170,40 +204,40 @@ class RiskManager:
         if not floor_config.get("enabled", False):
             return
 
-        floor_percentage = Decimal(str(floor_config.get("floor_percentage", 93.75))) / Decimal("100")
-        floor_value = Decimal(str(milestone_equity)) * floor_percentage
+        floor_value = milestone_equity * float(floor_config.get("floor_percentage", 93.75)) / 100.0
 
-        self.milestone_floors.append(
+        idx = bisect_right(self._floor_values, floor_value)
+        self._floor_values.insert(idx, floor_value)
+        self._floor_alerts.insert(idx, floor_value * 1.02)
+        self.milestone_floors.insert(
+            idx,
             {
                 "milestone": milestone_equity,
-                "floor": float(floor_value),
+                "floor": floor_value,
                 "set_date": datetime.now().isoformat(),
-            }
+            },
         )
 
         logger.info(f"Milestone floor set: ${milestone_equity:,.0f} → Floor: ${floor_value:,.2f}")
 
     def get_milestone_floors(self, current_equity: float) -> List[Dict]:
-        return [floor for floor in self.milestone_floors if current_equity >= floor["floor"]]
+        return self.milestone_floors[:bisect_right(self._floor_values, current_equity)]
 
     def is_approaching_milestone_floor(self, current_equity: float) -> bool:
-        for floor_data in self.milestone_floors:
-            floor = Decimal(str(floor_data["floor"]))
-            threshold = floor * Decimal("1.02")
-
-            if Decimal(str(current_equity)) <= threshold:
-                logger.warning(f"Approaching milestone floor: ${current_equity:.2f} near ${floor:.2f}")
-                return True
+        # First floor whose 2% alert band still covers current equity
+        idx = bisect_left(self._floor_alerts, current_equity)
+        if idx == len(self._floor_alerts):
+            return False
 
-        return False
+        floor = self._floor_values[idx]
+        logger.warning(f"Approaching milestone floor: ${current_equity:.2f} near ${floor:.2f}")
+        return True
 
     async def should_enter_preservation_mode(self, current_equity: float, error_count: int = 0) -> bool:
-        preservation_config = self.config.get("emergency", {}).get("preservation_mode", {})
-
-        if not preservation_config.get("auto_trigger", False):
+        if not self._preservation_auto:
             return False
 
-        triggers = preservation_config.get("trigger_conditions", [])
+        triggers = self._preservation_triggers
 
         if "approaching_milestone_floor" in triggers:
             if self.is_approaching_milestone_floor(current_equity):
@@ -229,27 +263,43 @@ class RiskManager:
         proposed_trade_value: float,
         asset_type: str,
         current_positions: Dict,
+        fail_fast: bool = True,
     ) -> Tuple[bool, List[str]]:
+        # fail_fast stops at the first failing check (trading path); pass False
+        # to collect every failing reason, e.g. for reports
         reasons = []
 
+        # Drawdown tracking is stateful, so it is updated on every validation
+        # even when an earlier check rejects the trade
+        drawdown = self.update_daily_drawdown(equity)
+
         is_valid, reason = self.check_reserve_violation(equity, proposed_trade_value)
         if not is_valid:
             reasons.append(reason)
+            if fail_fast:
+                return self._reject(reasons)
 
         is_valid, reason = self.check_position_limits(current_positions, asset_type)
         if not is_valid:
             reasons.append(reason)
+            if fail_fast:
+                return self._reject(reasons)
 
-        is_valid, reason = self.check_daily_drawdown_limit(equity)
+        is_valid, reason = self.check_daily_drawdown_limit(equity, self.get_current_tier(equity), drawdown)
         if not is_valid:
             reasons.append(reason)
+            if fail_fast:
+                return self._reject(reasons)
 
         if self.is_approaching_milestone_floor(equity):
             reasons.append("Approaching milestone floor - high caution")
 
-        is_valid = len(reasons) == 0
+        if reasons:
+            return self._reject(reasons)
 
-        if not is_valid:
-            logger.warning(f"Trade validation FAILED: {', '.join(reasons)}")
+        return True, reasons
 
-        return is_valid, reasons
+    @staticmethod
+    def _reject(reasons: List[str]) -> Tuple[bool, List[str]]:
+        logger.warning(f"Trade validation FAILED: {', '.join(reasons)}")
+        return False, reasons
@@ -0,0 +1,33 @@
+"""Numeric indicator kernels shared by strategies."""
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+EMA_SPAN = 21
+VOLUME_WINDOW = 20
+
+_EMA_DECAY = 1.0 - 2.0 / (EMA_SPAN + 1)
+
+# VWAP is anchored at the first bar of the window (not the trading session):
+# it is the final value of the cumulative sum(v * tp) / sum(v), computed as a
+# single ratio of sums rather than materializing the cumulative series.
+
+
+def compute_entry_features(
+    close: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    volume: np.ndarray,
+) -> Tuple[float, float, float]:
+    """Return (ema21, vwap, volume_impulse) for the bars in the window."""
+    # Adjusted EMA (pandas ewm adjust=True) as a weighted mean of the window
+    weights = _EMA_DECAY ** np.arange(close.shape[0] - 1, -1, -1)
+    ema = float(weights @ close / weights.sum())
+    # A window with no traded volume has no VWAP; fall back to the last close
+    v_sum = float(volume.sum())
+    vwap = float(volume @ ((high + low + close) / 3.0)) / v_sum if v_sum > 0 else float(close[-1])
+    avg_volume = float(volume[-VOLUME_WINDOW:].mean())
+    impulse = float(volume[-1]) / avg_volume if avg_volume > 0 else 0.0
+    return ema, vwap, impulse
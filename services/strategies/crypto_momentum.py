@@ -4,19 +4,39 @@ Crypto Momentum Strategy
 """
 from __future__ import annotations
 
-from typing import Dict
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Dict, List
 
-import pandas as pd
+import numpy as np
 from loguru import logger
 
+from services.strategies._indicators import compute_entry_features
 from services.strategies.base_strategy import BaseStrategy
 
 
+@dataclass(slots=True)
+class CryptoPosition:
+    """Open position state (slotted attributes instead of a per-position dict)."""
+
+    entry_price: float
+    entry_time: Any
+    qty: int
+    stop_loss: float
+    targets: List[float]
+    order_id: str
+    trailing_stop_active: bool = False
+    trailing_stop_price: float = 0.0
+    pyramid_added: bool = False
+
+
 class CryptoMomentumStrategy(BaseStrategy):
     """
     Crypto momentum strategy for fast compounding.
     """
 
+    BAR_WINDOW = 50
+
     def __init__(self, config: Dict, risk_manager, order_manager, market_data) -> None:
         super().__init__(config, risk_manager, order_manager, market_data)
 
@@ -25,7 +45,30 @@ class CryptoMomentumStrategy(BaseStrategy):
         self.entry_config = config.get("entry", {})
         self.exit_config = config.get("exit", {})
 
-        self.positions: Dict[str, Dict] = {}
+        # Config is static at runtime; resolve hot-path settings once
+        self._primary_tf = self.timeframes[0]
+        self._require_above_ema = self.entry_config.get("price_above_ema21", True)
+        self._require_above_vwap = self.entry_config.get("price_above_vwap", True)
+        self._vol_threshold = float(self.entry_config.get("volume_impulse_multiplier", 1.5))
+        self._pyramid_cfg = self.exit_config.get("pyramid", {})
+        self._trail_cfg = self.exit_config.get("trailing_stop", {})
+        self._targets = self.exit_config.get("targets", [2.0, 4.0, 6.0])
+        # Any target hit exits the whole position, so only the lowest matters
+        self._exit_target = min(self._targets) if self._targets else None
+        self._pyramid_enabled = self._pyramid_cfg.get("enabled", False)
+        self._pyramid_trigger_pct = self._pyramid_cfg.get("add_after_profit_pct", 2.0)
+        self._trail_enabled = self._trail_cfg.get("enabled", False)
+        self._trail_activation_pct = self._trail_cfg.get("activation_pct", 2.0)
+        self._trail_multiplier = 1 - self._trail_cfg.get("trailing_pct", 1.0) / 100
+        self._hard_stop_pct = abs(self.exit_config.get("hard_stop_pct", -1.5))
+
+        self.positions: Dict[str, CryptoPosition] = {}
+        # Assets are evaluated concurrently; entries are serialized so the
+        # position-limit check sees every fill before the next one is sized
+        self._positions_lock = asyncio.Lock()
+
+        # Per-asset (close, high, low, volume) rows reused across evaluations
+        self._bar_buf: Dict[str, np.ndarray] = {}
 
         logger.info(f"Crypto Momentum Strategy initialized for {len(self.assets)} assets")
 
@@ -33,107 +76,97 @@ class CryptoMomentumStrategy(BaseStrategy):
         if not self.is_running or self.new_entries_disabled:
             return
 
-        for asset in self.assets:
-            try:
-                if asset in self.positions:
-                    await self._manage_position(asset)
-                else:
-                    await self._check_entry_signal(asset)
+        tasks = [
+            self._manage_position(asset) if asset in self.positions else self._check_entry_signal(asset)
+            for asset in self.assets
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
 
-            except Exception as exc:
-                logger.error(f"Error evaluating {asset}: {exc}")
+        for asset, result in zip(self.assets, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error evaluating {asset}: {result}")
 
     async def _check_entry_signal(self, asset: str) -> None:
-        timeframe = self.timeframes[0]
-        bars = await self.market_data.get_bars(asset, timeframe, limit=50)
+        bars = await self.market_data.get_bars(asset, self._primary_tf, limit=self.BAR_WINDOW)
 
         if bars is None or len(bars) < 25:
             return
 
-        close = bars["close"]
-        volume = bars["volume"]
-
-        ema21 = close.ewm(span=21).mean().iloc[-1]
-        current_price = close.iloc[-1]
+        buf = self._bar_buf.get(asset)
+        if buf is None:
+            buf = self._bar_buf[asset] = np.empty((4, self.BAR_WINDOW), dtype=np.float64)
+        n = min(len(bars), self.BAR_WINDOW)
+        for row, column in enumerate(("close", "high", "low", "volume")):
+            buf[row, :n] = bars[column].to_numpy()[-n:]
 
-        vwap = (
-            bars["volume"] * (bars["high"] + bars["low"] + bars["close"]) / 3
-        ).cumsum() / bars["volume"].cumsum()
-        current_vwap = vwap.iloc[-1]
-
-        avg_volume_20 = volume.rolling(20).mean().iloc[-1]
-        current_volume = volume.iloc[-1]
-        volume_impulse = current_volume / avg_volume_20 if avg_volume_20 > 0 else 0
-
-        price_above_ema21 = self.entry_config.get("price_above_ema21", True)
-        price_above_vwap = self.entry_config.get("price_above_vwap", True)
-        volume_threshold = self.entry_config.get("volume_impulse_multiplier", 1.5)
+        close, high, low, volume = buf[:, :n]
+        ema21, current_vwap, volume_impulse = compute_entry_features(close, high, low, volume)
+        current_price = float(close[-1])
 
         signal_valid = True
         reasons = []
 
-        if price_above_ema21 and current_price <= ema21:
+        if self._require_above_ema and current_price <= ema21:
             signal_valid = False
             reasons.append(f"price {current_price:.2f} <= EMA21 {ema21:.2f}")
 
-        if price_above_vwap and current_price <= current_vwap:
+        if self._require_above_vwap and current_price <= current_vwap:
             signal_valid = False
             reasons.append(f"price {current_price:.2f} <= VWAP {current_vwap:.2f}")
 
-        if volume_impulse < volume_threshold:
+        if volume_impulse < self._vol_threshold:
             signal_valid = False
-            reasons.append(f"volume impulse {volume_impulse:.2f}x < {volume_threshold}x")
+            reasons.append(f"volume impulse {volume_impulse:.2f}x < {self._vol_threshold}x")
 
         if signal_valid:
             logger.info(f"Entry signal: {asset} @ ${current_price:.2f}")
             await self._enter_position(asset, current_price)
         else:
-            logger.debug(f"No entry for {asset}: {', '.join(reasons)}")
+            logger.opt(lazy=True).debug("No entry for {}: {}", lambda: asset, lambda: ", ".join(reasons))
 
     async def _enter_position(self, asset: str, price: float) -> None:
-        equity = await self.order_manager.get_account_equity()
-
-        stop_loss_pct = abs(self.exit_config.get("hard_stop_pct", -1.5))
-        position_info = self.risk_manager.calculate_position_size(
-            equity=equity,
-            price=price,
-            stop_loss_pct=stop_loss_pct,
-        )
+        async with self._positions_lock:
+            equity = await self.order_manager.get_account_equity()
+
+            stop_loss_pct = self._hard_stop_pct
+            position_info = self.risk_manager.calculate_position_size(
+                equity=equity,
+                price=price,
+                stop_loss_pct=stop_loss_pct,
+            )
 
-        is_valid, reasons = self.risk_manager.validate_trade(
-            equity=equity,
-            proposed_trade_value=position_info["position_value"],
-            asset_type="crypto",
-            current_positions={"crypto": len(self.positions)},
-        )
+            is_valid, reasons = self.risk_manager.validate_trade(
+                equity=equity,
+                proposed_trade_value=position_info["position_value"],
+                asset_type="crypto",
+                current_positions={"crypto": len(self.positions)},
+            )
 
-        if not is_valid:
-            logger.warning(f"Trade rejected for {asset}: {reasons}")
-            return
+            if not is_valid:
+                logger.warning(f"Trade rejected for {asset}: {reasons}")
+                return
 
-        order = await self.order_manager.submit_order(
-            symbol=asset,
-            side="buy",
-            order_type="market",
-            qty=position_info["shares"],
-            strategy="crypto_momentum",
-        )
+            order = await self.order_manager.submit_order(
+                symbol=asset,
+                side="buy",
+                order_type="market",
+                qty=position_info["shares"],
+                strategy="crypto_momentum",
+            )
 
-        if order:
-            self.positions[asset] = {
-                "entry_price": price,
-                "entry_time": order["submitted_at"],
-                "qty": position_info["shares"],
-                "stop_loss": price * (1 + stop_loss_pct / 100),
-                "targets": self.exit_config.get("targets", [2.0, 4.0, 6.0]),
-                "trailing_stop_active": False,
-                "pyramid_added": False,
-                "order_id": order["id"],
-            }
+            if order:
+                self.positions[asset] = CryptoPosition(
+                    entry_price=price,
+                    entry_time=order["submitted_at"],
+                    qty=position_info["shares"],
+                    stop_loss=price * (1 + stop_loss_pct / 100),
+                    targets=self._targets,
+                    order_id=order["id"],
+                )
 
-            logger.info(
-                f"Position entered: {asset} - {position_info['shares']} shares @ ${price:.2f}"
-            )
+                logger.info(
+                    f"Position entered: {asset} - {position_info['shares']} shares @ ${price:.2f}"
+                )
 
     async def _manage_position(self, asset: str) -> None:
         position = self.positions[asset]
@@ -142,63 +175,42 @@ class CryptoMomentumStrategy(BaseStrategy):
         if current_price is None:
             return
 
-        entry_price = position["entry_price"]
+        entry_price = position.entry_price
         pnl_pct = ((current_price - entry_price) / entry_price) * 100
 
-        pyramid_config = self.exit_config.get("pyramid", {})
-        if (
-            pyramid_config.get("enabled", False)
-            and not position["pyramid_added"]
-            and pnl_pct >= pyramid_config.get("add_after_profit_pct", 2.0)
-        ):
+        if self._pyramid_enabled and not position.pyramid_added and pnl_pct >= self._pyramid_trigger_pct:
             await self._pyramid_position(asset, current_price)
 
-        trailing_config = self.exit_config.get("trailing_stop", {})
-        if (
-            trailing_config.get("enabled", False)
-            and not position.get("trailing_stop_active")
-            and pnl_pct >= trailing_config.get("activation_pct", 2.0)
-        ):
-            position["trailing_stop_active"] = True
-            position["trailing_stop_price"] = current_price * (
-                1 - trailing_config.get("trailing_pct", 1.0) / 100
-            )
+        if position.trailing_stop_active:
+            new_stop = current_price * self._trail_multiplier
+            if new_stop > position.trailing_stop_price:
+                position.trailing_stop_price = new_stop
+                logger.debug("Trailing stop updated for {}: ${:.2f}", asset, new_stop)
+        elif self._trail_enabled and pnl_pct >= self._trail_activation_pct:
+            position.trailing_stop_active = True
+            position.trailing_stop_price = current_price * self._trail_multiplier
             logger.info(
-                f"Trailing stop activated for {asset} @ ${position['trailing_stop_price']:.2f}"
+                f"Trailing stop activated for {asset} @ ${position.trailing_stop_price:.2f}"
             )
 
-        if position.get("trailing_stop_active"):
-            new_stop = current_price * (1 - trailing_config.get("trailing_pct", 1.0) / 100)
-            if new_stop > position["trailing_stop_price"]:
-                position["trailing_stop_price"] = new_stop
-                logger.debug(f"Trailing stop updated for {asset}: ${new_stop:.2f}")
-
-        should_exit = False
-        exit_reason = ""
-
-        for target in position["targets"]:
-            if pnl_pct >= target:
-                should_exit = True
-                exit_reason = f"Target hit: +{target}%"
-                break
-
-        if position.get("trailing_stop_active") and current_price <= position["trailing_stop_price"]:
-            should_exit = True
-            exit_reason = f"Trailing stop: ${position['trailing_stop_price']:.2f}"
-
-        if current_price <= position["stop_loss"]:
-            should_exit = True
-            exit_reason = f"Hard stop: ${position['stop_loss']:.2f}"
+        # Most protective exit reason first: hard stop, trailing stop, target
+        if current_price <= position.stop_loss:
+            exit_reason = f"Hard stop: ${position.stop_loss:.2f}"
+        elif position.trailing_stop_active and current_price <= position.trailing_stop_price:
+            exit_reason = f"Trailing stop: ${position.trailing_stop_price:.2f}"
+        elif self._exit_target is not None and pnl_pct >= self._exit_target:
+            exit_reason = f"Target hit: +{self._exit_target}%"
+        else:
+            return
 
-        if should_exit:
-            await self._exit_position(asset, current_price, exit_reason)
+        await self._exit_position(asset, current_price, exit_reason)
 
     async def _pyramid_position(self, asset: str, current_price: float) -> None:
         position = self.positions[asset]
-        pyramid_config = self.exit_config.get("pyramid", {})
+        pyramid_config = self._pyramid_cfg
 
         additional_size_pct = pyramid_config.get("additional_size_pct", 50.0)
-        additional_qty = int(position["qty"] * (additional_size_pct / 100))
+        additional_qty = int(position.qty * (additional_size_pct / 100))
 
         if additional_qty > 0:
             order = await self.order_manager.submit_order(
@@ -210,17 +222,17 @@ class CryptoMomentumStrategy(BaseStrategy):
             )
 
             if order:
-                total_qty = position["qty"] + additional_qty
+                total_qty = position.qty + additional_qty
                 avg_price = (
-                    (position["entry_price"] * position["qty"]) + (current_price * additional_qty)
+                    (position.entry_price * position.qty) + (current_price * additional_qty)
                 ) / total_qty
 
-                position["qty"] = total_qty
-                position["entry_price"] = avg_price
-                position["pyramid_added"] = True
+                position.qty = total_qty
+                position.entry_price = avg_price
+                position.pyramid_added = True
 
                 if pyramid_config.get("move_stop_to_breakeven", True):
-                    position["stop_loss"] = avg_price
+                    position.stop_loss = avg_price
 
                 logger.info(
                     f"Pyramid add: {asset} +{additional_qty} shares @ ${current_price:.2f} (avg: ${avg_price:.2f})"
@@ -233,13 +245,13 @@ class CryptoMomentumStrategy(BaseStrategy):
             symbol=asset,
             side="sell",
             order_type="market",
-            qty=position["qty"],
+            qty=position.qty,
             strategy="crypto_momentum_exit",
         )
 
         if order:
-            pnl_pct = ((price - position["entry_price"]) / position["entry_price"]) * 100
-            pnl_amount = (price - position["entry_price"]) * position["qty"]
+            pnl_pct = ((price - position.entry_price) / position.entry_price) * 100
+            pnl_amount = (price - position.entry_price) * position.qty
 
             logger.info(
                 f"Position exited: {asset} - P/L: ${pnl_amount:.2f} ({pnl_pct:+.2f}%) - Reason: {reason}"
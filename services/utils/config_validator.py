@@ -5,7 +5,7 @@ and configuration settings at system startup.
 """
 
 import os
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from pathlib import Path
 from loguru import logger
 
@@ -18,24 +18,28 @@ class ConfigValidationError(Exception):
 class ConfigValidator:
     """Validates system configuration and environment variables"""
     
-    REQUIRED_ENV_VARS = [
-        "ALPACA_PAPER_API_KEY",
-        "ALPACA_PAPER_API_SECRET",
-        "JWT_SECRET_KEY"
-    ]
+    VALID_ALPACA_MODES = frozenset({"paper", "live"})
     
-    OPTIONAL_ENV_VARS = {
-        "ALPACA_MODE": "paper",
-        "LOG_LEVEL": "INFO"
-    }
+    # (name, kind, default, allowed values) - drives the single validation pass
+    ENV_VAR_MATRIX = (
+        ("ALPACA_PAPER_API_KEY", "required", None, None),
+        ("ALPACA_PAPER_API_SECRET", "required", None, None),
+        ("JWT_SECRET_KEY", "required", None, None),
+        ("ALPACA_MODE", "optional", "paper", VALID_ALPACA_MODES),
+        ("LOG_LEVEL", "optional", "INFO", None),
+    )
     
-    VALID_ALPACA_MODES = ["paper", "live"]
+    REQUIRED_ENV_VARS = tuple(name for name, kind, _, _ in ENV_VAR_MATRIX if kind == "required")
+    
+    OPTIONAL_ENV_VARS = {name: default for name, kind, default, _ in ENV_VAR_MATRIX if kind == "optional"}
     
     def __init__(self):
         """Initialize the configuration validator"""
         self.missing_vars: List[str] = []
         self.invalid_vars: List[Tuple[str, str, str]] = []
         self.warnings: List[str] = []
+        # Snapshot of os.environ taken at the start of validate_all
+        self.env: Dict[str, str] = {}
     
     def validate_all(self) -> bool:
         """Validate all configuration requirements
@@ -46,10 +50,9 @@ class ConfigValidator:
         Raises:
             ConfigValidationError: If critical configuration is missing or invalid
         """
+        self.env = dict(os.environ)
         self._check_env_file()
-        self._validate_required_env_vars()
-        self._validate_optional_env_vars()
-        self._validate_alpaca_mode()
+        self._validate_env_vars()
         
         if self.missing_vars or self.invalid_vars:
             self._log_validation_errors()
@@ -77,65 +80,68 @@ class ConfigValidator:
                 "  ALPACA_MODE=paper"
             )
     
-    def _validate_required_env_vars(self) -> None:
-        """Validate that all required environment variables are present"""
-        for var in self.REQUIRED_ENV_VARS:
-            value = os.getenv(var)
-            if not value or value.strip() == "":
-                self.missing_vars.append(var)
-                logger.error(f"Required environment variable missing: {var}")
-    
-    def _validate_optional_env_vars(self) -> None:
-        """Validate optional environment variables and set defaults"""
-        for var, default in self.OPTIONAL_ENV_VARS.items():
-            value = os.getenv(var)
+    def _validate_env_vars(self) -> None:
+        """Validate required, optional and enumerated variables in one pass"""
+        env = self.env
+        defaults_applied = []
+        
+        for var, kind, default, allowed in self.ENV_VAR_MATRIX:
+            value = env.get(var)
+            
+            if kind == "required":
+                if not value or value.strip() == "":
+                    self.missing_vars.append(var)
+                continue
+            
             if not value:
-                os.environ[var] = default
-                logger.info(f"Using default value for {var}: {default}")
-    
-    def _validate_alpaca_mode(self) -> None:
-        """Validate ALPACA_MODE is either 'paper' or 'live'"""
-        mode = os.getenv("ALPACA_MODE", "paper").lower()
+                env[var] = os.environ[var] = value = default
+                defaults_applied.append(f"{var}={default}")
+            
+            if allowed is not None and value.lower() not in allowed:
+                self.warnings.append(
+                    f"Invalid {var} '{value.lower()}'. Must be one of {', '.join(sorted(allowed))}. "
+                    f"Defaulting to '{default}'."
+                )
+                env[var] = os.environ[var] = default
         
-        if mode not in self.VALID_ALPACA_MODES:
-            self.warnings.append(
-                f"Invalid ALPACA_MODE '{mode}'. Must be 'paper' or 'live'. "
-                f"Defaulting to 'paper'."
-            )
-            os.environ["ALPACA_MODE"] = "paper"
-        else:
-            logger.info(f"ALPACA_MODE set to: {mode}")
+        if self.missing_vars:
+            logger.error(f"Required environment variables missing: {', '.join(self.missing_vars)}")
+        if defaults_applied:
+            logger.info(f"Using default values: {', '.join(defaults_applied)}")
     
     def _log_validation_errors(self) -> None:
-        """Log detailed validation errors"""
-        logger.error("=" * 60)
-        logger.error("CONFIGURATION VALIDATION FAILED")
-        logger.error("=" * 60)
+        """Log detailed validation errors as a single record"""
+        separator = "=" * 60
+        lines = [separator, "CONFIGURATION VALIDATION FAILED", separator]
         
         if self.missing_vars:
-            logger.error("Missing required environment variables:")
-            for var in self.missing_vars:
-                logger.error(f"  - {var}")
+            lines.append("Missing required environment variables:")
+            lines.extend(f"  - {var}" for var in self.missing_vars)
         
         if self.invalid_vars:
-            logger.error("Invalid environment variables:")
-            for var, value, reason in self.invalid_vars:
-                logger.error(f"  - {var}={value}: {reason}")
+            lines.append("Invalid environment variables:")
+            lines.extend(f"  - {var}={value}: {reason}" for var, value, reason in self.invalid_vars)
         
-        logger.error("=" * 60)
-        logger.error("Please check your .env file and ensure all required variables are set.")
-        logger.error("=" * 60)
+        lines += [
+            separator,
+            "Please check your .env file and ensure all required variables are set.",
+            separator,
+        ]
+        logger.error("\n".join(lines))
     
     def _log_success(self) -> None:
-        """Log successful validation"""
-        logger.info("=" * 60)
-        logger.info("CONFIGURATION VALIDATION SUCCESSFUL")
-        logger.info("=" * 60)
-        logger.info("Configuration summary:")
-        logger.info(f"  ALPACA_MODE: {os.getenv('ALPACA_MODE')}")
-        logger.info(f"  LOG_LEVEL: {os.getenv('LOG_LEVEL')}")
-        logger.info(f"  ALPACA_PAPER_API_KEY: {'*' * 8}...{os.getenv('ALPACA_PAPER_API_KEY', '')[-4:]}")
-        logger.info("=" * 60)
+        """Log successful validation as a single record"""
+        separator = "=" * 60
+        logger.info("\n".join([
+            separator,
+            "CONFIGURATION VALIDATION SUCCESSFUL",
+            separator,
+            "Configuration summary:",
+            f"  ALPACA_MODE: {self.env.get('ALPACA_MODE')}",
+            f"  LOG_LEVEL: {self.env.get('LOG_LEVEL')}",
+            f"  ALPACA_PAPER_API_KEY: {'*' * 8}...{self.env.get('ALPACA_PAPER_API_KEY', '')[-4:]}",
+            separator,
+        ]))
 
 
 def validate_config() -> bool:
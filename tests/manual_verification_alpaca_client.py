@@ -5,8 +5,34 @@ This script demonstrates the AlpacaClient implementation without making actual A
 To run with real API calls, set your environment variables and uncomment the live test section.
 """
 import os
+from functools import lru_cache
+
 from services.connectors.alpaca_client import AlpacaClient
 
+# Environment read once at import; the checks below mutate os.environ and
+# restore it from this snapshot
+_ENV_CACHE = {
+    key: os.environ.get(key)
+    for key in ("ALPACA_PAPER_API_KEY", "ALPACA_PAPER_API_SECRET", "ALPACA_MODE")
+}
+
+
+@lru_cache(maxsize=8)
+def _cached_client(config_key, mode):
+    """Build one AlpacaClient (and its SDK clients) per config and mode."""
+    return AlpacaClient(dict(config_key))
+
+
+def get_client(config=None):
+    """Return a shared AlpacaClient for the given config and current ALPACA_MODE."""
+    config = config or {}
+    return _cached_client(frozenset(config.items()), os.environ.get("ALPACA_MODE", "paper"))
+
+
+def _restore_env():
+    """Restore the cached variables in a single update."""
+    os.environ.update({key: value for key, value in _ENV_CACHE.items() if value is not None})
+
 
 def verify_initialization():
     """Verify AlpacaClient initialization requirements."""
@@ -16,8 +42,8 @@ def verify_initialization():
     
     # Test 1: Missing credentials should raise ValueError
     print("\n1. Testing missing credentials...")
-    original_key = os.getenv("ALPACA_PAPER_API_KEY")
-    original_secret = os.getenv("ALPACA_PAPER_API_SECRET")
+    original_key = _ENV_CACHE["ALPACA_PAPER_API_KEY"]
+    original_secret = _ENV_CACHE["ALPACA_PAPER_API_SECRET"]
     
     try:
         os.environ.pop("ALPACA_PAPER_API_KEY", None)
@@ -29,24 +55,24 @@ def verify_initialization():
         except ValueError as e:
             print(f"   ✓ PASSED: Correctly raised ValueError: {e}")
     finally:
-        # Restore environment
-        if original_key:
-            os.environ["ALPACA_PAPER_API_KEY"] = original_key
-        if original_secret:
-            os.environ["ALPACA_PAPER_API_SECRET"] = original_secret
+        _restore_env()
     
     # Test 2: Check mode switching
     print("\n2. Testing paper/live mode switching...")
     if original_key and original_secret:
         os.environ["ALPACA_MODE"] = "paper"
         try:
-            client = AlpacaClient({})
+            client = get_client()
             if client.is_paper:
                 print("   ✓ PASSED: Paper mode correctly set")
             else:
                 print("   ❌ FAILED: Paper mode not set correctly")
         except Exception as e:
             print(f"   ⚠ WARNING: Could not initialize client: {e}")
+        finally:
+            if _ENV_CACHE["ALPACA_MODE"] is None:
+                os.environ.pop("ALPACA_MODE", None)
+            _restore_env()
     else:
         print("   ⚠ SKIPPED: No credentials available")
 
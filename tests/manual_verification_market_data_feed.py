@@ -18,8 +18,8 @@ sys.path.insert(0, str(project_root))
 from dotenv import load_dotenv
 from loguru import logger
 
-from services.connectors.alpaca_client import AlpacaClient
 from services.data_feeds.market_data import MarketDataFeed
+from tests.manual_verification_alpaca_client import get_client
 
 
 async def test_market_data_feed():
@@ -37,7 +37,7 @@ async def test_market_data_feed():
     try:
         # Initialize clients
         config = {}
-        alpaca_client = AlpacaClient(config)
+        alpaca_client = get_client(config)
         market_data_feed = MarketDataFeed(config, alpaca_client)
         
         logger.info("=" * 60)
@@ -49,53 +49,65 @@ async def test_market_data_feed():
         await market_data_feed.connect()
         logger.success("✓ Connect successful")
         
+        # Tests 2-7 are independent, so their requests are issued concurrently
+        logger.info("\n[Tests 2-7] Fetching bars, prices and previous closes for AAPL and BTC/USD...")
+        (
+            stock_bars,
+            crypto_bars,
+            stock_price,
+            crypto_price,
+            stock_prev_close,
+            crypto_prev_close,
+        ) = await asyncio.gather(
+            market_data_feed.get_bars("AAPL", "1Min", 10),
+            market_data_feed.get_bars("BTC/USD", "1Min", 10),
+            market_data_feed.get_current_price("AAPL"),
+            market_data_feed.get_current_price("BTC/USD"),
+            market_data_feed.get_previous_close("AAPL"),
+            market_data_feed.get_previous_close("BTC/USD"),
+        )
+        
         # Test 2: Get bars for stock
         logger.info("\n[Test 2] Testing get_bars for stock (AAPL)...")
-        bars = await market_data_feed.get_bars("AAPL", "1Min", 10)
-        if bars is not None and not bars.empty:
-            logger.success(f"✓ Retrieved {len(bars)} bars for AAPL")
-            logger.info(f"  Latest bar: {bars.iloc[-1].to_dict()}")
+        if stock_bars is not None and not stock_bars.empty:
+            logger.success(f"✓ Retrieved {len(stock_bars)} bars for AAPL")
+            logger.info(f"  Latest bar: {stock_bars.iloc[-1].to_dict()}")
         else:
             logger.warning("⚠ No bar data for AAPL (market may be closed)")
         
         # Test 3: Get bars for crypto
         logger.info("\n[Test 3] Testing get_bars for crypto (BTC/USD)...")
-        bars = await market_data_feed.get_bars("BTC/USD", "1Min", 10)
-        if bars is not None and not bars.empty:
-            logger.success(f"✓ Retrieved {len(bars)} bars for BTC/USD")
-            logger.info(f"  Latest bar: {bars.iloc[-1].to_dict()}")
+        if crypto_bars is not None and not crypto_bars.empty:
+            logger.success(f"✓ Retrieved {len(crypto_bars)} bars for BTC/USD")
+            logger.info(f"  Latest bar: {crypto_bars.iloc[-1].to_dict()}")
         else:
             logger.warning("⚠ No bar data for BTC/USD")
         
         # Test 4: Get current price for stock
         logger.info("\n[Test 4] Testing get_current_price for stock (AAPL)...")
-        price = await market_data_feed.get_current_price("AAPL")
-        if price is not None:
-            logger.success(f"✓ Current price for AAPL: ${price:.2f}")
+        if stock_price is not None:
+            logger.success(f"✓ Current price for AAPL: ${stock_price:.2f}")
         else:
             logger.warning("⚠ No price data for AAPL (market may be closed)")
         
         # Test 5: Get current price for crypto
         logger.info("\n[Test 5] Testing get_current_price for crypto (BTC/USD)...")
-        price = await market_data_feed.get_current_price("BTC/USD")
-        if price is not None:
-            logger.success(f"✓ Current price for BTC/USD: ${price:.2f}")
+        if crypto_price is not None:
+            logger.success(f"✓ Current price for BTC/USD: ${crypto_price:.2f}")
         else:
             logger.warning("⚠ No price data for BTC/USD")
         
         # Test 6: Get previous close for stock
         logger.info("\n[Test 6] Testing get_previous_close for stock (AAPL)...")
-        prev_close = await market_data_feed.get_previous_close("AAPL")
-        if prev_close is not None:
-            logger.success(f"✓ Previous close for AAPL: ${prev_close:.2f}")
+        if stock_prev_close is not None:
+            logger.success(f"✓ Previous close for AAPL: ${stock_prev_close:.2f}")
         else:
             logger.warning("⚠ No previous close data for AAPL")
         
         # Test 7: Get previous close for crypto
         logger.info("\n[Test 7] Testing get_previous_close for crypto (BTC/USD)...")
-        prev_close = await market_data_feed.get_previous_close("BTC/USD")
-        if prev_close is not None:
-            logger.success(f"✓ Previous close for BTC/USD: ${prev_close:.2f}")
+        if crypto_prev_close is not None:
+            logger.success(f"✓ Previous close for BTC/USD: ${crypto_prev_close:.2f}")
         else:
             logger.warning("⚠ No previous close data for BTC/USD")
         
@@ -111,8 +123,10 @@ async def test_market_data_feed():
         # Test 9: Test multiple timeframes
         logger.info("\n[Test 9] Testing multiple timeframes...")
         timeframes = ["1Min", "5Min", "15Min", "1Hour", "1Day"]
-        for tf in timeframes:
-            bars = await market_data_feed.get_bars("AAPL", tf, 5)
+        results = await asyncio.gather(
+            *(market_data_feed.get_bars("AAPL", tf, 5) for tf in timeframes)
+        )
+        for tf, bars in zip(timeframes, results):
             if bars is not None and not bars.empty:
                 logger.success(f"✓ Retrieved {len(bars)} bars for AAPL at {tf}")
             else:
@@ -126,8 +140,21 @@ async def test_market_data_feed():
         else:
             logger.warning("⚠ Expected None for invalid symbol")
         
-        # Test 11: Disconnect
-        logger.info("\n[Test 11] Testing disconnect...")
+        # Test 11: Shared keep-alive session
+        logger.info("\n[Test 11] Testing shared HTTP session...")
+        sdk_clients = (
+            alpaca_client.trading_client,
+            alpaca_client.stock_data_client,
+            alpaca_client.crypto_data_client,
+        )
+        if all(client._session is alpaca_client.http_session for client in sdk_clients):
+            pools = alpaca_client.http_session.get_adapter("https://").poolmanager.pools
+            logger.success(f"✓ All SDK clients share one session ({len(pools)} host connection pool(s))")
+        else:
+            logger.warning("⚠ SDK clients are not sharing the pooled HTTP session")
+        
+        # Test 12: Disconnect
+        logger.info("\n[Test 12] Testing disconnect...")
         await market_data_feed.disconnect()
         logger.success("✓ Disconnect successful")
         
@@ -1,30 +1,57 @@
 """Unit tests for AccountManager."""
 import pytest
+import pytest_asyncio
 from unittest.mock import Mock, AsyncMock, patch
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from services.orchestrator.account_manager import AccountManager, Account
 
 
+@pytest.fixture(scope="module")
+def account_payload():
+    """Read-only Alpaca account payload shared by the tests in this module."""
+    return MappingProxyType({
+        "account_id": "test",
+        "equity": 100000.0,
+        "cash": 50000.0,
+        "buying_power": 200000.0,
+        "portfolio_value": 100000.0,
+        "pattern_day_trader": False,
+        "trading_blocked": False,
+        "account_blocked": False,
+        "currency": "USD"
+    })
+
+
+@pytest.fixture
+def mock_alpaca_client(account_payload):
+    """Mock AlpacaClient returning a fresh copy of the shared payload and no positions."""
+    client = Mock()
+    client.get_account.return_value = dict(account_payload)
+    client.get_positions.return_value = []
+    return client
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def initialized_account_manager(account_payload):
+    """AccountManager initialized once per module; only for tests that do not mutate it."""
+    client = Mock()
+    client.get_account.return_value = dict(account_payload)
+    client.get_positions.return_value = []
+    
+    account_manager = AccountManager({"accounts": {"default": {}}}, client)
+    account_manager.update_interval = 3600  # never goes stale during the module
+    await account_manager.initialize()
+    return account_manager
+
+
 class TestAccountManagerInitialization:
     """Test AccountManager initialization."""
     
     @pytest.mark.asyncio
-    async def test_initialize_with_valid_data(self):
+    async def test_initialize_with_valid_data(self, mock_alpaca_client):
         """Test initialization with valid Alpaca data."""
-        # Mock AlpacaClient
-        mock_alpaca_client = Mock()
-        mock_alpaca_client.get_account.return_value = {
-            "account_id": "test_account_123",
-            "equity": 100000.0,
-            "cash": 50000.0,
-            "buying_power": 200000.0,
-            "portfolio_value": 100000.0,
-            "pattern_day_trader": False,
-            "trading_blocked": False,
-            "account_blocked": False,
-            "currency": "USD"
-        }
-        mock_alpaca_client.get_positions.return_value = []
+        mock_alpaca_client.get_account.return_value.update({"account_id": "test_account_123"})
         
         # Create AccountManager
         config = {
@@ -78,30 +105,13 @@ class TestAccountManagerInitialization:
 class TestAccountManagerCaching:
     """Test AccountManager caching behavior."""
     
-    @pytest.mark.asyncio
-    async def test_cache_is_used_within_ttl(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_cache_is_used_within_ttl(self, initialized_account_manager):
         """Test that cached data is used when fresh."""
-        # Mock AlpacaClient
-        mock_alpaca_client = Mock()
-        mock_alpaca_client.get_account.return_value = {
-            "account_id": "test",
-            "equity": 100000.0,
-            "cash": 50000.0,
-            "buying_power": 200000.0,
-            "portfolio_value": 100000.0,
-            "pattern_day_trader": False,
-            "trading_blocked": False,
-            "account_blocked": False,
-            "currency": "USD"
-        }
-        mock_alpaca_client.get_positions.return_value = []
-        
-        config = {"accounts": {"default": {}}}
-        account_manager = AccountManager(config, mock_alpaca_client)
-        account_manager.update_interval = 30  # 30 second TTL
+        account_manager = initialized_account_manager
+        mock_alpaca_client = account_manager.alpaca_client
         
-        # Initialize (first call)
-        await account_manager.initialize()
+        # Initialized once by the fixture (first call)
         assert mock_alpaca_client.get_account.call_count == 1
         
         # Get equity (should use cache)
@@ -115,60 +125,68 @@ class TestAccountManagerCaching:
         assert mock_alpaca_client.get_account.call_count == 1  # No additional call
     
     @pytest.mark.asyncio
-    async def test_cache_is_refreshed_after_ttl(self):
+    async def test_cache_is_refreshed_after_ttl(self, mock_alpaca_client):
         """Test that cache is refreshed when stale."""
-        # Mock AlpacaClient
-        mock_alpaca_client = Mock()
-        mock_alpaca_client.get_account.return_value = {
-            "account_id": "test",
-            "equity": 100000.0,
-            "cash": 50000.0,
-            "buying_power": 200000.0,
-            "portfolio_value": 100000.0,
-            "pattern_day_trader": False,
-            "trading_blocked": False,
-            "account_blocked": False,
-            "currency": "USD"
-        }
-        mock_alpaca_client.get_positions.return_value = []
+        # Fake monotonic clock, advanced manually instead of sleeping
+        clock = {"now_ns": 0}
         
         config = {"accounts": {"default": {}}}
-        account_manager = AccountManager(config, mock_alpaca_client)
+        account_manager = AccountManager(
+            config, mock_alpaca_client, time_source=lambda: clock["now_ns"]
+        )
         account_manager.update_interval = 1  # 1 second TTL for testing
         
         # Initialize
         await account_manager.initialize()
         assert mock_alpaca_client.get_account.call_count == 1
         
-        # Wait for cache to expire
-        import asyncio
-        await asyncio.sleep(1.1)
+        # Advance past the TTL
+        clock["now_ns"] += 1_100_000_000
         
         # Get equity (should refresh cache)
         equity = await account_manager.get_equity()
         assert equity == 100000.0
         assert mock_alpaca_client.get_account.call_count == 2  # Cache refreshed
 
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_getters_share_one_refresh(self, mock_alpaca_client):
+        """Test that concurrent getters on a stale cache trigger a single refresh."""
+        import asyncio
+        
+        config = {"accounts": {"default": {}}}
+        account_manager = AccountManager(config, mock_alpaca_client)
+        
+        # Yield inside the refresh so the other getters observe it in flight
+        original_update_state = account_manager.update_state
+        
+        async def slow_update_state():
+            await asyncio.sleep(0)
+            await original_update_state()
+        
+        account_manager.update_state = slow_update_state
+        
+        equity, cash, buying_power, positions = await asyncio.gather(
+            account_manager.get_equity(),
+            account_manager.get_cash(),
+            account_manager.get_buying_power(),
+            account_manager.get_positions()
+        )
+        
+        assert equity == 100000.0
+        assert cash == 50000.0
+        assert buying_power == 200000.0
+        assert positions == []
+        assert mock_alpaca_client.get_account.call_count == 1
+
 
 class TestAccountManagerEquityAndCash:
     """Test equity and cash retrieval methods."""
     
     @pytest.mark.asyncio
-    async def test_get_equity_returns_correct_value(self):
+    async def test_get_equity_returns_correct_value(self, mock_alpaca_client):
         """Test get_equity returns correct equity value."""
-        mock_alpaca_client = Mock()
-        mock_alpaca_client.get_account.return_value = {
-            "account_id": "test",
-            "equity": 123456.78,
-            "cash": 50000.0,
-            "buying_power": 200000.0,
-            "portfolio_value": 123456.78,
-            "pattern_day_trader": False,
-            "trading_blocked": False,
-            "account_blocked": False,
-            "currency": "USD"
-        }
-        mock_alpaca_client.get_positions.return_value = []
+        mock_alpaca_client.get_account.return_value.update({"equity": 123456.78, "portfolio_value": 123456.78})
         
         config = {"accounts": {"default": {}}}
         account_manager = AccountManager(config, mock_alpaca_client)
@@ -178,21 +196,9 @@ class TestAccountManagerEquityAndCash:
         assert equity == 123456.78
     
     @pytest.mark.asyncio
-    async def test_get_cash_returns_correct_value(self):
+    async def test_get_cash_returns_correct_value(self, mock_alpaca_client):
         """Test get_cash returns correct cash value."""
-        mock_alpaca_client = Mock()
-        mock_alpaca_client.get_account.return_value = {
-            "account_id": "test",
-            "equity": 100000.0,
-            "cash": 67890.12,
-            "buying_power": 200000.0,
-            "portfolio_value": 100000.0,
-            "pattern_day_trader": False,
-            "trading_blocked": False,
-            "account_blocked": False,
-            "currency": "USD"
-        }
-        mock_alpaca_client.get_positions.return_value = []
+        mock_alpaca_client.get_account.return_value.update({"cash": 67890.12})
         
         config = {"accounts": {"default": {}}}
         account_manager = AccountManager(config, mock_alpaca_client)
@@ -202,21 +208,9 @@ class TestAccountManagerEquityAndCash:
         assert cash == 67890.12
     
     @pytest.mark.asyncio
-    async def test_get_buying_power_returns_correct_value(self):
+    async def test_get_buying_power_returns_correct_value(self, mock_alpaca_client):
         """Test get_buying_power returns correct buying power."""
-        mock_alpaca_client = Mock()
-        mock_alpaca_client.get_account.return_value = {
-            "account_id": "test",
-            "equity": 100000.0,
-            "cash": 50000.0,
-            "buying_power": 250000.0,
-            "portfolio_value": 100000.0,
-            "pattern_day_trader": False,
-            "trading_blocked": False,
-            "account_blocked": False,
-            "currency": "USD"
-        }
-        mock_alpaca_client.get_positions.return_value = []
+        mock_alpaca_client.get_account.return_value.update({"buying_power": 250000.0})
         
         config = {"accounts": {"default": {}}}
         account_manager = AccountManager(config, mock_alpaca_client)
@@ -225,6 +219,36 @@ class TestAccountManagerEquityAndCash:
         buying_power = await account_manager.get_buying_power()
         assert buying_power == 250000.0
     
+    @pytest.mark.asyncio
+    async def test_get_daily_pnl_uses_last_equity(self, mock_alpaca_client):
+        """Test get_daily_pnl returns equity change since the previous close."""
+        mock_alpaca_client.get_account.return_value.update(
+            {"equity": 101500.0, "last_equity": 100000.0, "portfolio_value": 101500.0}
+        )
+        
+        config = {"accounts": {"default": {}}}
+        account_manager = AccountManager(config, mock_alpaca_client)
+        await account_manager.initialize()
+        
+        daily_pnl = await account_manager.get_daily_pnl()
+        assert daily_pnl == 1500.0
+    
+    @pytest.mark.asyncio
+    async def test_cached_properties_read_without_refresh(self, mock_alpaca_client):
+        """Test sync properties return the last snapshot without calling Alpaca."""
+        mock_alpaca_client.get_account.return_value.update({"equity": 101500.0, "last_equity": 100000.0})
+        
+        account_manager = AccountManager({"accounts": {"default": {}}}, mock_alpaca_client)
+        assert account_manager.equity == 0.0
+        
+        await account_manager.initialize()
+        await account_manager.initialize()  # idempotent
+        
+        assert account_manager.equity == 101500.0
+        assert account_manager.cash == 50000.0
+        assert account_manager.daily_pnl == 1500.0
+        mock_alpaca_client.get_account.assert_called_once()
+    
     @pytest.mark.asyncio
     async def test_get_equity_with_no_cache_returns_zero(self):
         """Test get_equity returns 0 when cache is empty."""
@@ -244,20 +268,8 @@ class TestAccountManagerPositions:
     """Test position retrieval methods."""
     
     @pytest.mark.asyncio
-    async def test_get_positions_returns_all_positions(self):
+    async def test_get_positions_returns_all_positions(self, mock_alpaca_client):
         """Test get_positions returns all open positions."""
-        mock_alpaca_client = Mock()
-        mock_alpaca_client.get_account.return_value = {
-            "account_id": "test",
-            "equity": 100000.0,
-            "cash": 50000.0,
-            "buying_power": 200000.0,
-            "portfolio_value": 100000.0,
-            "pattern_day_trader": False,
-            "trading_blocked": False,
-            "account_blocked": False,
-            "currency": "USD"
-        }
         mock_alpaca_client.get_positions.return_value = [
             {
                 "symbol": "AAPL",
@@ -297,20 +309,8 @@ class TestAccountManagerPositions:
         assert positions[1]["qty"] == 50
     
     @pytest.mark.asyncio
-    async def test_get_position_returns_specific_position(self):
+    async def test_get_position_returns_specific_position(self, mock_alpaca_client):
         """Test get_position returns specific position by symbol."""
-        mock_alpaca_client = Mock()
-        mock_alpaca_client.get_account.return_value = {
-            "account_id": "test",
-            "equity": 100000.0,
-            "cash": 50000.0,
-            "buying_power": 200000.0,
-            "portfolio_value": 100000.0,
-            "pattern_day_trader": False,
-            "trading_blocked": False,
-            "account_blocked": False,
-            "currency": "USD"
-        }
         mock_alpaca_client.get_positions.return_value = [
             {
                 "symbol": "AAPL",
@@ -349,20 +349,8 @@ class TestAccountManagerPositions:
         assert position["current_price"] == 150.0
     
     @pytest.mark.asyncio
-    async def test_get_position_returns_none_for_nonexistent_symbol(self):
+    async def test_get_position_returns_none_for_nonexistent_symbol(self, mock_alpaca_client):
         """Test get_position returns None for symbol not in positions."""
-        mock_alpaca_client = Mock()
-        mock_alpaca_client.get_account.return_value = {
-            "account_id": "test",
-            "equity": 100000.0,
-            "cash": 50000.0,
-            "buying_power": 200000.0,
-            "portfolio_value": 100000.0,
-            "pattern_day_trader": False,
-            "trading_blocked": False,
-            "account_blocked": False,
-            "currency": "USD"
-        }
         mock_alpaca_client.get_positions.return_value = [
             {
                 "symbol": "AAPL",
@@ -385,28 +373,10 @@ class TestAccountManagerPositions:
         position = await account_manager.get_position("MSFT")
         assert position is None
     
-    @pytest.mark.asyncio
-    async def test_get_positions_returns_empty_list_when_no_positions(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_get_positions_returns_empty_list_when_no_positions(self, initialized_account_manager):
         """Test get_positions returns empty list when no positions exist."""
-        mock_alpaca_client = Mock()
-        mock_alpaca_client.get_account.return_value = {
-            "account_id": "test",
-            "equity": 100000.0,
-            "cash": 100000.0,
-            "buying_power": 200000.0,
-            "portfolio_value": 100000.0,
-            "pattern_day_trader": False,
-            "trading_blocked": False,
-            "account_blocked": False,
-            "currency": "USD"
-        }
-        mock_alpaca_client.get_positions.return_value = []
-        
-        config = {"accounts": {"default": {}}}
-        account_manager = AccountManager(config, mock_alpaca_client)
-        await account_manager.initialize()
-        
-        positions = await account_manager.get_positions()
+        positions = await initialized_account_manager.get_positions()
         assert len(positions) == 0
         assert positions == []
 
@@ -415,40 +385,20 @@ class TestAccountManagerStateUpdate:
     """Test account state update functionality."""
     
     @pytest.mark.asyncio
-    async def test_update_state_refreshes_account_data(self):
+    async def test_update_state_refreshes_account_data(self, mock_alpaca_client, account_payload):
         """Test update_state refreshes account and position data."""
-        mock_alpaca_client = Mock()
-        
-        # Initial data
-        mock_alpaca_client.get_account.return_value = {
-            "account_id": "test",
-            "equity": 100000.0,
-            "cash": 50000.0,
-            "buying_power": 200000.0,
-            "portfolio_value": 100000.0,
-            "pattern_day_trader": False,
-            "trading_blocked": False,
-            "account_blocked": False,
-            "currency": "USD"
-        }
-        mock_alpaca_client.get_positions.return_value = []
-        
         config = {"accounts": {"default": {}}}
         account_manager = AccountManager(config, mock_alpaca_client)
         await account_manager.initialize()
         
         # Change mock data
-        mock_alpaca_client.get_account.return_value = {
-            "account_id": "test",
-            "equity": 110000.0,
-            "cash": 55000.0,
-            "buying_power": 220000.0,
-            "portfolio_value": 110000.0,
-            "pattern_day_trader": False,
-            "trading_blocked": False,
-            "account_blocked": False,
-            "currency": "USD"
-        }
+        mock_alpaca_client.get_account.return_value = dict(
+            account_payload,
+            equity=110000.0,
+            cash=55000.0,
+            buying_power=220000.0,
+            portfolio_value=110000.0,
+        )
         
         # Update state
         await account_manager.update_state()
@@ -460,22 +410,20 @@ class TestAccountManagerStateUpdate:
         assert account_manager.accounts["default"].cash == 55000.0
     
     @pytest.mark.asyncio
-    async def test_update_state_handles_errors_gracefully(self):
-        """Test update_state doesn't crash on API errors."""
-        mock_alpaca_client = Mock()
-        mock_alpaca_client.get_account.return_value = {
-            "account_id": "test",
-            "equity": 100000.0,
-            "cash": 50000.0,
-            "buying_power": 200000.0,
-            "portfolio_value": 100000.0,
-            "pattern_day_trader": False,
-            "trading_blocked": False,
-            "account_blocked": False,
-            "currency": "USD"
-        }
-        mock_alpaca_client.get_positions.return_value = []
+    async def test_update_state_notifies_equity_listeners(self, mock_alpaca_client):
+        """Test update_state passes the refreshed equity to registered listeners."""
+        config = {"accounts": {"default": {}}}
+        account_manager = AccountManager(config, mock_alpaca_client)
+        listener = Mock()
+        account_manager.add_equity_listener(listener)
+        
+        await account_manager.update_state()
         
+        listener.assert_called_once_with(100000.0)
+    
+    @pytest.mark.asyncio
+    async def test_update_state_handles_errors_gracefully(self, mock_alpaca_client):
+        """Test update_state doesn't crash on API errors."""
         config = {"accounts": {"default": {}}}
         account_manager = AccountManager(config, mock_alpaca_client)
         await account_manager.initialize()
@@ -493,22 +441,20 @@ class TestAccountManagerStateUpdate:
 class TestAccountManagerGetPrimaryAccount:
     """Test get_primary_account method."""
     
+    def test_account_is_immutable_snapshot(self):
+        """Test Account instances are frozen and carry no per-instance dict."""
+        import dataclasses
+        
+        account = Account(account_id="test", name="Test", account_type="main", equity=1000.0)
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            account.equity = 2000.0
+        assert not hasattr(account, "__dict__")
+    
     @pytest.mark.asyncio
-    async def test_get_primary_account_returns_default_account(self):
+    async def test_get_primary_account_returns_default_account(self, mock_alpaca_client):
         """Test get_primary_account returns the default account."""
-        mock_alpaca_client = Mock()
-        mock_alpaca_client.get_account.return_value = {
-            "account_id": "test_123",
-            "equity": 100000.0,
-            "cash": 50000.0,
-            "buying_power": 200000.0,
-            "portfolio_value": 100000.0,
-            "pattern_day_trader": False,
-            "trading_blocked": False,
-            "account_blocked": False,
-            "currency": "USD"
-        }
-        mock_alpaca_client.get_positions.return_value = []
+        mock_alpaca_client.get_account.return_value.update({"account_id": "test_123"})
         
         config = {
             "accounts": {
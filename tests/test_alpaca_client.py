@@ -106,6 +106,43 @@ class TestAlpacaClientInitialization:
         assert client.mode == "paper"
         assert client.is_paper is True
 
+    @patch('services.connectors.alpaca_client.TradingClient')
+    @patch('services.connectors.alpaca_client.StockHistoricalDataClient')
+    @patch('services.connectors.alpaca_client.CryptoHistoricalDataClient')
+    def test_initialization_warms_up_request_models(self, mock_crypto, mock_stock, mock_trading):
+        """Test that order request models are warmed up during initialization."""
+        os.environ["ALPACA_PAPER_API_KEY"] = "test_key"
+        os.environ["ALPACA_PAPER_API_SECRET"] = "test_secret"
+
+        with patch.object(AlpacaClient, "warmup") as mock_warmup:
+            AlpacaClient({})
+
+        mock_warmup.assert_called_once()
+
+        # Warmup itself must never raise
+        AlpacaClient.warmup()
+
+    @patch('services.connectors.alpaca_client.TradingClient')
+    @patch('services.connectors.alpaca_client.StockHistoricalDataClient')
+    @patch('services.connectors.alpaca_client.CryptoHistoricalDataClient')
+    def test_initialization_shares_keepalive_session(self, mock_crypto, mock_stock, mock_trading):
+        """Test that all REST clients share one session with a larger keep-alive pool."""
+        from services.connectors.alpaca_client import KeepAliveHTTPAdapter
+
+        os.environ["ALPACA_PAPER_API_KEY"] = "test_key"
+        os.environ["ALPACA_PAPER_API_SECRET"] = "test_secret"
+
+        client = AlpacaClient({"execution": {"http_pool_size": 32}})
+
+        assert mock_trading.return_value._session is client.http_session
+        assert mock_stock.return_value._session is client.http_session
+        assert mock_crypto.return_value._session is client.http_session
+
+        adapter = client.http_session.get_adapter("https://paper-api.alpaca.markets")
+        assert isinstance(adapter, KeepAliveHTTPAdapter)
+        assert adapter._pool_maxsize == 32
+        assert adapter.max_retries.total == 0  # retries stay with the SDK and RetryStrategy
+
 
 class TestAlpacaClientAccountData:
     """Test AlpacaClient account data retrieval methods."""
@@ -125,6 +162,7 @@ class TestAlpacaClientAccountData:
         mock_account = Mock()
         mock_account.id = "test_account_123"
         mock_account.equity = "100000.50"
+        mock_account.last_equity = "99500.00"
         mock_account.cash = "50000.25"
         mock_account.buying_power = "200000.00"
         mock_account.portfolio_value = "100000.50"
@@ -141,6 +179,7 @@ class TestAlpacaClientAccountData:
         
         assert account_data["account_id"] == "test_account_123"
         assert account_data["equity"] == 100000.50
+        assert account_data["last_equity"] == 99500.00
         assert account_data["cash"] == 50000.25
         assert account_data["buying_power"] == 200000.00
         assert account_data["portfolio_value"] == 100000.50
@@ -483,6 +522,41 @@ class TestAlpacaClientMarketData:
         
         assert result is None
     
+    @patch('services.connectors.alpaca_client.TradingClient')
+    @patch('services.connectors.alpaca_client.StockHistoricalDataClient')
+    @patch('services.connectors.alpaca_client.CryptoHistoricalDataClient')
+    def test_get_latest_trades_batches_by_asset_class(self, mock_crypto, mock_stock, mock_trading):
+        """Test batched latest trades issue one request per asset class."""
+        from datetime import datetime
+        
+        def make_trade(price, size):
+            trade = Mock()
+            trade.price = price
+            trade.size = size
+            trade.timestamp = datetime.now()
+            return trade
+        
+        mock_stock_instance = mock_stock.return_value
+        mock_stock_instance.get_stock_latest_trade.return_value = {
+            "AAPL": make_trade(150.50, 100),
+            "MSFT": make_trade(400.25, 50),
+        }
+        mock_crypto_instance = mock_crypto.return_value
+        mock_crypto_instance.get_crypto_latest_trade.return_value = {
+            "BTC/USD": make_trade(50000.50, 0.5),
+        }
+        
+        client = AlpacaClient({})
+        result = client.get_latest_trades(["AAPL", "BTC/USD", "MSFT"])
+        
+        assert mock_stock_instance.get_stock_latest_trade.call_count == 1
+        assert mock_crypto_instance.get_crypto_latest_trade.call_count == 1
+        stock_request = mock_stock_instance.get_stock_latest_trade.call_args[0][0]
+        assert stock_request.symbol_or_symbols == ["AAPL", "MSFT"]
+        assert result["AAPL"]["price"] == 150.50
+        assert result["MSFT"]["size"] == 50
+        assert result["BTC/USD"]["price"] == 50000.50
+    
     @patch('services.connectors.alpaca_client.TradingClient')
     @patch('services.connectors.alpaca_client.StockHistoricalDataClient')
     @patch('services.connectors.alpaca_client.CryptoHistoricalDataClient')
@@ -546,25 +620,16 @@ class TestAlpacaClientMarketData:
     @patch('services.connectors.alpaca_client.CryptoHistoricalDataClient')
     def test_get_previous_close_success(self, mock_crypto, mock_stock, mock_trading):
         """Test successful previous close retrieval."""
-        import pandas as pd
-        
-        # Create mock bar data with 2 days
-        mock_bars_data = {
-            'open': [100.0, 101.0],
-            'high': [101.0, 102.0],
-            'low': [99.0, 100.0],
-            'close': [100.5, 101.5],
-            'volume': [1000, 1100],
-            'trade_count': [50, 55],
-            'vwap': [100.25, 101.25]
-        }
-        mock_df = pd.DataFrame(mock_bars_data)
+        # Create mock bars for 2 days
+        mock_bar_1 = Mock()
+        mock_bar_1.close = 100.5
+        mock_bar_2 = Mock()
+        mock_bar_2.close = 101.5
         
         # Create mock bars response
         mock_bars = Mock()
-        mock_bars.df = mock_df
         mock_bars.__contains__ = lambda self, key: key == "AAPL"
-        mock_bars.__getitem__ = lambda self, key: mock_df if key == "AAPL" else None
+        mock_bars.__getitem__ = lambda self, key: [mock_bar_1, mock_bar_2] if key == "AAPL" else None
         
         mock_stock_instance = mock_stock.return_value
         mock_stock_instance.get_stock_bars.return_value = mock_bars
@@ -580,25 +645,14 @@ class TestAlpacaClientMarketData:
     @patch('services.connectors.alpaca_client.CryptoHistoricalDataClient')
     def test_get_previous_close_single_bar(self, mock_crypto, mock_stock, mock_trading):
         """Test previous close with only one bar available."""
-        import pandas as pd
-        
-        # Create mock bar data with 1 day
-        mock_bars_data = {
-            'open': [100.0],
-            'high': [101.0],
-            'low': [99.0],
-            'close': [100.5],
-            'volume': [1000],
-            'trade_count': [50],
-            'vwap': [100.25]
-        }
-        mock_df = pd.DataFrame(mock_bars_data)
+        # Create mock bar for 1 day
+        mock_bar = Mock()
+        mock_bar.close = 100.5
         
         # Create mock bars response
         mock_bars = Mock()
-        mock_bars.df = mock_df
         mock_bars.__contains__ = lambda self, key: key == "AAPL"
-        mock_bars.__getitem__ = lambda self, key: mock_df if key == "AAPL" else None
+        mock_bars.__getitem__ = lambda self, key: [mock_bar] if key == "AAPL" else None
         
         mock_stock_instance = mock_stock.return_value
         mock_stock_instance.get_stock_bars.return_value = mock_bars
@@ -318,3 +318,14 @@ async def test_preservation_mode_callback_error_handling(health_monitor, mock_al
     
     # Verify preservation mode still triggered despite callback error
     assert health_monitor.preservation_mode_triggered is True
+
+
+@pytest.mark.asyncio
+async def test_poll_runs_check_only_when_due(health_monitor, mock_alpaca_client):
+    """Test that poll() performs a check only once the interval has elapsed."""
+    assert await health_monitor.poll(now=100.0) is True
+    assert await health_monitor.poll(now=100.5) is False
+    assert await health_monitor.poll(now=101.0) is True
+    
+    assert mock_alpaca_client.get_account.call_count == 2
+    assert health_monitor.next_check_at == 102.0
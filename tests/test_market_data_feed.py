@@ -1,7 +1,9 @@
 """Tests for MarketDataFeed with real Alpaca integration."""
+import asyncio
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 from datetime import datetime
+import numpy as np
 import pandas as pd
 
 from services.data_feeds.market_data import MarketDataFeed
@@ -120,6 +122,50 @@ async def test_get_bars_crypto_symbol(market_data_feed, mock_alpaca_client):
     mock_alpaca_client.get_bars.assert_called_once_with("BTC/USD", "1Min", 50)
 
 
+@pytest.mark.asyncio
+async def test_get_bars_coalesces_and_caches(market_data_feed, mock_alpaca_client):
+    """Test concurrent and repeated bar requests share one API call."""
+    mock_df = pd.DataFrame({
+        'open': [100.0], 'high': [102.0], 'low': [99.0], 'close': [101.0], 'volume': [1000]
+    })
+    mock_alpaca_client.get_bars.return_value = mock_df
+    
+    first, second = await asyncio.gather(
+        market_data_feed.get_bars("BTC/USD", "5Min", 50),
+        market_data_feed.get_bars("BTC/USD", "5Min", 50),
+    )
+    third = await market_data_feed.get_bars("BTC/USD", "5Min", 50)
+    
+    for result in (first, second, third):
+        assert result is not mock_df
+        pd.testing.assert_frame_equal(result, mock_df)
+    mock_alpaca_client.get_bars.assert_called_once_with("BTC/USD", "5Min", 50)
+    
+    # Callers get their own frame; adding a column leaves the cached one intact
+    first["ema"] = 0.0
+    cached = await market_data_feed.get_bars("BTC/USD", "5Min", 50)
+    assert "ema" not in cached.columns
+
+
+@pytest.mark.asyncio
+async def test_get_bars_ttl_follows_timeframe(mock_alpaca_client):
+    """Test bars expire per timeframe, with config overriding the defaults."""
+    mock_alpaca_client.get_bars.return_value = pd.DataFrame({'close': [101.0]})
+    feed = MarketDataFeed({"data": {"bars_cache_ttl": {"1Min": 1}}}, mock_alpaca_client)
+    
+    await feed.get_bars("AAPL", "1Min", 50)
+    await feed.get_bars("AAPL", "1Day", 50)
+    
+    # Age both entries by 10s: past the 1Min override, within the 1Day default
+    for key, (bars, stamp) in list(feed.bars_cache.items()):
+        feed.bars_cache[key] = (bars, stamp - 10_000_000_000)
+    
+    await feed.get_bars("AAPL", "1Min", 50)
+    await feed.get_bars("AAPL", "1Day", 50)
+    
+    assert mock_alpaca_client.get_bars.call_count == 3
+
+
 @pytest.mark.asyncio
 async def test_get_current_price_from_trade(market_data_feed, mock_alpaca_client):
     """Test current price retrieval from latest trade."""
@@ -235,39 +281,62 @@ async def test_get_current_price_crypto(market_data_feed, mock_alpaca_client):
     mock_alpaca_client.get_latest_trade.assert_called_once_with("BTC/USD")
 
 
+@pytest.mark.asyncio
+async def test_get_current_prices_batched(market_data_feed, mock_alpaca_client):
+    """Test batched price retrieval uses one request and fills the cache."""
+    mock_alpaca_client.get_latest_trades.return_value = {
+        "AAPL": {"symbol": "AAPL", "price": 150.25, "size": 100, "timestamp": datetime.now()},
+        "MSFT": {"symbol": "MSFT", "price": 400.10, "size": 10, "timestamp": datetime.now()},
+    }
+    
+    result = await market_data_feed.get_current_prices(["AAPL", "MSFT"])
+    
+    assert result == {"AAPL": 150.25, "MSFT": 400.10}
+    mock_alpaca_client.get_latest_trades.assert_called_once_with(["AAPL", "MSFT"])
+    
+    # Cached prices are served without another request
+    result = await market_data_feed.get_current_price("MSFT")
+    assert result == 400.10
+    mock_alpaca_client.get_latest_trade.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_current_prices_falls_back_for_missing(market_data_feed, mock_alpaca_client):
+    """Test symbols absent from the batch fall back to the single-symbol path."""
+    mock_alpaca_client.get_latest_trades.return_value = {
+        "AAPL": {"symbol": "AAPL", "price": 150.25, "size": 100, "timestamp": datetime.now()},
+    }
+    mock_alpaca_client.get_latest_trade.return_value = None
+    mock_alpaca_client.get_latest_quote.return_value = {
+        "symbol": "MSFT",
+        "bid_price": 399.0,
+        "ask_price": 401.0,
+    }
+    
+    result = await market_data_feed.get_current_prices(["AAPL", "MSFT"])
+    
+    assert result == {"AAPL": 150.25, "MSFT": 400.0}
+
+
 @pytest.mark.asyncio
 async def test_get_previous_close_success(market_data_feed, mock_alpaca_client):
     """Test successful previous close retrieval."""
-    # Setup mock data with 2 days of bars
-    mock_df = pd.DataFrame({
-        'open': [100.0, 101.0],
-        'high': [102.0, 103.0],
-        'low': [99.0, 100.0],
-        'close': [101.0, 102.0],
-        'volume': [1000, 1100]
-    })
-    mock_alpaca_client.get_bars.return_value = mock_df
+    # Setup mock closes for 2 days
+    mock_alpaca_client.get_close_array.return_value = np.array([101.0, 102.0])
     
     # Call method
     result = await market_data_feed.get_previous_close("AAPL")
     
     # Verify - should return second-to-last close (101.0)
     assert result == 101.0
-    mock_alpaca_client.get_bars.assert_called_once_with("AAPL", "1Day", 2)
+    mock_alpaca_client.get_close_array.assert_called_once_with("AAPL", "1Day", 2)
 
 
 @pytest.mark.asyncio
 async def test_get_previous_close_insufficient_data(market_data_feed, mock_alpaca_client):
     """Test previous close retrieval with insufficient data."""
-    # Setup mock data with only 1 bar
-    mock_df = pd.DataFrame({
-        'open': [100.0],
-        'high': [102.0],
-        'low': [99.0],
-        'close': [101.0],
-        'volume': [1000]
-    })
-    mock_alpaca_client.get_bars.return_value = mock_df
+    # Setup mock with only 1 close
+    mock_alpaca_client.get_close_array.return_value = np.array([101.0])
     
     # Call method
     result = await market_data_feed.get_previous_close("AAPL")
@@ -279,22 +348,22 @@ async def test_get_previous_close_insufficient_data(market_data_feed, mock_alpac
 @pytest.mark.asyncio
 async def test_get_previous_close_no_data(market_data_feed, mock_alpaca_client):
     """Test previous close retrieval when no data is available."""
-    # Setup mock to return None
-    mock_alpaca_client.get_bars.return_value = None
+    # Setup mock to return an empty array
+    mock_alpaca_client.get_close_array.return_value = np.empty(0)
     
     # Call method
     result = await market_data_feed.get_previous_close("INVALID")
     
     # Verify
     assert result is None
-    mock_alpaca_client.get_bars.assert_called_once_with("INVALID", "1Day", 2)
+    mock_alpaca_client.get_close_array.assert_called_once_with("INVALID", "1Day", 2)
 
 
 @pytest.mark.asyncio
 async def test_get_previous_close_exception(market_data_feed, mock_alpaca_client):
     """Test previous close retrieval when exception occurs."""
     # Setup mock to raise exception
-    mock_alpaca_client.get_bars.side_effect = Exception("API error")
+    mock_alpaca_client.get_close_array.side_effect = Exception("API error")
     
     # Call method
     result = await market_data_feed.get_previous_close("AAPL")
@@ -306,22 +375,15 @@ async def test_get_previous_close_exception(market_data_feed, mock_alpaca_client
 @pytest.mark.asyncio
 async def test_get_previous_close_crypto(market_data_feed, mock_alpaca_client):
     """Test previous close retrieval for crypto symbol."""
-    # Setup mock data with 2 days of bars
-    mock_df = pd.DataFrame({
-        'open': [50000.0, 50100.0],
-        'high': [50200.0, 50300.0],
-        'low': [49900.0, 50000.0],
-        'close': [50100.0, 50200.0],
-        'volume': [10.5, 11.2]
-    })
-    mock_alpaca_client.get_bars.return_value = mock_df
+    # Setup mock closes for 2 days
+    mock_alpaca_client.get_close_array.return_value = np.array([50100.0, 50200.0])
     
     # Call method
     result = await market_data_feed.get_previous_close("BTC/USD")
     
     # Verify - should return second-to-last close (50100.0)
     assert result == 50100.0
-    mock_alpaca_client.get_bars.assert_called_once_with("BTC/USD", "1Day", 2)
+    mock_alpaca_client.get_close_array.assert_called_once_with("BTC/USD", "1Day", 2)
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,146 @@
+"""Unit tests for the Monday dividend allocation job."""
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+
+import orjson
+import pytest
+
+from services.jobs import monday_allocation
+from services.jobs.monday_allocation import MondayAllocationJob
+
+
+def _fixed_clock(moment):
+    """Stand-in for the module's datetime class whose now() returns moment."""
+    return Mock(now=Mock(return_value=moment))
+
+
+@pytest.fixture
+def config():
+    """Dividend config mirroring config/main.yaml (tiers deliberately unsorted)."""
+    return {
+        "accounts": {
+            "default": {
+                "dividend": {
+                    "suspend_until_equity": 5000,
+                    "min_diversification": 3,
+                    "allocation_tiers": [
+                        {"equity_min": 1000000, "equity_max": 999999999, "weekly_percentage": 20.0},
+                        {"equity_min": 5000, "equity_max": 24999, "weekly_percentage": 3.0},
+                        {"equity_min": 25000, "equity_max": 999999, "weekly_percentage": 10.0},
+                    ],
+                    "monday_allocation": {
+                        "enabled": True,
+                        "order_types": {
+                            "bullish": "market_on_open",
+                            "neutral": "vwap_slice",
+                            "bearish": "limit_below_open",
+                        },
+                    },
+                    "universe": ["SCHD", "VYM", "JEPI", "JEPQ"],
+                }
+            }
+        }
+    }
+
+
+@pytest.fixture
+def mock_account_manager():
+    """Mock AccountManager."""
+    manager = Mock()
+    manager.get_equity = AsyncMock(return_value=30000.0)
+    manager.get_cash = AsyncMock(return_value=10000.0)
+    manager.get_positions = AsyncMock(return_value=[])
+    return manager
+
+
+@pytest.fixture
+def mock_order_manager():
+    """Mock OrderManager with a flat SPY (neutral sentiment)."""
+    manager = Mock()
+    manager.get_current_price = AsyncMock(return_value=470.0)
+    manager.get_previous_close = AsyncMock(return_value=470.0)
+    manager.get_current_prices = AsyncMock(return_value={})
+    manager.submit_orders = AsyncMock(return_value=[])
+    return manager
+
+
+@pytest.fixture
+def job(config, mock_account_manager, mock_order_manager):
+    return MondayAllocationJob(config, mock_account_manager, mock_order_manager)
+
+
+class TestAllocationTiers:
+    """Test tier lookup boundaries."""
+
+    @pytest.mark.parametrize(
+        "equity, expected",
+        [
+            (4999.99, 0.0),  # below the first tier
+            (5000, 3.0),  # equity_min is inclusive
+            (24998.99, 3.0),
+            (24999, 0.0),  # equity_max is exclusive; gap before the next tier
+            (24999.5, 0.0),
+            (25000, 10.0),
+            (999999, 0.0),  # gap between the second and third tiers
+            (1000000, 20.0),
+            (999999999, 0.0),  # past the last tier
+        ],
+    )
+    def test_tier_boundaries(self, job, equity, expected):
+        assert job._get_allocation_percentage(equity) == expected
+
+
+class TestHoldingSelection:
+    """Test which dividend holdings receive the allocation."""
+
+    def test_current_holdings_first_in_universe_order(self, job):
+        """Held symbols come first, then new ones, each in universe order."""
+        selected = job._select_holdings({"JEPI": 5, "SCHD": 2}, 3)
+        assert selected == ["SCHD", "JEPI", "VYM"]
+
+    def test_truncates_to_target_count(self, job):
+        """More holdings than the target keeps the first ones in universe order."""
+        selected = job._select_holdings({"JEPQ": 1, "JEPI": 1, "VYM": 1}, 2)
+        assert selected == ["VYM", "JEPI"]
+
+
+class TestExecute:
+    """Test the full Monday run."""
+
+    @pytest.mark.asyncio
+    async def test_sizes_submits_and_reports(self, job, mock_order_manager, monkeypatch, tmp_path):
+        """Orders are sized per holding, skip unpriced symbols and keep results aligned."""
+        monkeypatch.setattr(monday_allocation, "datetime", _fixed_clock(datetime(2024, 1, 8, 9, 30)))
+        monkeypatch.chdir(tmp_path)
+
+        # VYM has no price; SCHD and JEPI are sized from 10% of cash over 3 holdings
+        mock_order_manager.get_current_prices.return_value = {"SCHD": 50.0, "JEPI": 100.0}
+        filled = {"symbol": "JEPI", "qty": 3, "order_type": "vwap_slice", "status": "accepted"}
+        mock_order_manager.submit_orders.return_value = [None, filled]
+
+        await job.execute()
+
+        mock_order_manager.get_current_prices.assert_awaited_once_with(["SCHD", "VYM", "JEPI"])
+        requests = mock_order_manager.submit_orders.await_args.args[0]
+        assert [(r["symbol"], r["qty"], r["order_type"]) for r in requests] == [
+            ("SCHD", 6, "vwap_slice"),
+            ("JEPI", 3, "vwap_slice"),
+        ]
+        assert all(r["side"] == "buy" and r["strategy"] == "dividend_allocation" for r in requests)
+
+        report_path = tmp_path / "reports" / "monday" / "allocation_20240108.json"
+        report = orjson.loads(report_path.read_bytes())
+        assert report["date"] == "2024-01-08T09:30:00"
+        assert report["equity"] == 30000.0
+        assert report["allocation_amount"] == pytest.approx(1000.0)
+        # Only the submitted order is reported; the rejected SCHD order is dropped
+        assert report["orders"] == [filled]
+
+    @pytest.mark.asyncio
+    async def test_skips_outside_monday(self, job, mock_account_manager, monkeypatch):
+        """The job does nothing on other weekdays."""
+        monkeypatch.setattr(monday_allocation, "datetime", _fixed_clock(datetime(2024, 1, 9, 9, 30)))
+
+        await job.execute()
+
+        mock_account_manager.get_equity.assert_not_awaited()
@@ -0,0 +1,64 @@
+"""Unit tests for the orchestrator shutdown path."""
+import asyncio
+import signal
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from services.orchestrator import run
+from services.orchestrator.run import PulseTraderOrchestrator
+
+
+def _make_orchestrator():
+    """Build an orchestrator with mocked components, skipping config loading."""
+    orchestrator = PulseTraderOrchestrator.__new__(PulseTraderOrchestrator)
+    orchestrator.config = {
+        "emergency": {"close_positions_on_shutdown": True, "shutdown_deadline_s": 5}
+    }
+    orchestrator.running = False
+    orchestrator.shutdown_event = asyncio.Event()
+    orchestrator.equity_changed = asyncio.Event()
+    orchestrator.strategies = {}
+    orchestrator._active_strategies = []
+    orchestrator._preservation_active = False
+    orchestrator._tick_max_s = 1.0
+
+    orchestrator.health_monitor = Mock()
+    orchestrator.health_monitor.next_check_at = time.monotonic() + 60
+    orchestrator.health_monitor.poll = AsyncMock()
+
+    orchestrator.account_manager = Mock()
+    orchestrator.account_manager.update_state = AsyncMock()
+    orchestrator.account_manager.get_equity = AsyncMock(return_value=100000.0)
+    orchestrator.account_manager.equity = 100000.0
+    orchestrator.account_manager.positions_cache = {}
+    orchestrator.account_manager.daily_pnl = 0.0
+
+    orchestrator.websocket_client = Mock(disconnect=AsyncMock())
+    orchestrator.order_manager = Mock(close_all_positions=AsyncMock())
+    orchestrator.market_data = Mock(disconnect=AsyncMock())
+    orchestrator.state_manager = Mock(save_state=AsyncMock(), flush=AsyncMock())
+    return orchestrator
+
+
+@pytest.mark.asyncio
+async def test_signal_runs_full_shutdown():
+    """A signal during the main loop ends with positions closed and state flushed."""
+    orchestrator = _make_orchestrator()
+
+    async def fake_start():
+        orchestrator.running = True
+        await orchestrator._run_loop()
+
+    orchestrator.start = fake_start
+    orchestrator.health_monitor.poll.side_effect = lambda: orchestrator._on_signal(signal.SIGTERM)
+
+    with patch.object(run, "PulseTraderOrchestrator", return_value=orchestrator):
+        await asyncio.wait_for(run.main(), timeout=5)
+
+    assert orchestrator.running is False
+    assert orchestrator.shutdown_event.is_set()
+    orchestrator.order_manager.close_all_positions.assert_awaited_once()
+    orchestrator.state_manager.flush.assert_awaited_once()
+    orchestrator.market_data.disconnect.assert_awaited_once()
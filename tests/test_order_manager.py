@@ -222,6 +222,49 @@ class TestOrderSubmission:
         
         assert order is None
 
+    
+    @pytest.mark.asyncio
+    async def test_submit_orders_batches_pretrade_data(self, order_manager, mock_alpaca_client,
+                                                       mock_account_manager, mock_market_data,
+                                                       mock_risk_manager):
+        """Test batch submission fetches data once and keeps results aligned."""
+        mock_market_data.get_current_prices = AsyncMock(return_value={"AAPL": 150.0, "TSLA": 200.0})
+        verdicts = iter([(True, []), (False, ["Limit"]), (True, [])])
+        seen_counts = []
+        
+        def validate_trade(**kwargs):
+            seen_counts.append(dict(kwargs["current_positions"]))
+            return next(verdicts)
+        
+        mock_risk_manager.validate_trade = Mock(side_effect=validate_trade)
+        
+        results = await order_manager.submit_orders([
+            {"symbol": "AAPL", "side": "buy", "order_type": "market", "qty": 10, "strategy": "s"},
+            {"symbol": "TSLA", "side": "buy", "order_type": "market", "qty": 5, "strategy": "s"},
+            {"symbol": "MSFT", "side": "buy", "order_type": "market", "qty": 1, "strategy": "s"},
+            {"symbol": "AAPL", "side": "sell", "order_type": "limit", "qty": 2, "strategy": "s",
+             "limit_price": 155.0},
+        ])
+        
+        assert len(results) == 4
+        assert results[0]["id"] == "order_123"
+        assert results[1] is None  # rejected by risk manager
+        assert results[2] is None  # no price data
+        assert results[3]["id"] == "order_123"
+        
+        mock_account_manager.get_equity.assert_called_once()
+        mock_account_manager.get_positions.assert_called_once()
+        mock_market_data.get_current_prices.assert_called_once_with(["AAPL", "TSLA", "MSFT"])
+        assert mock_risk_manager.validate_trade.call_count == 3
+        assert mock_alpaca_client.submit_order.call_count == 2
+        assert mock_alpaca_client.submit_order.call_args_list[1][1]["limit_price"] == 155.0
+        
+        # The accepted AAPL buy counts toward the limits of later orders in the batch
+        assert [counts["stock"] for counts in seen_counts] == [0, 1, 1]
+        
+        client_ids = [call[1]["client_order_id"] for call in mock_alpaca_client.submit_order.call_args_list]
+        assert len(set(client_ids)) == len(client_ids)
+
 
 class TestDividendOrder:
     """Test dividend order submission."""
@@ -333,6 +376,21 @@ class TestPositionManagement:
         # Verify only the losing position was closed
         mock_account_manager.get_position.assert_called_once_with("TSLA")
     
+    @pytest.mark.asyncio
+    async def test_close_losing_positions_continues_after_failure(self, order_manager,
+                                                                  mock_account_manager):
+        """Test that one failed close doesn't stop the other losing positions closing."""
+        mock_account_manager.get_positions = AsyncMock(return_value=[
+            {"symbol": "AAPL", "qty": 10, "unrealized_pl": -50.0},
+            {"symbol": "TSLA", "qty": 5, "unrealized_pl": -25.0}
+        ])
+        close_position = AsyncMock(side_effect=[Exception("API Error"), None])
+        
+        with patch.object(OrderManager, "close_position", close_position):
+            await order_manager.close_losing_positions()
+        
+        assert close_position.await_count == 2
+    
     @pytest.mark.asyncio
     async def test_close_all_positions(self, order_manager, mock_alpaca_client):
         """Test closing all positions."""
@@ -366,6 +424,20 @@ class TestHelperMethods:
         assert order_manager._get_asset_type("TSLA") == "stock"
         assert order_manager._get_asset_type("SPY") == "stock"
     
+    def test_get_asset_type_is_memoized(self, order_manager):
+        """Test that repeated symbols are classified from the cache."""
+        from services.order_router.order_manager import LEVERAGED_ETFS
+        
+        assert isinstance(LEVERAGED_ETFS, frozenset)
+        OrderManager._get_asset_type.cache_clear()
+        
+        for _ in range(3):
+            assert order_manager._get_asset_type("SOXL") == "etf"
+        
+        info = OrderManager._get_asset_type.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+    
     def test_count_positions_by_type(self, order_manager):
         """Test counting positions by asset type."""
         positions = [
@@ -381,6 +453,17 @@ class TestHelperMethods:
         assert counts["crypto"] == 1
         assert counts["etf"] == 1
     
+    def test_order_cache_evicts_least_recently_updated(self, order_manager):
+        """Test that the order cache stays bounded and evicts the oldest entry."""
+        order_manager._cache_max = 2
+        
+        order_manager._cache_order("a", {"id": "a"})
+        order_manager._cache_order("b", {"id": "b"})
+        order_manager._cache_order("a", {"id": "a", "status": "filled"})
+        order_manager._cache_order("c", {"id": "c"})
+        
+        assert list(order_manager.order_cache) == ["a", "c"]
+    
     def test_generate_client_order_id(self, order_manager):
         """Test generating unique client order IDs."""
         order_id = order_manager._generate_client_order_id("AAPL", "test_strategy")
@@ -1,5 +1,7 @@
 """Tests for PDT compliance manager."""
 
+from datetime import datetime, timedelta
+
 from services.risk_engine.pdt_compliance import PDTComplianceManager
 
 
@@ -7,3 +9,53 @@ def test_pdt_unlocked():
     manager = PDTComplianceManager({"pdt": {"enabled": True}})
     assert manager.is_pdt_unlocked(25000) is True
     assert manager.is_pdt_unlocked(1000) is False
+
+
+def test_day_trades_age_out_of_rolling_window():
+    manager = PDTComplianceManager({"pdt": {"enabled": True}})
+    now = datetime.now()
+    old = now - timedelta(days=manager.ROLLING_WINDOW_DAYS)
+    manager.record_day_trade("AAPL", old, old)
+    manager.record_day_trade("TSLA", now, now)
+
+    assert manager.get_remaining_day_trades(1000) == manager.MAX_DAY_TRADES - 1
+    assert [trade.symbol for trade in manager.day_trades] == ["TSLA"]
+
+
+def test_disabled_manager_allows_everything():
+    manager = PDTComplianceManager({"pdt": {"enabled": False}})
+    now = datetime.now()
+    manager.record_stock_entry("AAPL")
+
+    assert manager.can_day_trade(1000, "AAPL")[0] is True
+    assert manager.can_close_position_today(1000, "AAPL", now)[0] is True
+    assert manager.can_exit_stock_position(1000, "AAPL")[0] is True
+    assert manager.is_stock_trading_allowed(1000)[0] is True
+    assert manager.get_focus_assets(1000) == ["crypto", "etf", "stock"]
+
+
+def test_status_report_threshold_math():
+    manager = PDTComplianceManager({"pdt": {"enabled": True}})
+
+    report = manager.get_status_report(10000.0)
+    assert report["pdt_threshold"] == 25000.0
+    assert report["remaining_to_unlock"] == 15000.0
+
+    assert manager.get_status_report(30000.0)["remaining_to_unlock"] == 0.0
+
+
+def test_status_report_day_trade_history_fields():
+    manager = PDTComplianceManager({"pdt": {"enabled": True}})
+    entry = datetime.now().replace(hour=10, minute=0, second=0, microsecond=0)
+    exit_ = entry + timedelta(hours=2)
+    manager.record_day_trade("AAPL", entry, exit_)
+
+    history = manager.get_status_report(10000.0)["day_trades_history"]
+    assert history == [
+        {
+            "symbol": "AAPL",
+            "date": entry.date().isoformat(),
+            "entry_time": entry.isoformat(),
+            "exit_time": exit_.isoformat(),
+        }
+    ]
@@ -146,5 +146,65 @@ def test_trade_validation_comprehensive(config):
     assert any("reserve" in reason.lower() for reason in reasons)
 
 
+def test_tier_lookup_memoized_by_equity_bucket(config):
+    """Test tier lookups are cached only for buckets fully inside a tier."""
+    risk_manager = RiskManager(config)
+
+    tier = risk_manager.get_current_tier(5500.0)
+    assert tier["name"] == "tier_100_25k"
+    assert risk_manager._tier_cache[5] is tier
+
+    # Bucket [0, 1000) straddles the 100 lower bound, so it is not cached
+    assert risk_manager.get_current_tier(500.0)["name"] == "tier_100_25k"
+    assert 0 not in risk_manager._tier_cache
+
+
+def test_daily_drawdown_resets_on_new_day(config):
+    """Test the daily baseline resets once the day rolls over."""
+    risk_manager = RiskManager(config)
+    risk_manager.update_daily_drawdown(1000.0)
+    assert abs(risk_manager.update_daily_drawdown(950.0) - 5.0) < 0.01
+
+    # Simulate crossing local midnight
+    risk_manager._day_rollover_at = 0.0
+
+    assert risk_manager.update_daily_drawdown(950.0) == 0.0
+    assert risk_manager.daily_start_equity == 950.0
+
+
+def test_trade_validation_fail_fast(config):
+    """Test validation stops at the first failure unless fail_fast is off."""
+    risk_manager = RiskManager(config)
+    kwargs = dict(
+        equity=1000.0,
+        proposed_trade_value=850.0,
+        asset_type="crypto",
+        current_positions={"crypto": 3},
+    )
+
+    is_valid, reasons = risk_manager.validate_trade(**kwargs)
+    assert is_valid is False
+    assert len(reasons) == 1
+    assert "reserve" in reasons[0].lower()
+
+    is_valid, reasons = risk_manager.validate_trade(**kwargs, fail_fast=False)
+    assert is_valid is False
+    assert len(reasons) == 2
+    assert "position limit" in reasons[1].lower()
+
+
+def test_milestone_floors_kept_sorted(config):
+    """Test floors set out of order are searched in floor order."""
+    risk_manager = RiskManager(config)
+    risk_manager.set_milestone_floor(150000)
+    risk_manager.set_milestone_floor(32000)
+
+    floors = risk_manager.get_milestone_floors(100000)
+    assert [floor["milestone"] for floor in floors] == [32000]
+
+    assert risk_manager.is_approaching_milestone_floor(200000) is False
+    assert risk_manager.is_approaching_milestone_floor(143000) is True
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
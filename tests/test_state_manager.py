@@ -0,0 +1,78 @@
+"""Unit tests for StateManager write throttling and flush."""
+import asyncio
+import threading
+import time
+
+import orjson
+import pytest
+
+from services.orchestrator.state_manager import StateManager
+
+
+@pytest.mark.asyncio
+async def test_save_state_coalesces_within_interval(tmp_path):
+    """Snapshots arriving inside min_interval collapse into one write of the latest."""
+    manager = StateManager(state_path=str(tmp_path / "state.json"), min_interval=0.2)
+    writes = []
+    original_write = manager._write
+    manager._write = lambda state: (writes.append(state), original_write(state))
+
+    await manager.save_state({"tick": 1})
+    await asyncio.sleep(0.05)
+    for tick in (2, 3, 4):
+        await manager.save_state({"tick": tick})
+    await asyncio.sleep(0.05)
+
+    # First snapshot is written immediately; the rest wait out the interval
+    assert writes == [{"tick": 1}]
+
+    await asyncio.sleep(0.3)
+    assert writes == [{"tick": 1}, {"tick": 4}]
+    assert orjson.loads(manager.state_path.read_bytes()) == {"tick": 4}
+
+    await manager.flush()
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_pending_snapshot(tmp_path):
+    """flush() persists the snapshot still waiting on the throttle."""
+    manager = StateManager(state_path=str(tmp_path / "state.json"), min_interval=60)
+
+    await manager.save_state({"tick": 1})
+    await asyncio.sleep(0.05)
+    await manager.save_state({"tick": 2})
+    await manager.flush()
+
+    assert manager._writer_task is None
+    assert orjson.loads(manager.state_path.read_bytes()) == {"tick": 2}
+    assert not manager.state_path.with_suffix(".tmp").exists()
+
+
+@pytest.mark.asyncio
+async def test_flush_waits_for_inflight_write(tmp_path):
+    """A write already running in a thread finishes before flush() writes again."""
+    manager = StateManager(state_path=str(tmp_path / "state.json"), min_interval=60)
+    active = 0
+    overlapped = False
+    lock = threading.Lock()
+    original_write = manager._write
+
+    def slow_write(state):
+        nonlocal active, overlapped
+        with lock:
+            active += 1
+            overlapped = overlapped or active > 1
+        time.sleep(0.1)
+        original_write(state)
+        with lock:
+            active -= 1
+
+    manager._write = slow_write
+
+    await manager.save_state({"tick": 1})
+    await asyncio.sleep(0.02)  # first write is now inside the thread
+    await manager.save_state({"tick": 2})
+    await manager.flush()
+
+    assert not overlapped
+    assert orjson.loads(manager.state_path.read_bytes()) == {"tick": 2}
@@ -1,4 +1,216 @@
-"""Placeholder tests for strategies."""
+"""Tests for strategies."""
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from services.strategies._indicators import compute_entry_features
+from services.strategies.crypto_momentum import CryptoMomentumStrategy, CryptoPosition
+
 
 def test_placeholder():
     assert True
+
+
+def _crypto_config(**exit_overrides):
+    """Crypto momentum config mirroring config/main.yaml, with exit overrides."""
+    exit_config = {
+        "targets": [2.0, 4.0, 6.0],
+        "trailing_stop": {"enabled": True, "activation_pct": 2.0, "trailing_pct": 1.0},
+        "hard_stop_pct": -1.5,
+        "pyramid": {"enabled": False},
+    }
+    exit_config.update(exit_overrides)
+    return {
+        "assets": ["BTC/USD", "ETH/USD"],
+        "timeframes": ["5m", "15m"],
+        "entry": {"price_above_ema21": True, "price_above_vwap": True, "volume_impulse_multiplier": 1.5},
+        "exit": exit_config,
+    }
+
+
+def _signal_bars(n=50):
+    """Rising closes with a volume spike on the last bar: passes every entry check."""
+    close = np.linspace(100.0, 110.0, n)
+    volume = np.ones(n)
+    volume[-1] = 5.0
+    return pd.DataFrame({"close": close, "high": close + 1, "low": close - 1, "volume": volume})
+
+
+@pytest.fixture
+def mock_order_manager():
+    """Mock OrderManager whose calls yield to the event loop."""
+    manager = Mock()
+
+    async def get_account_equity():
+        await asyncio.sleep(0)
+        return 100000.0
+
+    async def submit_order(**kwargs):
+        await asyncio.sleep(0.01)
+        return {"id": f"order_{kwargs['symbol']}", "submitted_at": datetime.now()}
+
+    manager.get_account_equity = AsyncMock(side_effect=get_account_equity)
+    manager.submit_order = AsyncMock(side_effect=submit_order)
+    return manager
+
+
+@pytest.fixture
+def mock_risk_manager():
+    """Mock RiskManager allowing a single open crypto position."""
+    manager = Mock()
+    manager.calculate_position_size = Mock(return_value={"position_value": 1000.0, "shares": 10})
+    manager.validate_trade = Mock(
+        side_effect=lambda **kwargs: (kwargs["current_positions"]["crypto"] < 1, ["Max crypto positions"])
+    )
+    return manager
+
+
+@pytest.fixture
+def mock_market_data():
+    """Mock MarketDataFeed."""
+    feed = Mock()
+    feed.get_bars = AsyncMock(return_value=_signal_bars())
+    feed.get_current_price = AsyncMock(return_value=100.0)
+    return feed
+
+
+def _make_strategy(config, risk_manager, order_manager, market_data):
+    strategy = CryptoMomentumStrategy(config, risk_manager, order_manager, market_data)
+    strategy.is_running = True
+    return strategy
+
+
+def _open_position(strategy, asset="BTC/USD", **overrides):
+    fields = {
+        "entry_price": 100.0,
+        "entry_time": datetime.now(),
+        "qty": 10,
+        "stop_loss": 98.5,
+        "targets": strategy._targets,
+        "order_id": "order_1",
+    }
+    fields.update(overrides)
+    strategy.positions[asset] = CryptoPosition(**fields)
+    return strategy.positions[asset]
+
+
+class TestCryptoEntryFeatures:
+    """Test the entry feature kernel against the pandas reference."""
+
+    def test_matches_pandas_reference(self):
+        """EMA21, anchored VWAP and volume impulse match their pandas definitions."""
+        rng = np.random.default_rng(7)
+        close = pd.Series(100 + rng.normal(0, 1, 50).cumsum())
+        high = close + rng.uniform(0, 1, 50)
+        low = close - rng.uniform(0, 1, 50)
+        volume = pd.Series(rng.uniform(1000, 5000, 50))
+
+        ema21, vwap, impulse = compute_entry_features(
+            close.to_numpy(), high.to_numpy(), low.to_numpy(), volume.to_numpy()
+        )
+
+        typical_price = (high + low + close) / 3
+        assert ema21 == pytest.approx(close.ewm(span=21).mean().iloc[-1])
+        assert vwap == pytest.approx(((typical_price * volume).cumsum() / volume.cumsum()).iloc[-1])
+        assert impulse == pytest.approx(volume.iloc[-1] / volume.rolling(20).mean().iloc[-1])
+
+
+class TestCryptoEntry:
+    """Test concurrent entry handling."""
+
+    @pytest.mark.asyncio
+    async def test_simultaneous_signals_respect_position_limit(self, mock_risk_manager,
+                                                               mock_order_manager, mock_market_data):
+        """Two assets signalling in one evaluation open only as many positions as allowed."""
+        strategy = _make_strategy(_crypto_config(), mock_risk_manager, mock_order_manager, mock_market_data)
+
+        await strategy.evaluate()
+
+        assert list(strategy.positions) == ["BTC/USD"]
+        mock_order_manager.submit_order.assert_awaited_once()
+        seen_counts = [
+            call.kwargs["current_positions"]["crypto"]
+            for call in mock_risk_manager.validate_trade.call_args_list
+        ]
+        assert seen_counts == [0, 1]
+
+
+class TestCryptoPositionManagement:
+    """Test exits, trailing stops and pyramiding on open positions."""
+
+    @pytest.mark.asyncio
+    async def test_exit_priority(self, mock_risk_manager, mock_order_manager, mock_market_data):
+        """Hard stop wins over trailing stop, which wins over the profit target."""
+        strategy = _make_strategy(_crypto_config(), mock_risk_manager, mock_order_manager, mock_market_data)
+        strategy._exit_position = AsyncMock()
+        mock_market_data.get_current_price.return_value = 105.0
+
+        # Price is below the hard stop, below the trailing stop, and past the target
+        _open_position(strategy, stop_loss=110.0, trailing_stop_active=True, trailing_stop_price=108.0)
+        await strategy._manage_position("BTC/USD")
+        assert strategy._exit_position.await_args.args[2].startswith("Hard stop")
+
+        _open_position(strategy, stop_loss=98.5, trailing_stop_active=True, trailing_stop_price=108.0)
+        await strategy._manage_position("BTC/USD")
+        assert strategy._exit_position.await_args.args[2].startswith("Trailing stop")
+
+        _open_position(strategy, stop_loss=98.5)
+        await strategy._manage_position("BTC/USD")
+        assert strategy._exit_position.await_args.args[2].startswith("Target hit")
+
+    @pytest.mark.asyncio
+    async def test_trailing_stop_activates_and_ratchets(self, mock_risk_manager, mock_order_manager,
+                                                        mock_market_data):
+        """The trailing stop activates at the profit threshold and only moves up."""
+        config = _crypto_config(targets=[10.0])
+        strategy = _make_strategy(config, mock_risk_manager, mock_order_manager, mock_market_data)
+        position = _open_position(strategy)
+
+        mock_market_data.get_current_price.return_value = 101.0
+        await strategy._manage_position("BTC/USD")
+        assert position.trailing_stop_active is False
+
+        mock_market_data.get_current_price.return_value = 103.0
+        await strategy._manage_position("BTC/USD")
+        assert position.trailing_stop_active is True
+        assert position.trailing_stop_price == pytest.approx(103.0 * 0.99)
+
+        mock_market_data.get_current_price.return_value = 105.0
+        await strategy._manage_position("BTC/USD")
+        assert position.trailing_stop_price == pytest.approx(105.0 * 0.99)
+
+        # A pullback above the stop leaves it where it was
+        mock_market_data.get_current_price.return_value = 104.5
+        await strategy._manage_position("BTC/USD")
+        assert position.trailing_stop_price == pytest.approx(105.0 * 0.99)
+        assert "BTC/USD" in strategy.positions
+        mock_order_manager.submit_order.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_pyramid_moves_stop_to_breakeven(self, mock_risk_manager, mock_order_manager,
+                                                   mock_market_data):
+        """Adding to a winner averages the entry and moves the stop to it."""
+        config = _crypto_config(
+            targets=[10.0],
+            trailing_stop={"enabled": False},
+            pyramid={"enabled": True, "add_after_profit_pct": 2.0, "additional_size_pct": 50.0},
+        )
+        strategy = _make_strategy(config, mock_risk_manager, mock_order_manager, mock_market_data)
+        position = _open_position(strategy)
+        mock_market_data.get_current_price.return_value = 103.0
+
+        await strategy._manage_position("BTC/USD")
+
+        assert mock_order_manager.submit_order.await_args.kwargs["qty"] == 5
+        assert position.pyramid_added is True
+        assert position.qty == 15
+        assert position.entry_price == pytest.approx((100.0 * 10 + 103.0 * 5) / 15)
+        assert position.stop_loss == pytest.approx(position.entry_price)
+
+        # A second qualifying tick does not add again
+        await strategy._manage_position("BTC/USD")
+        mock_order_manager.submit_order.assert_awaited_once()
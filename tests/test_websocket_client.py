@@ -1,8 +1,9 @@
 """Unit tests for WebSocketClient."""
+import asyncio
 import os
 import pytest
 from unittest.mock import Mock, patch, MagicMock, AsyncMock
-from services.connectors.websocket_client import WebSocketClient
+from services.connectors.websocket_client import QuoteTick, TradeTick, WebSocketClient
 
 
 class TestWebSocketClientInitialization:
@@ -58,11 +59,8 @@ class TestWebSocketClientInitialization:
         
         assert client.api_key == "test_key"
         assert client.api_secret == "test_secret"
-        assert "trade" in client.callbacks
-        assert "quote" in client.callbacks
-        assert "bar" in client.callbacks
-        assert len(client.callbacks["trade"]) == 0
-        assert len(client.callbacks["quote"]) == 0
+        assert client._trade_cbs == []
+        assert client._quote_cbs == []
         
         # Verify streams were initialized
         mock_stock_stream.assert_called_once_with("test_key", "test_secret")
@@ -94,19 +92,23 @@ class TestWebSocketClientConnection:
         os.environ["ALPACA_PAPER_API_KEY"] = "test_key"
         os.environ["ALPACA_PAPER_API_SECRET"] = "test_secret"
         
-        # Setup mock streams with async close methods
+        # Setup mock streams with async stop/close methods
         mock_stock_instance = MagicMock()
+        mock_stock_instance.stop_ws = AsyncMock()
         mock_stock_instance.close = AsyncMock()
         mock_stock_stream.return_value = mock_stock_instance
         
         mock_crypto_instance = MagicMock()
+        mock_crypto_instance.stop_ws = AsyncMock()
         mock_crypto_instance.close = AsyncMock()
         mock_crypto_stream.return_value = mock_crypto_instance
         
         client = WebSocketClient({})
         await client.disconnect()
         
-        # Verify both streams were closed
+        # Verify both streams were told to stop (no reconnect) and closed
+        mock_stock_instance.stop_ws.assert_awaited_once()
+        mock_crypto_instance.stop_ws.assert_awaited_once()
         mock_stock_instance.close.assert_called_once()
         mock_crypto_instance.close.assert_called_once()
 
@@ -130,7 +132,7 @@ class TestWebSocketClientSubscriptions:
         client.subscribe_trades(["AAPL", "TSLA"], callback)
         
         # Verify callback was registered
-        assert callback in client.callbacks["trade"]
+        assert callback in client._trade_cbs
         
         # Verify stock stream subscription was called
         mock_stock_instance.subscribe_trades.assert_called_once()
@@ -154,7 +156,7 @@ class TestWebSocketClientSubscriptions:
         client.subscribe_trades(["BTC/USD", "ETH/USD"], callback)
         
         # Verify callback was registered
-        assert callback in client.callbacks["trade"]
+        assert callback in client._trade_cbs
         
         # Verify crypto stream subscription was called
         mock_crypto_instance.subscribe_trades.assert_called_once()
@@ -181,7 +183,7 @@ class TestWebSocketClientSubscriptions:
         client.subscribe_trades(["AAPL", "BTC/USD", "TSLA"], callback)
         
         # Verify callback was registered
-        assert callback in client.callbacks["trade"]
+        assert callback in client._trade_cbs
         
         # Verify both streams were subscribed
         mock_stock_instance.subscribe_trades.assert_called_once()
@@ -213,7 +215,7 @@ class TestWebSocketClientSubscriptions:
         client.subscribe_quotes(["AAPL", "TSLA"], callback)
         
         # Verify callback was registered
-        assert callback in client.callbacks["quote"]
+        assert callback in client._quote_cbs
         
         # Verify stock stream subscription was called
         mock_stock_instance.subscribe_quotes.assert_called_once()
@@ -237,7 +239,7 @@ class TestWebSocketClientSubscriptions:
         client.subscribe_quotes(["BTC/USD", "ETH/USD"], callback)
         
         # Verify callback was registered
-        assert callback in client.callbacks["quote"]
+        assert callback in client._quote_cbs
         
         # Verify crypto stream subscription was called
         mock_crypto_instance.subscribe_quotes.assert_called_once()
@@ -246,6 +248,15 @@ class TestWebSocketClientSubscriptions:
         assert "ETH/USD" in call_args[0]
 
 
+async def _run_dispatchers(client, rounds=5):
+    """Yield to the event loop so dispatcher tasks deliver queued batches, then stop them."""
+    for _ in range(rounds):
+        await asyncio.sleep(0)
+    for task in client._dispatchers.values():
+        if task is not None:
+            task.cancel()
+
+
 class TestWebSocketClientMessageHandlers:
     """Test WebSocketClient message handlers."""
     
@@ -261,7 +272,7 @@ class TestWebSocketClientMessageHandlers:
         
         # Create mock callback
         callback = AsyncMock()
-        client.callbacks["trade"].append(callback)
+        client._trade_cbs.append(callback)
         
         # Create mock trade object
         mock_trade = Mock()
@@ -272,14 +283,19 @@ class TestWebSocketClientMessageHandlers:
         
         # Call handler
         await client._trade_handler(mock_trade)
+        await _run_dispatchers(client)
         
-        # Verify callback was invoked with correct data
+        # Verify callback was invoked with a batch containing the parsed trade
         callback.assert_called_once()
-        call_args = callback.call_args[0][0]
-        assert call_args["symbol"] == "AAPL"
-        assert call_args["price"] == 150.25
-        assert call_args["size"] == 100
-        assert call_args["timestamp"] == "2024-01-01T12:00:00Z"
+        batch = callback.call_args[0][0]
+        assert len(batch) == 1
+        call_args = batch[0]
+        assert call_args == TradeTick("AAPL", 150.25, 100, "2024-01-01T12:00:00Z")
+        assert not hasattr(call_args, "__dict__")
+        assert call_args.symbol == "AAPL"
+        assert call_args.price == 150.25
+        assert call_args.size == 100
+        assert call_args.timestamp == "2024-01-01T12:00:00Z"
     
     @patch('services.connectors.websocket_client.StockDataStream')
     @patch('services.connectors.websocket_client.CryptoDataStream')
@@ -293,7 +309,7 @@ class TestWebSocketClientMessageHandlers:
         
         # Create mock callback
         callback = AsyncMock()
-        client.callbacks["quote"].append(callback)
+        client._quote_cbs.append(callback)
         
         # Create mock quote object
         mock_quote = Mock()
@@ -306,16 +322,20 @@ class TestWebSocketClientMessageHandlers:
         
         # Call handler
         await client._quote_handler(mock_quote)
+        await _run_dispatchers(client)
         
-        # Verify callback was invoked with correct data
+        # Verify callback was invoked with a batch containing the parsed quote
         callback.assert_called_once()
-        call_args = callback.call_args[0][0]
-        assert call_args["symbol"] == "AAPL"
-        assert call_args["bid_price"] == 150.20
-        assert call_args["ask_price"] == 150.30
-        assert call_args["bid_size"] == 100
-        assert call_args["ask_size"] == 200
-        assert call_args["timestamp"] == "2024-01-01T12:00:00Z"
+        batch = callback.call_args[0][0]
+        assert len(batch) == 1
+        call_args = batch[0]
+        assert isinstance(call_args, QuoteTick)
+        assert call_args.symbol == "AAPL"
+        assert call_args.bid_price == 150.20
+        assert call_args.ask_price == 150.30
+        assert call_args.bid_size == 100
+        assert call_args.ask_size == 200
+        assert call_args.timestamp == "2024-01-01T12:00:00Z"
     
     @patch('services.connectors.websocket_client.StockDataStream')
     @patch('services.connectors.websocket_client.CryptoDataStream')
@@ -330,8 +350,8 @@ class TestWebSocketClientMessageHandlers:
         # Create mock callbacks - one that fails, one that succeeds
         failing_callback = AsyncMock(side_effect=Exception("Callback error"))
         success_callback = AsyncMock()
-        client.callbacks["trade"].append(failing_callback)
-        client.callbacks["trade"].append(success_callback)
+        client._trade_cbs.append(failing_callback)
+        client._trade_cbs.append(success_callback)
         
         # Create mock trade object
         mock_trade = Mock()
@@ -342,6 +362,7 @@ class TestWebSocketClientMessageHandlers:
         
         # Call handler - should not raise exception
         await client._trade_handler(mock_trade)
+        await _run_dispatchers(client)
         
         # Verify both callbacks were called
         failing_callback.assert_called_once()
@@ -360,8 +381,8 @@ class TestWebSocketClientMessageHandlers:
         # Create mock callbacks - one that fails, one that succeeds
         failing_callback = AsyncMock(side_effect=Exception("Callback error"))
         success_callback = AsyncMock()
-        client.callbacks["quote"].append(failing_callback)
-        client.callbacks["quote"].append(success_callback)
+        client._quote_cbs.append(failing_callback)
+        client._quote_cbs.append(success_callback)
         
         # Create mock quote object
         mock_quote = Mock()
@@ -374,10 +395,67 @@ class TestWebSocketClientMessageHandlers:
         
         # Call handler - should not raise exception
         await client._quote_handler(mock_quote)
+        await _run_dispatchers(client)
         
         # Verify both callbacks were called
         failing_callback.assert_called_once()
         success_callback.assert_called_once()
+    
+    @patch('services.connectors.websocket_client.StockDataStream')
+    @patch('services.connectors.websocket_client.CryptoDataStream')
+    @pytest.mark.asyncio
+    async def test_trade_handler_coalesces_burst_into_one_batch(self, mock_crypto_stream, mock_stock_stream):
+        """Test that trades arriving before the dispatcher runs are delivered as one batch."""
+        os.environ["ALPACA_PAPER_API_KEY"] = "test_key"
+        os.environ["ALPACA_PAPER_API_SECRET"] = "test_secret"
+        
+        client = WebSocketClient({})
+        
+        callback = AsyncMock()
+        client._trade_cbs.append(callback)
+        
+        for price in (150.0, 150.5, 151.0):
+            mock_trade = Mock()
+            mock_trade.symbol = "AAPL"
+            mock_trade.price = price
+            mock_trade.size = 10
+            mock_trade.timestamp = "2024-01-01T12:00:00Z"
+            await client._trade_handler(mock_trade)
+        
+        await _run_dispatchers(client)
+        
+        callback.assert_called_once()
+        batch = callback.call_args[0][0]
+        assert [trade.price for trade in batch] == [150.0, 150.5, 151.0]
+
+    
+    @patch('services.connectors.websocket_client.StockDataStream')
+    @patch('services.connectors.websocket_client.CryptoDataStream')
+    @pytest.mark.asyncio
+    async def test_trade_handler_drops_when_buffer_full(self, mock_crypto_stream, mock_stock_stream):
+        """Test that trades beyond the buffer size are dropped and counted."""
+        os.environ["ALPACA_PAPER_API_KEY"] = "test_key"
+        os.environ["ALPACA_PAPER_API_SECRET"] = "test_secret"
+        
+        client = WebSocketClient({"data": {"streaming": {"buffer_size": 2}}})
+        
+        callback = AsyncMock()
+        client._trade_cbs.append(callback)
+        
+        for price in (150.0, 150.5, 151.0):
+            mock_trade = Mock()
+            mock_trade.symbol = "AAPL"
+            mock_trade.price = price
+            mock_trade.size = 10
+            mock_trade.timestamp = "2024-01-01T12:00:00Z"
+            await client._trade_handler(mock_trade)
+        
+        assert client.dropped["trade"] == 1
+        
+        await _run_dispatchers(client)
+        
+        batch = callback.call_args[0][0]
+        assert [trade.price for trade in batch] == [150.0, 150.5]
 
 
 class TestWebSocketClientRun:
@@ -385,26 +463,82 @@ class TestWebSocketClientRun:
     
     @patch('services.connectors.websocket_client.StockDataStream')
     @patch('services.connectors.websocket_client.CryptoDataStream')
-    def test_run_starts_streams(self, mock_crypto_stream, mock_stock_stream):
-        """Test that run() starts both streams."""
+    @pytest.mark.asyncio
+    async def test_run_starts_streams(self, mock_crypto_stream, mock_stock_stream):
+        """Test that run() runs both subscribed streams concurrently."""
         os.environ["ALPACA_PAPER_API_KEY"] = "test_key"
         os.environ["ALPACA_PAPER_API_SECRET"] = "test_secret"
         
         mock_stock_instance = MagicMock()
+        mock_stock_instance._run_forever = AsyncMock()
         mock_stock_stream.return_value = mock_stock_instance
         
         mock_crypto_instance = MagicMock()
+        mock_crypto_instance._run_forever = AsyncMock()
         mock_crypto_stream.return_value = mock_crypto_instance
         
         client = WebSocketClient({})
+        client.subscribe_trades(["AAPL", "BTC/USD"], AsyncMock())
+        await client.run()
+        
+        # Verify both streams were run
+        mock_stock_instance._run_forever.assert_awaited_once()
+        mock_crypto_instance._run_forever.assert_awaited_once()
+    
+    @patch('services.connectors.websocket_client.StockDataStream')
+    @patch('services.connectors.websocket_client.CryptoDataStream')
+    @pytest.mark.asyncio
+    async def test_run_skips_unsubscribed_streams(self, mock_crypto_stream, mock_stock_stream):
+        """Test that run() only starts streams that have subscriptions."""
+        os.environ["ALPACA_PAPER_API_KEY"] = "test_key"
+        os.environ["ALPACA_PAPER_API_SECRET"] = "test_secret"
         
-        # Note: run() is blocking, so we just verify it calls the right methods
-        # In a real scenario, this would be tested differently
-        try:
-            client.run()
-        except:
-            pass  # Expected to fail in test environment
+        mock_stock_instance = MagicMock()
+        mock_stock_instance._run_forever = AsyncMock()
+        mock_stock_stream.return_value = mock_stock_instance
+        
+        mock_crypto_instance = MagicMock()
+        mock_crypto_instance._run_forever = AsyncMock()
+        mock_crypto_stream.return_value = mock_crypto_instance
+        
+        client = WebSocketClient({})
+        
+        # Nothing subscribed: nothing to run
+        await client.run()
+        mock_stock_instance._run_forever.assert_not_awaited()
+        mock_crypto_instance._run_forever.assert_not_awaited()
+        
+        client.subscribe_quotes(["AAPL"], AsyncMock())
+        await client.run()
+        mock_stock_instance._run_forever.assert_awaited_once()
+        mock_crypto_instance._run_forever.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_run_returns_after_disconnect(self):
+        """Test that disconnect() ends run() instead of letting the streams reconnect."""
+        os.environ["ALPACA_PAPER_API_KEY"] = "test_key"
+        os.environ["ALPACA_PAPER_API_SECRET"] = "test_secret"
+        
+        client = WebSocketClient({})
+        stream = client.stock_stream
+        
+        async def never_receive():
+            await asyncio.Event().wait()
+        
+        async def fake_start_ws():
+            # Stand-in for the network connect/auth; the socket never delivers data
+            stream._ws = Mock(recv=never_receive, close=AsyncMock())
+        
+        stream._start_ws = fake_start_ws
+        stream._send_subscribe_msg = AsyncMock()
+        client.subscribe_trades(["AAPL"], AsyncMock())
+        
+        run_task = asyncio.create_task(client.run())
+        await asyncio.sleep(0.05)
+        assert not run_task.done()
+        assert len(client._stream_tasks) == 1
+        
+        await client.disconnect()
+        await asyncio.wait_for(run_task, timeout=2)
         
-        # Verify both streams' run methods were called
-        mock_stock_instance.run.assert_called_once()
-        mock_crypto_instance.run.assert_called_once()
+        assert stream._should_run is False
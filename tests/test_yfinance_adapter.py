@@ -0,0 +1,57 @@
+"""Tests for the yfinance history cache."""
+from unittest.mock import Mock
+
+import pandas as pd
+import pytest
+
+from services.data_feeds import yfinance_adapter
+
+
+def _download_frame(symbols):
+    """Frame shaped like yf.download(group_by="ticker") for several symbols."""
+    columns = pd.MultiIndex.from_product([symbols, ["Close", "Volume"]])
+    return pd.DataFrame([[100.0, 1000.0] * len(symbols)], columns=columns)
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Point the parquet cache at tmp_path."""
+    monkeypatch.setattr(yfinance_adapter, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(yfinance_adapter, "_pruned_day", None)
+    return tmp_path
+
+
+@pytest.fixture
+def mock_download(monkeypatch):
+    download = Mock(side_effect=lambda tickers, **kwargs: _download_frame(tickers.split()))
+    monkeypatch.setattr(yfinance_adapter.yf, "download", download)
+    return download
+
+
+def test_fetch_history_serves_cache_hits(cache_dir, mock_download):
+    """Cached symbols skip the download; only misses are fetched."""
+    first = yfinance_adapter.fetch_history(["AAPL", "MSFT"])
+    assert set(first) == {"AAPL", "MSFT"}
+    assert mock_download.call_args.args[0] == "AAPL MSFT"
+
+    # Both symbols were written as real parquet files for today
+    assert sorted(path.name.split("_")[0] for path in cache_dir.glob("*.parquet")) == ["AAPL", "MSFT"]
+
+    second = yfinance_adapter.fetch_history(["AAPL", "MSFT"])
+    assert mock_download.call_count == 1
+    pd.testing.assert_frame_equal(second["AAPL"], first["AAPL"])
+
+    yfinance_adapter.fetch_history(["AAPL", "SPY"])
+    assert mock_download.call_count == 2
+    assert mock_download.call_args.args[0] == "SPY"
+
+
+def test_fetch_history_prunes_previous_days(cache_dir, mock_download):
+    """Cache files from earlier days are removed on the first download of the day."""
+    stale = cache_dir / "AAPL_1mo_1d_2000-01-01.parquet"
+    stale.write_bytes(b"")
+
+    yfinance_adapter.fetch_history(["AAPL"])
+
+    assert not stale.exists()
+    assert [path.name.split("_")[0] for path in cache_dir.glob("*.parquet")] == ["AAPL"]